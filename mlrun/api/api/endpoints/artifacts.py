@@ -186,6 +186,8 @@ async def list_artifacts(
     iter: int = Query(None, ge=0),
     best_iteration: bool = Query(False, alias="best-iteration"),
     format_: ArtifactsFormat = Query(ArtifactsFormat.full, alias="format"),
+    page_size: int = Query(None, alias="page-size", gt=0),
+    page_token: str = Query(None, alias="page-token"),
     auth_info: mlrun.api.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -209,7 +211,12 @@ async def list_artifacts(
         iter=iter,
         best_iteration=best_iteration,
         format_=format_,
+        page_size=page_size,
+        page_token=page_token,
     )
+    next_page_token = None
+    if page_size:
+        artifacts, next_page_token = artifacts
 
     artifacts = await mlrun.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
         mlrun.api.schemas.AuthorizationResourceTypes.artifact,
@@ -217,9 +224,12 @@ async def list_artifacts(
         _artifact_project_and_resource_name_extractor,
         auth_info,
     )
-    return {
+    response = {
         "artifacts": artifacts,
     }
+    if page_size:
+        response["next_page_token"] = next_page_token
+    return response
 
 
 # TODO /artifacts should be deprecated in 1.4
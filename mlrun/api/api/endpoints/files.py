@@ -22,7 +22,12 @@ import mlrun.api.api.deps
 import mlrun.api.crud.secrets
 import mlrun.api.schemas
 import mlrun.api.utils.auth.verifier
-from mlrun.api.api.utils import get_obj_path, get_secrets, log_and_raise
+from mlrun.api.api.utils import (
+    get_obj_path,
+    get_secrets,
+    log_and_raise,
+    verify_and_get_project_secrets,
+)
 from mlrun.datastore import store_manager
 from mlrun.errors import err_to_str
 from mlrun.utils import logger
@@ -65,7 +70,7 @@ async def get_files_with_project_secrets(
 
     secrets = {}
     if use_secrets:
-        secrets = await _verify_and_get_project_secrets(project, auth_info)
+        secrets = await verify_and_get_project_secrets(project, auth_info)
 
     return await run_in_threadpool(
         _get_files, schema, objpath, user, size, offset, auth_info, secrets=secrets
@@ -103,7 +108,7 @@ async def get_filestat_with_project_secrets(
 
     secrets = {}
     if use_secrets:
-        secrets = await _verify_and_get_project_secrets(project, auth_info)
+        secrets = await verify_and_get_project_secrets(project, auth_info)
 
     return await run_in_threadpool(
         _get_filestat, schema, path, user, auth_info, secrets=secrets
@@ -193,20 +198,3 @@ def _get_filestat(
         "modified": stat.modified,
         "mimetype": ctype,
     }
-
-
-async def _verify_and_get_project_secrets(project, auth_info):
-    await mlrun.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
-        mlrun.api.schemas.AuthorizationResourceTypes.secret,
-        project,
-        mlrun.api.schemas.SecretProviderName.kubernetes,
-        mlrun.api.schemas.AuthorizationAction.read,
-        auth_info,
-    )
-    secrets_data = await run_in_threadpool(
-        mlrun.api.crud.Secrets().list_project_secrets,
-        project,
-        mlrun.api.schemas.SecretProviderName.kubernetes,
-        allow_secrets_from_k8s=True,
-    )
-    return secrets_data.secrets or {}
@@ -159,6 +159,8 @@ async def list_functions(
     name: str = None,
     tag: str = None,
     labels: List[str] = Query([], alias="label"),
+    page_size: int = Query(None, alias="page-size", gt=0),
+    page_token: str = Query(None, alias="page-token"),
     auth_info: mlrun.api.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -176,7 +178,12 @@ async def list_functions(
         name,
         tag,
         labels,
+        page_size,
+        page_token,
     )
+    next_page_token = None
+    if page_size:
+        functions, next_page_token = functions
     functions = await mlrun.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
         mlrun.api.schemas.AuthorizationResourceTypes.function,
         functions,
@@ -186,9 +193,12 @@ async def list_functions(
         ),
         auth_info,
     )
-    return {
+    response = {
         "funcs": functions,
     }
+    if page_size:
+        response["next_page_token"] = next_page_token
+    return response
 
 
 @router.post("/build/function")
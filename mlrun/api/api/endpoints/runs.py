@@ -25,7 +25,11 @@ import mlrun.api.schemas
 import mlrun.api.utils.auth.verifier
 import mlrun.api.utils.singletons.project_member
 from mlrun.api.api import deps
-from mlrun.api.api.utils import log_and_raise
+from mlrun.api.api.utils import (
+    get_secrets,
+    log_and_raise,
+    verify_and_get_project_secrets,
+)
 from mlrun.utils import logger
 from mlrun.utils.helpers import datetime_from_iso
 
@@ -72,6 +76,43 @@ async def store_run(
     return {}
 
 
+@router.post("/projects/{project}/runs")
+async def store_runs(
+    request: Request,
+    project: str,
+    auth_info: mlrun.api.schemas.AuthInfo = Depends(deps.authenticate_request),
+    db_session: Session = Depends(deps.get_db_session),
+):
+    data = None
+    try:
+        data = await request.json()
+    except ValueError:
+        log_and_raise(HTTPStatus.BAD_REQUEST.value, reason="bad JSON body")
+
+    runs = data.get("runs", [])
+    await run_in_threadpool(
+        mlrun.api.utils.singletons.project_member.get_project_member().ensure_project,
+        db_session,
+        project,
+        auth_info=auth_info,
+    )
+    await mlrun.api.utils.auth.verifier.AuthVerifier().query_project_resources_permissions(
+        mlrun.api.schemas.AuthorizationResourceTypes.run,
+        runs,
+        lambda run: (project, run.get("metadata", {}).get("uid")),
+        mlrun.api.schemas.AuthorizationAction.store,
+        auth_info,
+    )
+
+    await run_in_threadpool(
+        mlrun.api.crud.Runs().store_runs,
+        db_session,
+        runs,
+        project,
+    )
+    return {}
+
+
 @router.patch("/run/{project}/{uid}")
 async def update_run(
     request: Request,
@@ -128,6 +169,48 @@ async def get_run(
     }
 
 
+@router.get("/run/{project}/{uid}/metrics")
+async def get_run_metrics(
+    project: str,
+    uid: str,
+    iter: int = 0,
+    keys: List[str] = Query([], alias="key"),
+    start_step: int = Query(None, alias="start-step"),
+    end_step: int = Query(None, alias="end-step"),
+    max_points: int = Query(None, alias="max-points", ge=0),
+    use_secrets: bool = Query(True, alias="use-secrets"),
+    auth_info: mlrun.api.schemas.AuthInfo = Depends(deps.authenticate_request),
+    db_session: Session = Depends(deps.get_db_session),
+):
+    await mlrun.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
+        mlrun.api.schemas.AuthorizationResourceTypes.run,
+        project,
+        uid,
+        mlrun.api.schemas.AuthorizationAction.read,
+        auth_info,
+    )
+    # the metrics chunks are read from the run artifact path, same as the files endpoints
+    secrets = {}
+    if use_secrets:
+        secrets = await verify_and_get_project_secrets(project, auth_info)
+    secrets.update(get_secrets(auth_info))
+    metrics = await run_in_threadpool(
+        mlrun.api.crud.Runs().get_run_metrics,
+        db_session,
+        uid,
+        iter,
+        project,
+        keys,
+        start_step,
+        end_step,
+        max_points,
+        secrets,
+    )
+    return {
+        "data": metrics,
+    }
+
+
 @router.delete("/run/{project}/{uid}")
 async def delete_run(
     project: str,
@@ -178,9 +261,15 @@ async def list_runs(
         mlrun.api.schemas.OrderType.desc, alias="partition-order"
     ),
     max_partitions: int = Query(0, alias="max-partitions", ge=0),
+    fields: List[str] = Query([], alias="field"),
+    page_size: int = Query(None, alias="page-size", gt=0),
+    page_token: str = Query(None, alias="page-token"),
     auth_info: mlrun.api.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
+    if fields:
+        # the project and uid are needed for the permissions filtering
+        fields = list(dict.fromkeys(fields + ["metadata.project", "metadata.uid"]))
     if project != "*":
         await mlrun.api.utils.auth.verifier.AuthVerifier().query_project_permissions(
             project,
@@ -207,7 +296,13 @@ async def list_runs(
         partition_sort_by,
         partition_order,
         max_partitions,
+        fields=fields,
+        page_size=page_size,
+        page_token=page_token,
     )
+    next_page_token = None
+    if page_size:
+        runs, next_page_token = runs
     filtered_runs = await mlrun.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
         mlrun.api.schemas.AuthorizationResourceTypes.run,
         runs,
@@ -217,9 +312,12 @@ async def list_runs(
         ),
         auth_info,
     )
-    return {
+    response = {
         "runs": filtered_runs,
     }
+    if page_size:
+        response["next_page_token"] = next_page_token
+    return response
 
 
 @router.delete("/runs")
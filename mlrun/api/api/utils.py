@@ -121,6 +121,24 @@ def get_secrets(auth_info: mlrun.api.schemas.AuthInfo):
     }
 
 
+async def verify_and_get_project_secrets(project, auth_info):
+    """verify the permissions to read the project secrets and return them (the kubernetes secrets)"""
+    await mlrun.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
+        mlrun.api.schemas.AuthorizationResourceTypes.secret,
+        project,
+        mlrun.api.schemas.SecretProviderName.kubernetes,
+        mlrun.api.schemas.AuthorizationAction.read,
+        auth_info,
+    )
+    secrets_data = await run_in_threadpool(
+        mlrun.api.crud.Secrets().list_project_secrets,
+        project,
+        mlrun.api.schemas.SecretProviderName.kubernetes,
+        allow_secrets_from_k8s=True,
+    )
+    return secrets_data.secrets or {}
+
+
 def get_run_db_instance(
     db_session: Session,
 ):
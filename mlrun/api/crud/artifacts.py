@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import re
 import typing
 
 import sqlalchemy.orm
 
+import mlrun.api.crud
 import mlrun.api.schemas
 import mlrun.api.utils.projects.remotes.follower
 import mlrun.api.utils.singletons.db
@@ -49,6 +51,12 @@ class Artifacts(
                 f"Artifact with conflicting project name - {data['project']} while request project : {project}."
                 f"key={key}, uid={uid}, data={data}"
             )
+        counted_keys = _get_counted_artifact_keys(f"{iter}-{key}" if iter else key)
+        previous_counters = (
+            mlrun.api.crud.Projects().get_artifacts_counters_contribution(
+                db_session, project, counted_keys
+            )
+        )
         mlrun.api.utils.singletons.db.get_db().store_artifact(
             db_session,
             key,
@@ -58,6 +66,9 @@ class Artifacts(
             tag,
             project,
         )
+        mlrun.api.crud.Projects().update_project_artifacts_counters(
+            db_session, project, counted_keys, previous_counters
+        )
 
     def get_artifact(
         self,
@@ -94,7 +105,9 @@ class Artifacts(
         iter: typing.Optional[int] = None,
         best_iteration: bool = False,
         format_: ArtifactsFormat = ArtifactsFormat.full,
-    ) -> typing.List:
+        page_size: int = None,
+        page_token: str = None,
+    ) -> typing.Union[typing.List, typing.Tuple[typing.List, typing.Optional[str]]]:
         project = project or mlrun.mlconf.default_project
         if labels is None:
             labels = []
@@ -110,13 +123,20 @@ class Artifacts(
             category,
             iter,
             best_iteration,
+            page_size=page_size,
+            page_token=page_token,
         )
-        if format_ != ArtifactsFormat.legacy:
-            return artifacts
-        return [
-            _transform_artifact_struct_to_legacy_format(artifact)
-            for artifact in artifacts
-        ]
+        next_page_token = None
+        if page_size:
+            artifacts, next_page_token = artifacts
+        if format_ == ArtifactsFormat.legacy:
+            artifacts = [
+                _transform_artifact_struct_to_legacy_format(artifact)
+                for artifact in artifacts
+            ]
+        if page_size:
+            return artifacts, next_page_token
+        return artifacts
 
     def list_artifact_tags(
         self,
@@ -137,9 +157,18 @@ class Artifacts(
         project: str = mlrun.mlconf.default_project,
     ):
         project = project or mlrun.mlconf.default_project
-        return mlrun.api.utils.singletons.db.get_db().del_artifact(
+        counted_keys = _get_counted_artifact_keys(key)
+        previous_counters = (
+            mlrun.api.crud.Projects().get_artifacts_counters_contribution(
+                db_session, project, counted_keys
+            )
+        )
+        mlrun.api.utils.singletons.db.get_db().del_artifact(
             db_session, key, tag, project
         )
+        mlrun.api.crud.Projects().update_project_artifacts_counters(
+            db_session, project, counted_keys, previous_counters
+        )
 
     def delete_artifacts(
         self,
@@ -154,6 +183,19 @@ class Artifacts(
         mlrun.api.utils.singletons.db.get_db().del_artifacts(
             db_session, name, project, tag, labels
         )
+        mlrun.api.crud.Projects().refresh_project_artifacts_counters(
+            db_session, project
+        )
+
+
+def _get_counted_artifact_keys(key: str) -> typing.List[str]:
+    # the keys whose counting may change when the given (stored) key changes, an iteration artifact
+    # (<iteration>-<key>) determines whether the link artifact of its key is counted
+    keys = [key]
+    match = re.match(r"^\d+-(.+)$", key)
+    if match:
+        keys.append(match.group(1))
+    return keys
 
 
 def _transform_artifact_struct_to_legacy_format(artifact):
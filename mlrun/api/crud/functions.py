@@ -77,7 +77,9 @@ class Functions(
         name: str = "",
         tag: str = "",
         labels: typing.List[str] = None,
-    ) -> typing.List:
+        page_size: int = None,
+        page_token: str = None,
+    ) -> typing.Union[typing.List, typing.Tuple[typing.List, typing.Optional[str]]]:
         project = project or mlrun.mlconf.default_project
         if labels is None:
             labels = []
@@ -87,4 +89,6 @@ class Functions(
             project,
             tag,
             labels,
+            page_size=page_size,
+            page_token=page_token,
         )
@@ -286,6 +286,75 @@ class Projects(
             self._cache["project_resources_counters"]["ttl"] = ttl_time
         return self._cache["project_resources_counters"]["result"]
 
+    def refresh_project_artifacts_counters(
+        self, session: sqlalchemy.orm.Session, project: str
+    ):
+        """
+        Recalculate the files and models counters of a single project in the cached resources counters, used after
+        bulk artifact changes which cannot be tracked incrementally (see update_project_artifacts_counters)
+        """
+        cached_counters = self._cache["project_resources_counters"].get("result")
+        if not cached_counters:
+            return
+        (
+            files_count,
+            models_count,
+        ) = mlrun.api.utils.singletons.db.get_db().get_project_artifacts_counters(
+            session, project
+        )
+        project_to_files_count, _, _, project_to_models_count, _, _, _ = cached_counters
+        project_to_files_count[project] = files_count
+        project_to_models_count[project] = models_count
+
+    def get_artifacts_counters_contribution(
+        self, session: sqlalchemy.orm.Session, project: str, keys: typing.List[str]
+    ) -> typing.Optional[typing.Tuple[int, int]]:
+        """
+        Return the files and models counts of the latest versions of the given artifact keys, None when there are
+        no cached counters to update (see update_project_artifacts_counters)
+        """
+        if not self._cache["project_resources_counters"].get("result"):
+            return None
+        return (
+            mlrun.api.utils.singletons.db.get_db().get_artifacts_counters_contribution(
+                session, project, keys
+            )
+        )
+
+    def update_project_artifacts_counters(
+        self,
+        session: sqlalchemy.orm.Session,
+        project: str,
+        keys: typing.List[str],
+        previous_contribution: typing.Optional[typing.Tuple[int, int]],
+    ):
+        """
+        Incrementally update the files and models counters of a project in the cached resources counters after the
+        given artifact keys were stored/deleted, by the difference between their current and previous counts
+        """
+        cached_counters = self._cache["project_resources_counters"].get("result")
+        if not cached_counters or previous_contribution is None:
+            return
+        (
+            files_count,
+            models_count,
+        ) = mlrun.api.utils.singletons.db.get_db().get_artifacts_counters_contribution(
+            session, project, keys
+        )
+        project_to_files_count, _, _, project_to_models_count, _, _, _ = cached_counters
+        project_to_files_count[project] = max(
+            project_to_files_count.get(project, 0)
+            + files_count
+            - previous_contribution[0],
+            0,
+        )
+        project_to_models_count[project] = max(
+            project_to_models_count.get(project, 0)
+            + models_count
+            - previous_contribution[1],
+            0,
+        )
+
     @staticmethod
     def _list_pipelines(
         session,
@@ -25,6 +25,7 @@ import mlrun.errors
 import mlrun.lists
 import mlrun.runtimes
 import mlrun.runtimes.constants
+import mlrun.utils.run_metrics
 import mlrun.utils.singleton
 from mlrun.utils import logger
 
@@ -50,6 +51,24 @@ class Runs(
             iter=iter,
         )
 
+    def store_runs(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        runs: typing.List[dict],
+        project: str = mlrun.mlconf.default_project,
+    ):
+        project = project or mlrun.mlconf.default_project
+        logger.info("Storing runs", project=project, count=len(runs))
+        for run in runs:
+            run_project = run.get("metadata", {}).get("project") or project
+            if run_project != project:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"Run project {run_project} does not match the runs project {project}"
+                )
+            if not run.get("metadata", {}).get("uid"):
+                raise mlrun.errors.MLRunInvalidArgumentError("Run uid is missing")
+        mlrun.api.utils.singletons.db.get_db().store_runs(db_session, runs, project)
+
     def update_run(
         self,
         db_session: sqlalchemy.orm.Session,
@@ -105,6 +124,32 @@ class Runs(
             db_session, uid, project, iter
         )
 
+    def get_run_metrics(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        uid: str,
+        iter: int,
+        project: str = mlrun.mlconf.default_project,
+        keys: typing.List[str] = None,
+        start_step: int = None,
+        end_step: int = None,
+        max_points: int = None,
+        secrets: dict = None,
+    ) -> dict:
+        project = project or mlrun.mlconf.default_project
+        run = self.get_run(db_session, uid, iter, project)
+        artifact_path = run.get("spec", {}).get("output_path")
+        if not artifact_path:
+            return {}
+        return mlrun.utils.run_metrics.read_run_metrics(
+            mlrun.utils.run_metrics.get_run_metrics_path(artifact_path, uid, iter),
+            keys=keys,
+            start_step=start_step,
+            end_step=end_step,
+            max_points=max_points,
+            secrets=secrets,
+        )
+
     def list_runs(
         self,
         db_session: sqlalchemy.orm.Session,
@@ -127,6 +172,9 @@ class Runs(
         max_partitions: int = 0,
         requested_logs: bool = None,
         return_as_run_structs: bool = True,
+        fields: typing.List[str] = None,
+        page_size: int = None,
+        page_token: str = None,
     ):
         project = project or mlrun.mlconf.default_project
         return mlrun.api.utils.singletons.db.get_db().list_runs(
@@ -150,6 +198,9 @@ class Runs(
             max_partitions,
             requested_logs,
             return_as_run_structs,
+            fields,
+            page_size,
+            page_token,
         )
 
     def delete_run(
@@ -54,6 +54,16 @@ class DBInterface(ABC):
     ):
         pass
 
+    def store_runs(self, session, runs: List[dict], project=""):
+        for run in runs:
+            self.store_run(
+                session,
+                run,
+                run["metadata"]["uid"],
+                project,
+                iter=run["metadata"].get("iteration", 0),
+            )
+
     @abstractmethod
     def update_run(self, session, updates: dict, uid, project="", iter=0):
         pass
@@ -103,6 +113,7 @@ class DBInterface(ABC):
         max_partitions: int = 0,
         requested_logs: bool = None,
         return_as_run_structs: bool = True,
+        fields: List[str] = None,
     ):
         pass
 
@@ -320,6 +331,16 @@ class DBInterface(ABC):
     ]:
         pass
 
+    @abstractmethod
+    def get_project_artifacts_counters(self, session, project: str) -> Tuple[int, int]:
+        pass
+
+    @abstractmethod
+    def get_artifacts_counters_contribution(
+        self, session, project: str, keys: List[str]
+    ) -> Tuple[int, int]:
+        pass
+
     @abstractmethod
     def create_project(self, session, project: schemas.Project):
         pass
@@ -101,6 +101,7 @@ class FileDB(DBInterface):
         max_partitions: int = 0,
         requested_logs: bool = None,
         return_as_run_structs: bool = True,
+        fields: List[str] = None,
     ):
         return self._transform_run_db_error(
             self.db.list_runs,
@@ -275,6 +276,14 @@ class FileDB(DBInterface):
     ]:
         raise NotImplementedError()
 
+    def get_project_artifacts_counters(self, session, project: str) -> Tuple[int, int]:
+        raise NotImplementedError()
+
+    def get_artifacts_counters_contribution(
+        self, session, project: str, keys: List[str]
+    ) -> Tuple[int, int]:
+        raise NotImplementedError()
+
     def store_project(self, session, name: str, project: schemas.Project):
         raise NotImplementedError()
 
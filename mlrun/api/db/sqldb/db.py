@@ -24,9 +24,9 @@ from typing import Any, Dict, List, Tuple
 import fastapi.concurrency
 import mergedeep
 import pytz
-from sqlalchemy import and_, distinct, func, or_
+from sqlalchemy import String, and_, cast, distinct, func, or_
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm import Session, aliased, defer
 
 import mlrun
 import mlrun.api.db.session
@@ -35,6 +35,8 @@ import mlrun.errors
 from mlrun.api import schemas
 from mlrun.api.db.base import DBInterface
 from mlrun.api.db.sqldb.helpers import (
+    decode_page_token,
+    encode_page_token,
     generate_query_predicate_for_name,
     label_set,
     run_labels,
@@ -80,6 +82,19 @@ NULL = None  # Avoid flake8 issuing warnings when comparing in filter
 run_time_fmt = "%Y-%m-%dT%H:%M:%S.%fZ"
 unversioned_tagged_object_uid_prefix = "unversioned-"
 
+# run struct fields which are also stored as columns of the runs table
+run_fields_to_columns = {
+    "metadata.name": "name",
+    "metadata.uid": "uid",
+    "metadata.project": "project",
+    "metadata.iteration": "iteration",
+    "metadata.labels.kind": "kind",
+    "status.state": "state",
+    "status.results": "results",
+    "status.start_time": "start_time",
+    "status.last_update": "updated",
+}
+
 conflict_messages = [
     "(sqlite3.IntegrityError) UNIQUE constraint failed",
     "(pymysql.err.IntegrityError) (1062",
@@ -183,7 +198,39 @@ class SQLDB(DBInterface):
             "Storing run to db", project=project, uid=uid, iter=iter, run=run_data
         )
         run = self._get_run(session, uid, project, iter)
+        run = self._prepare_run_record(run, run_data, uid, project, iter)
+        self._upsert(session, [run], ignore=True)
+
+    @retry_on_conflict
+    def store_runs(self, session, runs: List[dict], project=""):
+        project = project or config.default_project
+        logger.debug("Storing runs to db", project=project, count=len(runs))
+        uids = {run_data["metadata"]["uid"] for run_data in runs}
+        existing_runs = {}
+        uids_list = list(uids)
+        # bound the number of query params
+        for start in range(0, len(uids_list), 500):
+            query = self._query(session, Run, project=project).filter(
+                Run.uid.in_(uids_list[start : start + 500])
+            )
+            for run in query:
+                existing_runs[(run.uid, run.iteration)] = run
+
         now = datetime.now(timezone.utc)
+        records = {}
+        for run_data in runs:
+            uid = run_data["metadata"]["uid"]
+            iter = run_data["metadata"].get("iteration", 0) or 0
+            run = records.get((uid, iter)) or existing_runs.get((uid, iter))
+            records[(uid, iter)] = self._prepare_run_record(
+                run, run_data, uid, project, iter, now=now
+            )
+        self._upsert(session, list(records.values()), ignore=True)
+
+    def _prepare_run_record(
+        self, run: Run, run_data: dict, uid, project, iter, now=None
+    ) -> Run:
+        now = now or datetime.now(timezone.utc)
         if not run:
             run = Run(
                 name=run_data["metadata"]["name"],
@@ -207,7 +254,7 @@ class SQLDB(DBInterface):
         run.start_time = start_time
         self._update_run_updated_time(run, run_data, now=now)
         run.struct = run_data
-        self._upsert(session, [run], ignore=True)
+        return run
 
     def update_run(self, session, updates: dict, uid, project="", iter=0):
         project = project or config.default_project
@@ -324,7 +371,22 @@ class SQLDB(DBInterface):
         max_partitions: int = 0,
         requested_logs: bool = None,
         return_as_run_structs: bool = True,
+        fields: typing.List[str] = None,
+        page_size: int = None,
+        page_token: str = None,
     ):
+        """
+        :param fields:     struct fields (e.g. "status.state") to return per run instead of the whole run struct, when
+                           all of them are stored as columns (see run_fields_to_columns) the run bodies are not loaded
+        :param page_size:  return a single page of (at most) this number of runs, sorted by start time (descending),
+                           together with the token of the next page - a tuple of (runs, next_page_token), the token
+                           is None on the last page
+        :param page_token: the token of the page to return (as returned with the previous page)
+        """
+        if page_size and (last or partition_by):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Pagination can not be used together with last or partition_by"
+            )
         project = project or config.default_project
         query = self._find_runs(session, uid, project, labels)
         if name is not None:
@@ -339,7 +401,7 @@ class SQLDB(DBInterface):
             query = query.filter(Run.updated >= last_update_time_from)
         if last_update_time_to is not None:
             query = query.filter(Run.updated <= last_update_time_to)
-        if sort:
+        if sort and not page_size:
             query = query.order_by(Run.start_time.desc())
         if last:
             if not sort:
@@ -365,13 +427,43 @@ class SQLDB(DBInterface):
                 partition_order,
                 max_partitions,
             )
+        if fields and all(field in run_fields_to_columns for field in fields):
+            # all the requested fields are stored as columns, no need to load the run bodies
+            query = query.options(defer("body"))
+
+        if page_size:
+            records, next_page_token = self._paginate_query(
+                query, Run, page_size, page_token, Run.start_time
+            )
+            if not return_as_run_structs:
+                return records, next_page_token
+            return self._to_run_list(records, fields), next_page_token
+
         if not return_as_run_structs:
             return query.all()
 
+        return self._to_run_list(query, fields)
+
+    def _to_run_list(self, records, fields: typing.List[str] = None) -> RunList:
         runs = RunList()
-        for run in query:
-            runs.append(run.struct)
+        if not fields:
+            for run in records:
+                runs.append(run.struct)
+            return runs
 
+        load_body = any(field not in run_fields_to_columns for field in fields)
+        for run in records:
+            struct = run.struct if load_body else None
+            run_dict = {}
+            for field in fields:
+                if field in run_fields_to_columns:
+                    value = getattr(run, run_fields_to_columns[field])
+                    if isinstance(value, datetime):
+                        value = self._add_utc_timezone(value).isoformat()
+                else:
+                    value = get_in(struct, field)
+                update_in(run_dict, field, value)
+            runs.append(run_dict)
         return runs
 
     def del_run(self, session, uid, project=None, iter=0):
@@ -695,7 +787,15 @@ class SQLDB(DBInterface):
         best_iteration: bool = False,
         as_records: bool = False,
         use_tag_as_uid: bool = None,
+        page_size: int = None,
+        page_token: str = None,
     ):
+        """
+        :param page_size:  return a single page of (at most) this number of artifact records (an artifact with several
+                           tags is returned once per tag), together with the token of the next page - a tuple of
+                           (artifacts, next_page_token), the token is None on the last page
+        :param page_token: the token of the page to return (as returned with the previous page)
+        """
         project = project or config.default_project
 
         if best_iteration and iter is not None:
@@ -731,12 +831,19 @@ class SQLDB(DBInterface):
             category,
             iter,
             use_tag_as_uid=use_tag_as_uid,
+            page_size=page_size,
+            page_token=page_token,
         )
+        next_page_token = None
+        if page_size:
+            artifact_records, next_page_token = artifact_records
         if as_records:
             if best_iteration:
                 raise mlrun.errors.MLRunInvalidArgumentError(
                     "as_records is not supported with best_iteration=True"
                 )
+            if page_size:
+                return artifact_records, next_page_token
             return artifact_records
 
         # In case best_iteration is requested and filtering is done by tag, then we might have artifacts from the best
@@ -752,12 +859,21 @@ class SQLDB(DBInterface):
                     iteration_keys.add((key_without_iteration, artifact.uid))
                 else:
                     link_keys.add((artifact.key, artifact.uid))
-            missing_link_keys = iteration_keys.difference(link_keys)
-            artifact_records.extend(
-                self._get_link_artifacts_by_keys_and_uids(
-                    session, project, missing_link_keys
+            # when paging without a tag filter the missing link artifacts are listed in other pages
+            if not page_size or ids != "*":
+                missing_link_keys = iteration_keys.difference(link_keys)
+                artifact_records.extend(
+                    self._get_link_artifacts_by_keys_and_uids(
+                        session, project, missing_link_keys
+                    )
+                )
+            if page_size:
+                # the linked (best) iterations of the page link artifacts may be listed in other pages
+                artifact_records.extend(
+                    self._get_linked_artifacts_missing_from_page(
+                        session, project, artifact_records
+                    )
                 )
-            )
 
         # concatenating <artifact.key> and <artifact.uid> to create a unique key for the artifacts
         indexed_artifacts = {
@@ -801,8 +917,25 @@ class SQLDB(DBInterface):
             )
             artifacts.extend(artifacts_with_tag)
 
+        if page_size:
+            return artifacts, next_page_token
         return artifacts
 
+    def _get_linked_artifacts_missing_from_page(self, session, project, artifacts):
+        artifact_keys = {(artifact.key, artifact.uid) for artifact in artifacts}
+        missing_keys = set()
+        for artifact in artifacts:
+            if self._name_with_iter_regex.match(artifact.key):
+                continue
+            if is_legacy_artifact(artifact.struct):
+                link_iteration = artifact.struct.get("link_iteration")
+            else:
+                link_iteration = artifact.struct.get("spec", {}).get("link_iteration")
+            linked_key = (f"{link_iteration}-{artifact.key}", artifact.uid)
+            if link_iteration and linked_key not in artifact_keys:
+                missing_keys.add(linked_key)
+        return self._get_link_artifacts_by_keys_and_uids(session, project, missing_keys)
+
     def _get_link_artifacts_by_keys_and_uids(self, session, project, identifiers):
         # identifiers are tuples of (key, uid)
         if not identifiers:
@@ -1026,13 +1159,34 @@ class SQLDB(DBInterface):
             if hasattr(labeled_class, "project"):
                 self._delete(session, labeled_class, project=project)
 
-    def list_functions(self, session, name=None, project=None, tag=None, labels=None):
+    def list_functions(
+        self,
+        session,
+        name=None,
+        project=None,
+        tag=None,
+        labels=None,
+        page_size: int = None,
+        page_token: str = None,
+    ):
+        """
+        :param page_size:  return a single page of (at most) this number of function records (a function with several
+                           tags is returned once per tag), together with the token of the next page - a tuple of
+                           (functions, next_page_token), the token is None on the last page
+        :param page_token: the token of the page to return (as returned with the previous page)
+        """
         project = project or config.default_project
         uids = None
         if tag:
             uids = self._resolve_class_tag_uids(session, Function, project, tag, name)
         functions = FunctionList()
-        for function in self._find_functions(session, name, project, uids, labels):
+        function_records = self._find_functions(session, name, project, uids, labels)
+        next_page_token = None
+        if page_size:
+            function_records, next_page_token = self._paginate_query(
+                function_records, Function, page_size, page_token
+            )
+        for function in function_records:
             function_dict = function.struct
             if not tag:
                 function_tags = self._list_function_tags(session, project, function.id)
@@ -1059,6 +1213,8 @@ class SQLDB(DBInterface):
             else:
                 function_dict["metadata"]["tag"] = tag
                 functions.append(function_dict)
+        if page_size:
+            return functions, next_page_token
         return functions
 
     def _delete_function_tags(self, session, project, function_name, commit=True):
@@ -1498,36 +1654,128 @@ class SQLDB(DBInterface):
         }
         return project_to_feature_set_count
 
-    def _calculate_models_counters(self, session) -> Dict[str, int]:
+    def get_project_artifacts_counters(self, session, project: str) -> Tuple[int, int]:
+        """
+        :return: the files and models counts of a single project
+        """
+        return (
+            self._calculate_files_counters(session, project).get(project, 0),
+            self._calculate_models_counters(session, project).get(project, 0),
+        )
+
+    def get_artifacts_counters_contribution(
+        self, session, project: str, keys: List[str]
+    ) -> Tuple[int, int]:
+        """
+        :return: the files and models counts of the latest versions of the given artifact keys (as stored, with the
+                 iteration prefix), used to incrementally update the project counters when artifacts change
+        """
         import mlrun.artifacts
 
-        # The kind filter is applied post the query to the DB (manually in python code), so counting should be that
-        # way as well, therefore we're doing it here, and can't do it with sql as the above
-        # We're using the "latest" which gives us only one version of each artifact key, which is what we want to
-        # count (artifact count, not artifact versions count)
-        model_artifacts = self._find_artifacts(
-            session, None, "latest", kind=mlrun.artifacts.model.ModelArtifact.kind
-        )
-        project_to_models_count = collections.defaultdict(int)
-        for model_artifact in model_artifacts:
-            project_to_models_count[model_artifact.project] += 1
-        return project_to_models_count
+        non_file_kinds = self._get_non_file_artifact_kinds()
+        files_count, models_count = 0, 0
+        for key in set(keys):
+            artifact = (
+                session.query(Artifact)
+                .filter(Artifact.project == project, Artifact.key == key)
+                .order_by(Artifact.updated.desc())
+                .first()
+            )
+            if not artifact:
+                continue
+            if artifact.kind == mlrun.artifacts.model.ModelArtifact.kind:
+                models_count += 1
+            elif artifact.kind == mlrun.artifacts.base.LinkArtifact.kind:
+                linked_file_artifact = (
+                    session.query(Artifact.id)
+                    .filter(
+                        Artifact.id == artifact.id,
+                        self._linked_file_artifact_exists(session, Artifact),
+                    )
+                    .first()
+                )
+                if linked_file_artifact:
+                    files_count += 1
+            elif artifact.kind not in non_file_kinds:
+                files_count += 1
+        return files_count, models_count
+
+    def _calculate_models_counters(
+        self, session, project: str = None
+    ) -> Dict[str, int]:
+        import mlrun.artifacts
+
+        query = self._query_latest_artifacts_count_per_project(
+            session, Artifact, project
+        ).filter(Artifact.kind == mlrun.artifacts.model.ModelArtifact.kind)
+        return {result[0]: result[1] for result in query.all()}
 
-    def _calculate_files_counters(self, session) -> Dict[str, int]:
+    def _calculate_files_counters(self, session, project: str = None) -> Dict[str, int]:
         import mlrun.artifacts
 
-        # The category filter is applied post the query to the DB (manually in python code), so counting should be that
-        # way as well, therefore we're doing it here, and can't do it with sql as the above
-        # We're using the "latest" which gives us only one version of each artifact key, which is what we want to
-        # count (artifact count, not artifact versions count)
-        file_artifacts = self._find_artifacts(
-            session, None, "latest", category=mlrun.api.schemas.ArtifactCategories.other
+        non_file_kinds = self._get_non_file_artifact_kinds()
+        files_count_per_project = (
+            self._query_latest_artifacts_count_per_project(session, Artifact, project)
+            .filter(or_(Artifact.kind == NULL, Artifact.kind.notin_(non_file_kinds)))
+            .all()
         )
+        link_artifact = aliased(Artifact)
+        link_files_count_per_project = (
+            self._query_latest_artifacts_count_per_project(
+                session, link_artifact, project
+            )
+            .filter(
+                link_artifact.kind == mlrun.artifacts.base.LinkArtifact.kind,
+                self._linked_file_artifact_exists(session, link_artifact),
+            )
+            .all()
+        )
+
         project_to_files_count = collections.defaultdict(int)
-        for file_artifact in file_artifacts:
-            project_to_files_count[file_artifact.project] += 1
+        for result in files_count_per_project + link_files_count_per_project:
+            project_to_files_count[result[0]] += result[1]
         return project_to_files_count
 
+    def _linked_file_artifact_exists(self, session, link_artifact_cls):
+        # same as listing the "other" category, link artifacts are counted only when they point to an iteration
+        # artifact of the category, i.e. an artifact of the same run whose key is <link iteration>-<link key>
+        linked_artifact = aliased(Artifact)
+        return (
+            session.query(linked_artifact.id)
+            .filter(
+                linked_artifact.project == link_artifact_cls.project,
+                linked_artifact.uid == link_artifact_cls.uid,
+                linked_artifact.key
+                == cast(link_artifact_cls.link_iteration, String)
+                + "-"
+                + link_artifact_cls.key,
+                or_(
+                    linked_artifact.kind == NULL,
+                    linked_artifact.kind.notin_(self._get_non_file_artifact_kinds()),
+                ),
+            )
+            .exists()
+        )
+
+    @staticmethod
+    def _get_non_file_artifact_kinds() -> List[str]:
+        import mlrun.artifacts
+
+        kinds, _ = mlrun.api.schemas.ArtifactCategories.other.to_kinds_filter()
+        return kinds + [mlrun.artifacts.base.LinkArtifact.kind]
+
+    def _query_latest_artifacts_count_per_project(
+        self, session, artifact_cls, project: str = None
+    ):
+        # We're using only the "latest" version of each artifact key, which is what we want to count (artifact count,
+        # not artifact versions count)
+        query = session.query(artifact_cls.project, func.count(artifact_cls.id))
+        if project:
+            query = query.filter(artifact_cls.project == project)
+        return self._latest_uid_filter(
+            session, query, artifact_cls, project=project
+        ).group_by(artifact_cls.project)
+
     def _calculate_runs_counters(
         self, session
     ) -> Tuple[Dict[str, int], Dict[str, int]]:
@@ -1982,6 +2230,47 @@ class SQLDB(DBInterface):
                 f"Invalid partition_by given: '{partition_by.value}'. Must be one of {valid_enum_values}"
             )
 
+    @staticmethod
+    def _paginate_query(
+        query, cls, page_size: int, page_token: str = None, sort_field=None
+    ) -> Tuple[list, typing.Optional[str]]:
+        """
+        keyset pagination - records are ordered by the sort field and id (both descending) and each page starts right
+        after the position of the previous page end, encoded in the page token. unlike offset pagination the DB
+        doesn't go over the records of the previous pages, and records added meanwhile don't shift the pages
+
+        :return: the page records, and the token of the next page (None if this is the last page)
+        """
+        order_by = [cls.id.desc()]
+        if sort_field is not None:
+            order_by.insert(0, sort_field.desc())
+
+        if page_token:
+            position = decode_page_token(page_token)
+            if sort_field is not None:
+                sort_value, record_id = position
+                sort_value = datetime.fromisoformat(sort_value)
+                query = query.filter(
+                    or_(
+                        sort_field < sort_value,
+                        and_(sort_field == sort_value, cls.id < record_id),
+                    )
+                )
+            else:
+                (record_id,) = position
+                query = query.filter(cls.id < record_id)
+
+        # query one extra record to know whether there is a next page
+        records = query.order_by(*order_by).limit(page_size + 1).all()
+        if len(records) <= page_size:
+            return records, None
+
+        records = records[:page_size]
+        position = [records[-1].id]
+        if sort_field is not None:
+            position.insert(0, getattr(records[-1], sort_field.key).isoformat())
+        return records, encode_page_token(position)
+
     @staticmethod
     def _create_partitioned_query(
         session,
@@ -2816,29 +3105,28 @@ class SQLDB(DBInterface):
             query = query.filter(Run.uid.in_(uid))
         return self._add_labels_filter(session, query, Run, labels)
 
-    def _latest_uid_filter(self, session, query):
-        # Create a sub query of latest uid (by updated) per (project,key)
-        subq = (
-            session.query(
-                Artifact.uid,
-                Artifact.project,
-                Artifact.key,
-                func.max(Artifact.updated),
-            )
-            .group_by(
-                Artifact.project,
-                Artifact.key.label("key"),
-            )
-            .subquery("max_key")
+    def _latest_uid_filter(self, session, query, artifact_cls=Artifact, project=None):
+        # Create a sub query of latest uid (by updated) per (project,key), scoped to the project when given
+        subq = session.query(
+            Artifact.uid,
+            Artifact.project,
+            Artifact.key,
+            func.max(Artifact.updated),
         )
+        if project:
+            subq = subq.filter(Artifact.project == project)
+        subq = subq.group_by(
+            Artifact.project,
+            Artifact.key.label("key"),
+        ).subquery("max_key")
 
         # Join current query with sub query on (project, key, uid)
         return query.join(
             subq,
             and_(
-                Artifact.project == subq.c.project,
-                Artifact.key == subq.c.key,
-                Artifact.uid == subq.c.uid,
+                artifact_cls.project == subq.c.project,
+                artifact_cls.key == subq.c.key,
+                artifact_cls.uid == subq.c.uid,
             ),
         )
 
@@ -2894,6 +3182,8 @@ class SQLDB(DBInterface):
         category: schemas.ArtifactCategories = None,
         iter=None,
         use_tag_as_uid: bool = None,
+        page_size: int = None,
+        page_token: str = None,
     ):
         """
         TODO: refactor this method
@@ -2905,6 +3195,9 @@ class SQLDB(DBInterface):
         use_tag_as_uid==True we are treating the ids as uid (for backwards compatibility where we have artifacts which
         were created with uid==latest when created using the project.log_artifact() method)
         3. ids is a string (different than "latest") - in which the meaning is actually a uid, so we add this filter
+
+        when page_size is given, returns a tuple of the page records and the token of the next page (see
+        _paginate_query)
         """
         if category and kind:
             message = "Category and Kind filters can't be given together"
@@ -2931,15 +3224,37 @@ class SQLDB(DBInterface):
         query = self._add_artifact_name_and_iter_query(query, name, iter)
 
         if kind:
-            return self._filter_artifacts_by_kinds(query, [kind])
-
+            query = self._filter_artifacts_by_kinds(query, [kind])
         elif category:
-            filtered_artifacts = self._filter_artifacts_by_category(query, category)
+            query = self._filter_artifacts_by_category(query, category)
+
+        next_page_token = None
+        if page_size:
+            artifacts, next_page_token = self._paginate_query(
+                query, Artifact, page_size, page_token
+            )
+        else:
+            artifacts = query.all()
+
+        if category:
+            linked_keys = set()
+            if page_size:
+                # the linked iterations of the page link artifacts may be listed in other pages
+                kinds, exclude = category.to_kinds_filter()
+                linked_keys = {
+                    artifact.key
+                    for artifact in self._get_linked_artifacts_missing_from_page(
+                        session, project, artifacts
+                    )
+                    if (artifact.kind in kinds) != exclude
+                }
             # TODO - this is a hack needed since link artifacts will be returned even for artifacts of
             #        the wrong category. Remove this when we refactor this area.
-            return self._filter_out_extra_link_artifacts(filtered_artifacts)
-        else:
-            return query.all()
+            artifacts = self._filter_out_extra_link_artifacts(artifacts, linked_keys)
+
+        if page_size:
+            return artifacts, next_page_token
+        return artifacts
 
     def _filter_artifacts_by_category(
         self, artifacts, category: schemas.ArtifactCategories
@@ -2951,37 +3266,25 @@ class SQLDB(DBInterface):
         self, artifacts, kinds: List[str], exclude: bool = False
     ):
         """
+        :param artifacts - artifacts query
         :param kinds - list of kinds to filter by
         :param exclude - if true then the filter will be "all except" - get all artifacts excluding the ones who have
          any of the given kinds
         """
-        # see docstring of _post_query_runs_filter for why we're filtering it manually
-        filtered_artifacts = []
-        for artifact in artifacts:
-            artifact_json = artifact.struct
-            if (
-                artifact_json
-                and isinstance(artifact_json, dict)
-                and (
-                    (
-                        not exclude
-                        and any([kind == artifact_json.get("kind") for kind in kinds])
-                    )
-                    or (
-                        exclude
-                        and all([kind != artifact_json.get("kind") for kind in kinds])
-                    )
-                )
-            ):
-                filtered_artifacts.append(artifact)
-        return filtered_artifacts
+        if exclude:
+            # kind is null for artifacts without a kind, which "not in" doesn't match
+            return artifacts.filter(
+                or_(Artifact.kind == NULL, Artifact.kind.notin_(kinds))
+            )
+        return artifacts.filter(Artifact.kind.in_(kinds))
 
     # TODO - this is a hack needed since link artifacts will be returned even for artifacts of
     #        the wrong category. Remove this when we refactor this area.
     @staticmethod
-    def _filter_out_extra_link_artifacts(artifacts):
-        # Only keep link artifacts that point at "real" artifacts that already exist in the results
-        existing_keys = set()
+    def _filter_out_extra_link_artifacts(artifacts, existing_keys: set = None):
+        # Only keep link artifacts that point at "real" artifacts that already exist in the results (or in the given
+        # existing keys)
+        existing_keys = set(existing_keys or [])
         link_artifacts = []
         filtered_artifacts = []
         for artifact in artifacts:
@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import base64
+import json
+
 from dateutil import parser
 
+import mlrun.errors
 from mlrun.api.db.sqldb.models import Base, _table2cls
 from mlrun.utils import get_in
 
@@ -86,3 +90,17 @@ def generate_query_predicate_for_name(column, query_string):
         return column.ilike(f"%{query_string[1:]}%")
     else:
         return column.__eq__(query_string)
+
+
+def encode_page_token(position: list) -> str:
+    """encode the position of a page end (the sort values of its last record) as an opaque token"""
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_page_token(page_token: str) -> list:
+    try:
+        return json.loads(base64.urlsafe_b64decode(page_token.encode()))
+    except ValueError as exc:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Invalid page token: {page_token}"
+        ) from exc
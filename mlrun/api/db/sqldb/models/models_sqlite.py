@@ -57,14 +57,38 @@ class BaseModel:
         return dict(map(get_key_value, columns))
 
 
+def dumps_struct(struct) -> bytes:
+    try:
+        return orjson.dumps(struct, option=orjson.OPT_SERIALIZE_NUMPY)
+    except TypeError:
+        # structs which can't be represented as json (e.g. non string keys) are kept pickled
+        return pickle.dumps(struct)
+
+
+def loads_struct(body: bytes):
+    if not body:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        # bodies stored before the move to json were pickled
+        return pickle.loads(body)
+
+
 class HasStruct(BaseModel):
     @property
     def struct(self):
-        return pickle.loads(self.body)
+        return loads_struct(self.body)
 
     @struct.setter
     def struct(self, value):
-        self.body = pickle.dumps(value)
+        self.body = dumps_struct(value)
+        self.update_promoted_columns(value)
+
+    def update_promoted_columns(self, struct):
+        """fill the columns which are copied from the struct, so queries can filter by them and list them without
+        loading the body"""
+        pass
 
     def to_dict(self, exclude=None):
         """
@@ -143,14 +167,25 @@ with warnings.catch_warnings():
         key = Column(String(255, collation=SQLCollationUtil.collation()))
         project = Column(String(255, collation=SQLCollationUtil.collation()))
         uid = Column(String(255, collation=SQLCollationUtil.collation()))
+        kind = Column(String(255, collation=SQLCollationUtil.collation()), index=True)
+        # the iteration which a link artifact points to
+        link_iteration = Column(Integer)
         updated = Column(TIMESTAMP)
-        # TODO: change to JSON, see mlrun/api/schemas/function.py::FunctionState for reasoning
+        # json encoded struct (see HasStruct), records stored by older versions may still hold a pickled struct
         body = Column(BLOB)
         labels = relationship(Label)
 
         def get_identifier_string(self) -> str:
             return f"{self.project}/{self.key}/{self.uid}"
 
+        def update_promoted_columns(self, struct):
+            self.kind = struct.get("kind") if isinstance(struct, dict) else None
+            self.link_iteration = None
+            if self.kind == "link":
+                # legacy format artifacts have no spec
+                spec = struct["spec"] if "spec" in struct else struct
+                self.link_iteration = spec.get("link_iteration")
+
     class Function(Base, HasStruct):
         __tablename__ = "functions"
         __table_args__ = (
@@ -164,7 +199,8 @@ with warnings.catch_warnings():
         name = Column(String(255, collation=SQLCollationUtil.collation()))
         project = Column(String(255, collation=SQLCollationUtil.collation()))
         uid = Column(String(255, collation=SQLCollationUtil.collation()))
-        # TODO: change to JSON, see mlrun/api/schemas/function.py::FunctionState for reasoning
+        kind = Column(String(255, collation=SQLCollationUtil.collation()), index=True)
+        # json encoded struct (see HasStruct), records stored by older versions may still hold a pickled struct
         body = Column(BLOB)
         updated = Column(TIMESTAMP)
         labels = relationship(Label)
@@ -172,6 +208,9 @@ with warnings.catch_warnings():
         def get_identifier_string(self) -> str:
             return f"{self.project}/{self.name}/{self.uid}"
 
+        def update_promoted_columns(self, struct):
+            self.kind = struct.get("kind") if isinstance(struct, dict) else None
+
     class Log(Base, BaseModel):
         __tablename__ = "logs"
 
@@ -200,8 +239,11 @@ with warnings.catch_warnings():
             String(255, collation=SQLCollationUtil.collation()), default="no-name"
         )
         iteration = Column(Integer)
-        state = Column(String(255, collation=SQLCollationUtil.collation()))
-        # TODO: change to JSON, see mlrun/api/schemas/function.py::FunctionState for reasoning
+        state = Column(String(255, collation=SQLCollationUtil.collation()), index=True)
+        kind = Column(String(255, collation=SQLCollationUtil.collation()), index=True)
+        # the run results (metrics), listed without loading the run bodies
+        results = Column(JSON)
+        # json encoded struct (see HasStruct), records stored by older versions may still hold a pickled struct
         body = Column(BLOB)
         start_time = Column(TIMESTAMP)
         # requested logs column indicates whether logs were requested for this run
@@ -215,6 +257,11 @@ with warnings.catch_warnings():
         def get_identifier_string(self) -> str:
             return f"{self.project}/{self.uid}/{self.iteration}"
 
+        def update_promoted_columns(self, struct):
+            struct = struct or {}
+            self.kind = (struct.get("metadata", {}).get("labels") or {}).get("kind")
+            self.results = struct.get("status", {}).get("results")
+
     class BackgroundTask(Base, BaseModel):
         __tablename__ = "background_tasks"
         __table_args__ = (
@@ -107,7 +107,7 @@ def init_data(
 # This is because data version 1 points to to a data migration which was added back in 0.6.0, and
 # upgrading from a version earlier than 0.6.0 to v>=0.8.0 is not supported.
 data_version_prior_to_table_addition = 1
-latest_data_version = 2
+latest_data_version = 4
 
 
 def _resolve_needed_operations(
@@ -212,6 +212,10 @@ def _perform_data_migrations(db_session: sqlalchemy.orm.Session):
                 _perform_version_1_data_migrations(db, db_session)
             if current_data_version < 2:
                 _perform_version_2_data_migrations(db, db_session)
+            if current_data_version < 3:
+                _perform_version_3_data_migrations(db, db_session)
+            if current_data_version < 4:
+                _perform_version_4_data_migrations(db, db_session)
             db.create_data_version(db_session, str(latest_data_version))
 
 
@@ -465,6 +469,75 @@ def _align_runs_table(
         db._upsert(db_session, [run], ignore=True)
 
 
+def _perform_version_3_data_migrations(
+    db: mlrun.api.db.sqldb.db.SQLDB, db_session: sqlalchemy.orm.Session
+):
+    _migrate_structs_to_json(db, db_session)
+
+
+def _migrate_structs_to_json(
+    db: mlrun.api.db.sqldb.db.SQLDB,
+    db_session: sqlalchemy.orm.Session,
+    batch_size: int = 1000,
+):
+    for cls in [
+        mlrun.api.db.sqldb.models.Run,
+        mlrun.api.db.sqldb.models.Artifact,
+        mlrun.api.db.sqldb.models.Function,
+    ]:
+        logger.info("Migrating structs to json", table=cls.__tablename__)
+        last_id = 0
+        while True:
+            records = (
+                db._query(db_session, cls)
+                .filter(cls.id > last_id)
+                .order_by(cls.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not records:
+                break
+            for record in records:
+                # re-setting the struct stores it as json and fills the promoted columns (kind, results, etc.)
+                record.struct = record.struct
+            db_session.commit()
+            last_id = records[-1].id
+
+
+def _perform_version_4_data_migrations(
+    db: mlrun.api.db.sqldb.db.SQLDB, db_session: sqlalchemy.orm.Session
+):
+    _fill_artifacts_link_iteration(db, db_session)
+
+
+def _fill_artifacts_link_iteration(
+    db: mlrun.api.db.sqldb.db.SQLDB,
+    db_session: sqlalchemy.orm.Session,
+    batch_size: int = 1000,
+):
+    logger.info("Filling the link iteration of link artifacts")
+    last_id = 0
+    while True:
+        artifacts = (
+            db._query(db_session, mlrun.api.db.sqldb.models.Artifact)
+            .filter(
+                mlrun.api.db.sqldb.models.Artifact.id > last_id,
+                mlrun.api.db.sqldb.models.Artifact.kind
+                == mlrun.artifacts.base.LinkArtifact.kind,
+            )
+            .order_by(mlrun.api.db.sqldb.models.Artifact.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not artifacts:
+            break
+        for artifact in artifacts:
+            # re-setting the struct fills the link_iteration column
+            artifact.struct = artifact.struct
+        db_session.commit()
+        last_id = artifacts[-1].id
+
+
 def _perform_version_1_data_migrations(
     db: mlrun.api.db.sqldb.db.SQLDB, db_session: sqlalchemy.orm.Session
 ):
@@ -0,0 +1,37 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""adding link iteration column to artifacts
+
+Revision ID: 0d0323e81e94
+Revises: 935e48b59fef
+Create Date: 2023-02-12 09:21:37.114920
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0d0323e81e94"
+down_revision = "935e48b59fef"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("artifacts", sa.Column("link_iteration", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("artifacts", "link_iteration")
@@ -0,0 +1,64 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""adding promoted struct columns to runs, artifacts and functions
+
+Revision ID: 935e48b59fef
+Revises: 88e656800d6a
+Create Date: 2023-02-05 10:14:02.530482
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+import mlrun.api.utils.db.sql_collation
+
+# revision identifiers, used by Alembic.
+revision = "935e48b59fef"
+down_revision = "88e656800d6a"
+branch_labels = None
+depends_on = None
+
+
+def _kind_column():
+    return sa.Column(
+        "kind",
+        sa.String(
+            length=255,
+            collation=mlrun.api.utils.db.sql_collation.SQLCollationUtil.collation(),
+        ),
+        nullable=True,
+    )
+
+
+def upgrade():
+    op.add_column("runs", _kind_column())
+    op.add_column("runs", sa.Column("results", sa.JSON(), nullable=True))
+    op.create_index("ix_runs_kind", "runs", ["kind"], unique=False)
+    op.create_index("ix_runs_state", "runs", ["state"], unique=False)
+    op.add_column("artifacts", _kind_column())
+    op.create_index("ix_artifacts_kind", "artifacts", ["kind"], unique=False)
+    op.add_column("functions", _kind_column())
+    op.create_index("ix_functions_kind", "functions", ["kind"], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_functions_kind", table_name="functions")
+    op.drop_column("functions", "kind")
+    op.drop_index("ix_artifacts_kind", table_name="artifacts")
+    op.drop_column("artifacts", "kind")
+    op.drop_index("ix_runs_state", table_name="runs")
+    op.drop_index("ix_runs_kind", table_name="runs")
+    op.drop_column("runs", "results")
+    op.drop_column("runs", "kind")
@@ -0,0 +1,70 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""adding promoted struct columns to runs, artifacts and functions
+
+Revision ID: 05b2982c83c2
+Revises: 803438ecd005
+Create Date: 2023-02-05 10:12:44.318251
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+import mlrun.api.utils.db.sql_collation
+
+# revision identifiers, used by Alembic.
+revision = "05b2982c83c2"
+down_revision = "803438ecd005"
+branch_labels = None
+depends_on = None
+
+
+def _kind_column():
+    return sa.Column(
+        "kind",
+        sa.String(
+            length=255,
+            collation=mlrun.api.utils.db.sql_collation.SQLCollationUtil.collation(),
+        ),
+        nullable=True,
+    )
+
+
+def upgrade():
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.add_column(_kind_column())
+        batch_op.add_column(sa.Column("results", sa.JSON(), nullable=True))
+        batch_op.create_index("ix_runs_kind", ["kind"], unique=False)
+        batch_op.create_index("ix_runs_state", ["state"], unique=False)
+    with op.batch_alter_table("artifacts") as batch_op:
+        batch_op.add_column(_kind_column())
+        batch_op.create_index("ix_artifacts_kind", ["kind"], unique=False)
+    with op.batch_alter_table("functions") as batch_op:
+        batch_op.add_column(_kind_column())
+        batch_op.create_index("ix_functions_kind", ["kind"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("functions") as batch_op:
+        batch_op.drop_index("ix_functions_kind")
+        batch_op.drop_column("kind")
+    with op.batch_alter_table("artifacts") as batch_op:
+        batch_op.drop_index("ix_artifacts_kind")
+        batch_op.drop_column("kind")
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.drop_index("ix_runs_state")
+        batch_op.drop_index("ix_runs_kind")
+        batch_op.drop_column("results")
+        batch_op.drop_column("kind")
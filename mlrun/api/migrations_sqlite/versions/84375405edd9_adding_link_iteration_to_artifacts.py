@@ -0,0 +1,39 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""adding link iteration column to artifacts
+
+Revision ID: 84375405edd9
+Revises: 05b2982c83c2
+Create Date: 2023-02-12 09:20:52.608315
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "84375405edd9"
+down_revision = "05b2982c83c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("artifacts") as batch_op:
+        batch_op.add_column(sa.Column("link_iteration", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("artifacts") as batch_op:
+        batch_op.drop_column("link_iteration")
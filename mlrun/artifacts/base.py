@@ -31,6 +31,7 @@ from ..utils import (
     calculate_local_file_hash,
     generate_artifact_uri,
     is_relative_path,
+    logger,
 )
 
 
@@ -355,6 +356,8 @@ class Artifact(ModelObj):
             self.metadata.hash = body_hash or calculate_blob_hash(body)
         self.spec.size = len(body)
 
+        if body_hash and self._is_uploaded(self.spec.target_path, self.spec.size):
+            return
         store_manager.object(url=target or self.spec.target_path).put(body)
 
     def _upload_file(
@@ -374,10 +377,35 @@ class Artifact(ModelObj):
             self.metadata.hash = file_hash or calculate_local_file_hash(source_path)
         self.spec.size = os.stat(source_path).st_size
 
+        if file_hash and self._is_uploaded(self.spec.target_path, self.spec.size):
+            return
         store_manager.object(url=target_path or self.spec.target_path).upload(
             source_path
         )
 
+    @staticmethod
+    def _is_uploaded(target_path: str, size: int) -> bool:
+        """
+        check whether a content addressed target (generated from the artifact hash) was already uploaded, in which
+        case the upload can be skipped (when mlrun.mlconf.artifacts.deduplicate_uploads is set)
+        :param target_path: the target path generated from the artifact hash
+        :param size: the artifact size
+        :return: True if an object with the same size exists in the target path
+        """
+        if not mlrun.mlconf.artifacts.deduplicate_uploads:
+            return False
+        try:
+            stats = store_manager.object(url=target_path).stat()
+        except Exception:
+            return False
+        if not stats or stats.size != size:
+            return False
+        logger.debug(
+            "Artifact content already exists in target path, skipping upload",
+            target_path=target_path,
+        )
+        return True
+
     def resolve_body_target_hash_path(
         self, body: typing.Union[bytes, str], artifact_path: str
     ) -> (str, str):
@@ -584,6 +584,15 @@ def get_model(model_dir, suffix=""):
     if obj.kind == "file":
         return model_file, model_spec, extra_dataitems
 
+    cache = mlrun.datastore.cache.get_local_cache()
+    if cache:
+        version = mlrun.datastore.cache.get_object_version(obj)
+        if version:
+            local_path = cache.get_local_path(
+                obj.url, version, download=obj.download, suffix=suffix
+            )
+            return local_path, model_spec, extra_dataitems
+
     temp_path = tempfile.NamedTemporaryFile(suffix=suffix, delete=False).name
     obj.download(temp_path)
     return temp_path, model_spec, extra_dataitems
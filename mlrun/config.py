@@ -97,6 +97,23 @@ default_config = {
     # before deleting them
     "runtime_resources_deletion_grace_period": "14400",
     "scrape_metrics": True,
+    # max number of runs in a single bulk store request (e.g. registration of hyper-param iterations)
+    "store_runs_batch_size": 500,
+    # commits of the run state (results, artifacts, iterations) from the execution context (MLClientCtx)
+    "run_state_commits": {
+        # coalesce the commits and write them (only the changed fields) from a background thread, all the pending
+        # commits are flushed when the run is completed
+        "background": False,
+        # interval (seconds) between the background writes
+        "flush_interval": 5,
+    },
+    # time-series metrics logged with log_metric/log_metrics, stored as chunk files under the run artifact path
+    "run_metrics": {
+        # number of buffered metric points which are written as a single chunk
+        "flush_size": 10000,
+        # max points per metric key returned by range queries (longer series are downsampled)
+        "max_points": 1000,
+    },
     # sets the background color that is used in printed tables in jupyter
     "background_color": "#4EC64B",
     "artifact_path": "",  # default artifacts path/url
@@ -109,6 +126,9 @@ default_config = {
         # But if both the server and the client set some value, we want the client to take precedence over the server.
         # By setting the default to None we are able to differentiate between the two cases.
         "generate_target_path_from_artifact_hash": None,
+        # skip the upload of artifacts whose content already exists in their target path, applies to targets which
+        # are generated from the artifact hash (generate_target_path_from_artifact_hash)
+        "deduplicate_uploads": False,
     },
     # FIXME: Adding these defaults here so we won't need to patch the "installing component" (provazio-controller) to
     #  configure this values on field systems, for newer system this will be configured correctly
@@ -121,7 +141,34 @@ default_config = {
         "url": "",
     },
     "v3io_framesd": "http://framesd:8080",
-    "datastore": {"async_source_mode": "disabled"},
+    "datastore": {
+        "async_source_mode": "disabled",
+        # shared connection pool (keep-alive) of the http based data stores (http, v3io)
+        "http": {
+            "pool_connections": 10,
+            "pool_maxsize": 10,
+            # size (bytes) of the chunks of streamed downloads
+            "chunk_size": 1024 * 1024,
+        },
+        # parallel transfers of large objects in the object stores (s3, azure, gcs), objects larger than the
+        # threshold are uploaded in parts (multipart) and downloaded in parallel byte ranges
+        "transfer": {
+            "multipart_threshold": 8 * 1024 * 1024,
+            "part_size": 8 * 1024 * 1024,
+            "max_concurrency": 10,
+            # number of attempts of each part before failing the transfer
+            "max_attempts": 5,
+        },
+        # persistent local disk cache of remote objects (DataItem.local(), as_df(), get_model()), shared by the
+        # processes of the node, the objects are keyed by url and version (artifact hash, etag or size + mtime)
+        "local_cache": {
+            "enabled": False,
+            # defaults to <temp dir>/mlrun-cache
+            "path": "",
+            # max total size (bytes) of the cached objects, least recently used objects are evicted above it
+            "max_size": 10 * 1024 * 1024 * 1024,
+        },
+    },
     # default node selector to be applied to all functions - json string base64 encoded format
     "default_function_node_selector": "e30=",
     # default priority class to be applied to functions running on k8s cluster
@@ -369,6 +416,10 @@ default_config = {
             "user_space": "v3io:///projects/{project}/model-endpoints/{kind}",
         },
         "batch_processing_function_branch": "master",
+        # Number of model endpoints the batch processing job processes concurrently
+        "batch_processing_max_workers": 1,
+        # Keep the endpoints histograms between runs of the batch processing job and read only the new events
+        "batch_processing_incremental": False,
         "parquet_batching_max_events": 10000,
         # See mlrun.api.schemas.ModelEndpointStoreType for available options
         "store_type": "kv",
@@ -410,6 +461,16 @@ default_config = {
         "default_targets": "parquet,nosql",
         "default_job_image": "mlrun/mlrun",
         "flush_interval": 300,
+        # max number of distinct entity keys pushed down as a filter to the offline (parquet) reads
+        # of get_offline_features, above it the entity keys are only used in the join
+        "pushdown_max_keys": 10000,
+        # pipelined ingestion of chunked (iterator) sources with the sync (pandas) engine
+        "ingestion": {
+            # number of threads running the graph over chunks, 1 processes the chunks one after the other
+            "max_workers": 1,
+            # max number of chunks which are read ahead and processed concurrently (bounds the memory)
+            "max_pending_chunks": 4,
+        },
     },
     "ui": {
         "projects_prefix": "projects",  # The UI link prefix for projects
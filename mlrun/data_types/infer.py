@@ -96,6 +96,11 @@ def infer_schema_from_df(
 def get_df_stats(df, options, num_bins=None, sample_size=None):
     """get per column data stats from dataframe"""
 
+    if hasattr(df, "dask"):
+        from .sketch import get_dask_df_stats
+
+        return get_dask_df_stats(df, options, num_bins=num_bins)
+
     results_dict = {}
     if df.empty:
         return results_dict
@@ -108,16 +113,7 @@ def get_df_stats(df, options, num_bins=None, sample_size=None):
     for col, values in df.describe(include="all", datetime_is_numeric=True).items():
         stats_dict = {}
         for stat, val in values.dropna().items():
-            if isinstance(val, (float, np.floating, np.float64)):
-                stats_dict[stat] = float(val)
-            elif isinstance(val, (int, np.integer, np.int64)):
-                # boolean values are considered subclass of int
-                if isinstance(val, bool):
-                    stats_dict[stat] = bool(val)
-                else:
-                    stats_dict[stat] = int(val)
-            else:
-                stats_dict[stat] = str(val)
+            stats_dict[stat] = stats_value_to_dict_value(val)
 
         if InferOptions.get_common_options(
             options, InferOptions.Histogram
@@ -133,6 +129,18 @@ def get_df_stats(df, options, num_bins=None, sample_size=None):
     return results_dict
 
 
+def stats_value_to_dict_value(val):
+    """convert a stats value to a serializable value"""
+    if isinstance(val, (float, np.floating, np.float64)):
+        return float(val)
+    elif isinstance(val, (int, np.integer, np.int64)):
+        # boolean values are considered subclass of int
+        if isinstance(val, bool):
+            return bool(val)
+        return int(val)
+    return str(val)
+
+
 def get_df_preview(df, preview_lines=20):
     """capture preview data from df"""
     # record sample rows from the dataframe
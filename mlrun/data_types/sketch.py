@@ -0,0 +1,399 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np
+import pandas as pd
+
+from .data_types import InferOptions
+
+default_max_centroids = 1000
+default_max_values = 10000
+_hll_precision = 14
+_quantiles = {"25%": 0.25, "50%": 0.5, "75%": 0.75}
+
+
+class QuantileSketch:
+    """mergeable quantile sketch, keeps up to max_centroids weighted centroids (exact below it)"""
+
+    def __init__(self, max_centroids: int = default_max_centroids):
+        self.max_centroids = max_centroids
+        self.values = np.empty(0, dtype=float)
+        self.weights = np.empty(0, dtype=float)
+
+    @property
+    def count(self):
+        return self.weights.sum()
+
+    def update(self, values: np.ndarray):
+        self._add(values.astype(float), np.ones(len(values)))
+
+    def merge(self, other: "QuantileSketch"):
+        self._add(other.values, other.weights)
+
+    def quantile(self, q: float):
+        total = self.count
+        if not total:
+            return np.nan
+        # the centroids are placed at the middle of their cumulative weight, same as the linear
+        # interpolation of pandas/numpy when all the weights are 1 (no compression)
+        positions = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(q * (total - 1) + 0.5, positions, self.values))
+
+    def histogram(self, bins: int, value_range: tuple):
+        hist, edges = np.histogram(
+            self.values, bins=bins, range=value_range, weights=self.weights
+        )
+        return np.rint(hist).astype(int), edges
+
+    def _add(self, values, weights):
+        values = np.concatenate([self.values, values])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        if len(values) > self.max_centroids:
+            # merge adjacent centroids into max_centroids buckets of equal weight
+            total = weights.sum()
+            positions = np.cumsum(weights) - weights / 2
+            buckets = np.minimum(
+                (positions / total * self.max_centroids).astype(int),
+                self.max_centroids - 1,
+            )
+            bucket_weights = np.bincount(buckets, weights=weights)
+            bucket_sums = np.bincount(buckets, weights=values * weights)
+            non_empty = bucket_weights > 0
+            weights = bucket_weights[non_empty]
+            values = bucket_sums[non_empty] / weights
+        self.values, self.weights = values, weights
+
+
+class DistinctCountSketch:
+    """mergeable distinct count sketch (HyperLogLog)"""
+
+    def __init__(self, precision: int = _hll_precision):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        hashes = pd.util.hash_array(np.asarray(values, dtype=object)).astype(np.uint64)
+        indexes = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        remaining = hashes << np.uint64(self.precision)
+        # rank = position of the first set bit in the remaining bits
+        ranks = np.full(len(hashes), 64 - self.precision + 1, dtype=np.uint8)
+        for bit in range(64 - self.precision):
+            is_set = (remaining >> np.uint64(63 - bit)) & np.uint64(1) == 1
+            first_set = is_set & (ranks == 64 - self.precision + 1)
+            ranks[first_set] = bit + 1
+        np.maximum.at(self.registers, indexes, ranks)
+
+    def merge(self, other: "DistinctCountSketch"):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        registers_count = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / registers_count)
+        estimate = (
+            alpha
+            * registers_count**2
+            / np.sum(np.power(2.0, -self.registers.astype(float)))
+        )
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * registers_count and zeros:
+            # small range correction (linear counting)
+            estimate = registers_count * np.log(registers_count / zeros)
+        return int(round(estimate))
+
+
+class _NumericColumnSketch:
+    def __init__(self, max_centroids: int):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.quantiles = QuantileSketch(max_centroids)
+
+    def update(self, series: pd.Series):
+        values = self._to_values(series)
+        if not len(values):
+            return
+        other = _NumericColumnSketch(self.quantiles.max_centroids)
+        other.count = len(values)
+        other.mean = values.mean()
+        other.m2 = ((values - other.mean) ** 2).sum()
+        other.min = values.min()
+        other.max = values.max()
+        other.quantiles.update(values)
+        self.merge(other)
+
+    def merge(self, other: "_NumericColumnSketch"):
+        if not other.count:
+            return
+        # parallel (Chan et al.) update of the mean and sum of squared differences
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.quantiles.merge(other.quantiles)
+
+    def get_stats(self, options, num_bins):
+        if not self.count:
+            return {"count": 0}
+        stats = {
+            "count": self.count,
+            "mean": self.mean,
+            "std": np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan,
+            "min": self.min,
+        }
+        for name, q in _quantiles.items():
+            stats[name] = self.quantiles.quantile(q)
+        stats["max"] = self.max
+        stats = {name: self._from_value(value) for name, value in stats.items()}
+        # same type as the count of pandas describe for numeric columns
+        stats["count"] = float(self.count)
+        if InferOptions.get_common_options(options, InferOptions.Histogram):
+            hist, bins = self.quantiles.histogram(num_bins, (self.min, self.max))
+            stats["hist"] = [hist.tolist(), bins.tolist()]
+        return stats
+
+    def to_categorical(self, max_values: int) -> "_CategoricalColumnSketch":
+        """convert to a categorical sketch (of the quantile centroids, exact below max_centroids), used when the
+        column values are not numeric in a later chunk"""
+        categorical = _CategoricalColumnSketch(max_values)
+        if not self.count:
+            return categorical
+        other = _CategoricalColumnSketch(max_values)
+        other.count = self.count
+        value_counts = (
+            pd.Series(self.quantiles.weights, index=self.quantiles.values)
+            .groupby(level=0)
+            .sum()
+        )
+        other.value_counts = {
+            self._from_value(value): int(round(count))
+            for value, count in value_counts.items()
+        }
+        other.distinct.update(list(other.value_counts.keys()))
+        categorical.merge(other)
+        return categorical
+
+    @staticmethod
+    def _to_values(series):
+        return series.dropna().to_numpy(dtype=float)
+
+    @staticmethod
+    def _from_value(value):
+        return value
+
+
+class _DatetimeColumnSketch(_NumericColumnSketch):
+    def __init__(self, max_centroids: int, tz=None):
+        super().__init__(max_centroids)
+        self.tz = tz
+
+    def get_stats(self, options, num_bins):
+        stats = super().get_stats(InferOptions.Null, num_bins)
+        # same as the pandas describe of datetime columns
+        stats.pop("std", None)
+        return stats
+
+    @staticmethod
+    def _to_values(series):
+        return series.dropna().astype("int64").to_numpy(dtype=float)
+
+    def _from_value(self, value):
+        if isinstance(value, float) and np.isnan(value):
+            return value
+        timestamp = pd.Timestamp(int(round(value)))
+        if self.tz:
+            timestamp = timestamp.tz_localize("UTC").tz_convert(self.tz)
+        return timestamp
+
+
+class _CategoricalColumnSketch:
+    def __init__(self, max_values: int, is_bool: bool = False):
+        self.max_values = max_values
+        self.is_bool = is_bool
+        self.count = 0
+        self.value_counts = {}
+        self.overflow = False
+        self.distinct = DistinctCountSketch()
+
+    def update(self, series: pd.Series):
+        series = series.dropna()
+        if not len(series):
+            return
+        other = _CategoricalColumnSketch(self.max_values, self.is_bool)
+        other.count = len(series)
+        other.value_counts = series.value_counts(sort=False).to_dict()
+        other.distinct.update(series.to_numpy())
+        self.merge(other)
+
+    def merge(self, other: "_CategoricalColumnSketch"):
+        self.count += other.count
+        for value, count in other.value_counts.items():
+            self.value_counts[value] = self.value_counts.get(value, 0) + count
+        self.overflow = self.overflow or other.overflow
+        if len(self.value_counts) > self.max_values:
+            # keep the most frequent values (the top value and its frequency become approximate)
+            self.overflow = True
+            self.value_counts = dict(
+                sorted(self.value_counts.items(), key=lambda item: -item[1])[
+                    : self.max_values
+                ]
+            )
+        self.distinct.merge(other.distinct)
+
+    def get_stats(self, options, num_bins):
+        stats = {"count": self.count}
+        if not self.count:
+            return stats
+        top, freq = max(self.value_counts.items(), key=lambda item: item[1])
+        stats["unique"] = (
+            self.distinct.estimate() if self.overflow else len(self.value_counts)
+        )
+        stats["top"] = np.bool_(top) if self.is_bool else top
+        stats["freq"] = freq
+        if self.is_bool and InferOptions.get_common_options(
+            options, InferOptions.Histogram
+        ):
+            # boolean columns are numeric in pandas and get a histogram as well
+            hist, bins = np.histogram(
+                np.array(list(self.value_counts.keys()), dtype=float),
+                bins=num_bins,
+                weights=list(self.value_counts.values()),
+            )
+            stats["hist"] = [hist.astype(int).tolist(), bins.tolist()]
+        return stats
+
+
+class DFStatsSketch:
+    """mergeable per column statistics of dataframes, updated chunk by chunk (or partition by partition) and merged
+    across workers, with bounded memory. produces the same stats structure as get_df_stats (count, mean, std, min,
+    quantiles, max and histogram of numeric columns, count, unique, top and freq of the other columns), the
+    quantiles and histograms are approximated once the number of values exceeds max_centroids
+
+    example::
+
+        sketch = DFStatsSketch()
+        for chunk in pd.read_csv("data.csv", chunksize=100000):
+            sketch.update(chunk)
+        stats = sketch.get_stats()
+    """
+
+    def __init__(
+        self,
+        options: InferOptions = InferOptions.default(),
+        max_centroids: int = default_max_centroids,
+        max_values: int = default_max_values,
+    ):
+        self.options = options
+        self.max_centroids = max_centroids
+        self.max_values = max_values
+        self.columns = {}
+
+    def update(self, df: pd.DataFrame):
+        """update the statistics with a dataframe (chunk)"""
+        if InferOptions.get_common_options(self.options, InferOptions.Index) and (
+            df.index.names
+        ):
+            df = df.reset_index()
+        for column in df.columns:
+            series = df[column]
+            column_sketch = self.columns.get(column)
+            if column_sketch is None or (
+                not column_sketch.count and series.notna().any()
+            ):
+                # the column type is set by the first chunk with values (e.g. not by an all NaN chunk)
+                column_sketch = self._create_column_sketch(series)
+            elif series.notna().any() and not isinstance(
+                column_sketch, _CategoricalColumnSketch
+            ):
+                chunk_sketch = self._create_column_sketch(series)
+                if type(chunk_sketch) is not type(column_sketch):
+                    # the column type changed between chunks (e.g. strings after numbers), count it as categorical
+                    column_sketch = column_sketch.to_categorical(self.max_values)
+            self.columns[column] = column_sketch
+            column_sketch.update(series)
+        return self
+
+    def merge(self, other: "DFStatsSketch"):
+        """merge the statistics of another sketch (e.g. of another partition) into this sketch"""
+        for column, column_sketch in other.columns.items():
+            current = self.columns.get(column)
+            if current is None or (not current.count and column_sketch.count):
+                self.columns[column] = column_sketch
+            elif not column_sketch.count:
+                continue
+            elif type(current) is type(column_sketch):
+                current.merge(column_sketch)
+            else:
+                # the column type differs between the partitions, count it as categorical
+                current = self._to_categorical(current)
+                current.merge(self._to_categorical(column_sketch))
+                self.columns[column] = current
+        return self
+
+    def get_stats(self, num_bins: int = None) -> dict:
+        """return the per column stats dict"""
+        from .infer import default_num_bins, stats_value_to_dict_value
+
+        num_bins = num_bins or default_num_bins
+        results_dict = {}
+        for column, column_sketch in self.columns.items():
+            stats = column_sketch.get_stats(self.options, num_bins)
+            results_dict[column] = {
+                stat: stats_value_to_dict_value(value) if stat != "hist" else value
+                for stat, value in stats.items()
+                if not (isinstance(value, float) and np.isnan(value))
+            }
+        return results_dict
+
+    def _to_categorical(self, column_sketch):
+        if isinstance(column_sketch, _CategoricalColumnSketch):
+            return column_sketch
+        return column_sketch.to_categorical(self.max_values)
+
+    def _create_column_sketch(self, series: pd.Series):
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return _DatetimeColumnSketch(
+                self.max_centroids, tz=getattr(series.dtype, "tz", None)
+            )
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(
+            series
+        ):
+            return _NumericColumnSketch(self.max_centroids)
+        return _CategoricalColumnSketch(
+            self.max_values, is_bool=pd.api.types.is_bool_dtype(series)
+        )
+
+
+def get_dask_df_stats(df, options, num_bins=None):
+    """get per column data stats from a dask dataframe, the partitions are sketched by the workers and merged"""
+    import dask
+
+    def sketch_partition(partition):
+        return DFStatsSketch(options).update(partition)
+
+    def merge_sketches(sketches):
+        merged = DFStatsSketch(options)
+        for sketch in sketches:
+            merged.merge(sketch)
+        return merged
+
+    sketches = [dask.delayed(sketch_partition)(part) for part in df.to_delayed()]
+    merged = dask.delayed(merge_sketches)(sketches).compute()
+    return merged.get_stats(num_bins)
@@ -34,7 +34,16 @@ class AzureBlobStore(DataStore):
 
         con_string = self._get_secret_or_env("AZURE_STORAGE_CONNECTION_STRING")
         if con_string:
-            self.bsc = BlobServiceClient.from_connection_string(con_string)
+            # blobs larger than the threshold are transferred in parallel blocks/chunks
+            transfer_config = mlrun.mlconf.datastore.transfer
+            self.bsc = BlobServiceClient.from_connection_string(
+                con_string,
+                max_single_put_size=int(transfer_config.multipart_threshold),
+                max_block_size=int(transfer_config.part_size),
+                max_single_get_size=int(transfer_config.multipart_threshold),
+                max_chunk_get_size=int(transfer_config.part_size),
+                retry_total=int(transfer_config.max_attempts),
+            )
         else:
             self.get_filesystem()
 
@@ -84,11 +93,32 @@ class AzureBlobStore(DataStore):
                 container=self.endpoint, blob=key[1:]
             ) as blob_client:
                 with open(src_path, "rb") as data:
-                    blob_client.upload_blob(data, overwrite=True)
+                    blob_client.upload_blob(
+                        data,
+                        overwrite=True,
+                        max_concurrency=int(
+                            mlrun.mlconf.datastore.transfer.max_concurrency
+                        ),
+                    )
         else:
             remote_path = self._convert_key_to_remote_path(key)
             self._filesystem.put_file(src_path, remote_path, overwrite=True)
 
+    def download(self, key, target_path):
+        if self.bsc:
+            with self.bsc.get_blob_client(
+                container=self.endpoint, blob=key[1:]
+            ) as blob_client:
+                with open(target_path, "wb") as fp:
+                    blob_client.download_blob(
+                        max_concurrency=int(
+                            mlrun.mlconf.datastore.transfer.max_concurrency
+                        )
+                    ).readinto(fp)
+        else:
+            remote_path = self._convert_key_to_remote_path(key)
+            self._filesystem.get_file(remote_path, target_path)
+
     def get(self, key, size=None, offset=0):
         if self.bsc:
             with self.bsc.get_blob_client(
@@ -11,9 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 import sys
 import tempfile
+import threading
 from base64 import b64encode
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
 from os import path, remove
 
 import dask.dataframe as dd
@@ -21,22 +25,27 @@ import fsspec
 import orjson
 import pandas as pd
 import requests
+import requests.adapters
 import urllib3
 
 import mlrun.errors
 from mlrun.errors import err_to_str
 from mlrun.utils import is_ipython, logger
 
+from .cache import get_local_cache, get_object_version
+from .utils import and_filters
+
 verify_ssl = False
 if not verify_ssl:
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
 class FileStats:
-    def __init__(self, size, modified, content_type=None):
+    def __init__(self, size, modified, content_type=None, etag=None):
         self.size = size
         self.modified = modified
         self.content_type = content_type
+        self.etag = etag
 
     def __repr__(self):
         return f"FileStats(size={self.size}, modified={self.modified}, type={self.content_type})"
@@ -132,6 +141,10 @@ class DataStore:
             fp.write(data)
             fp.close()
 
+    def iter_content(self, key, chunk_size=None):
+        """iterate over the object content in chunks of bytes"""
+        yield self.get(key)
+
     def upload(self, key, src_path):
         pass
 
@@ -180,7 +193,8 @@ class DataStore:
                         filters,
                         time_column,
                     )
-                    kwargs["filters"] = filters
+                    # keep the filters pushed down by the caller (e.g. columns or keys)
+                    kwargs["filters"] = and_filters(filters, kwargs.get("filters"))
 
                 return df_module.read_parquet(*args, **kwargs)
 
@@ -323,6 +337,14 @@ class DataItem:
         """
         self._store.download(self._path, target_path)
 
+    def iter_content(self, chunk_size=None):
+        """iterate over the content in chunks of bytes, without reading all of it into memory (when supported by
+        the data store)
+
+        :param chunk_size: size of the chunks in bytes (may be ignored by some data stores)
+        """
+        return self._store.iter_content(self._path, chunk_size=chunk_size)
+
     def put(self, data, append=False):
         """write/upload the data, append is only supported by some datastores
 
@@ -367,12 +389,30 @@ class DataItem:
 
         dot = self._path.rfind(".")
         suffix = "" if dot == -1 else self._path[dot:]
+        cached_path = self._get_cached_path(suffix)
+        if cached_path:
+            self._local_path = cached_path
+            return self._local_path
+
         temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
         self._local_path = temp_file.name
         logger.info(f"downloading {self.url} to local temp file")
         self.download(self._local_path)
         return self._local_path
 
+    def _get_cached_path(self, suffix=""):
+        """return the path of the object in the local disk cache, None if the cache is disabled or the object
+        version cannot be determined (e.g. directories or stores without stat)"""
+        cache = get_local_cache()
+        if not cache or self.kind in ["file", "memory"]:
+            return None
+        version = get_object_version(self)
+        if not version:
+            return None
+        return cache.get_local_path(
+            self._url, version, download=self.download, suffix=suffix
+        )
+
     def as_df(
         self,
         columns=None,
@@ -386,6 +426,12 @@ class DataItem:
         :param df_module: optional, py module used to create the DataFrame (e.g. pd, dd, cudf, ..)
         :param format:    file format, if not specified it will be deducted from the suffix
         """
+        if df_module != dd:
+            cached_path = self._get_cached_path(self.suffix)
+            if cached_path:
+                return mlrun.datastore.store_manager.object(url=cached_path).as_df(
+                    columns=columns, df_module=df_module, format=format, **kwargs
+                )
         return self._store.as_df(
             self._url,
             self._path,
@@ -449,37 +495,67 @@ def basic_auth_header(user, password):
     return {"Authorization": authstr}
 
 
-def http_get(url, headers=None, auth=None):
+_http_session = None
+_http_session_pid = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """get the http session shared by the http based data stores, it keeps a pool of keep-alive connections so
+    requests (e.g. upload chunks) to the same host don't open a new connection each time"""
+    global _http_session, _http_session_pid
+    # connections can't be shared with forked processes, each process gets its own session
+    if _http_session is None or _http_session_pid != os.getpid():
+        with _http_session_lock:
+            if _http_session is None or _http_session_pid != os.getpid():
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=int(mlrun.mlconf.datastore.http.pool_connections),
+                    pool_maxsize=int(mlrun.mlconf.datastore.http.pool_maxsize),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _http_session = session
+                _http_session_pid = os.getpid()
+    return _http_session
+
+
+def _http_request(method, url, headers=None, auth=None, **kwargs):
     try:
-        response = requests.get(url, headers=headers, auth=auth, verify=verify_ssl)
+        response = get_http_session().request(
+            method, url, headers=headers, auth=auth, verify=verify_ssl, **kwargs
+        )
     except OSError as exc:
         raise OSError(f"error: cannot connect to {url}: {err_to_str(exc)}")
 
     mlrun.errors.raise_for_status(response)
 
-    return response.content
+    return response
 
 
-def http_head(url, headers=None, auth=None):
-    try:
-        response = requests.head(url, headers=headers, auth=auth, verify=verify_ssl)
-    except OSError as exc:
-        raise OSError(f"error: cannot connect to {url}: {err_to_str(exc)}")
+def http_get(url, headers=None, auth=None):
+    return _http_request("get", url, headers, auth).content
 
-    mlrun.errors.raise_for_status(response)
 
-    return response.headers
+def http_iter_content(url, headers=None, auth=None, chunk_size=None):
+    """stream the response body in chunks instead of reading all of it into memory"""
+    chunk_size = chunk_size or int(mlrun.mlconf.datastore.http.chunk_size)
+    with _http_request("get", url, headers, auth, stream=True) as response:
+        yield from response.iter_content(chunk_size=chunk_size)
 
 
-def http_put(url, data, headers=None, auth=None):
-    try:
-        response = requests.put(
-            url, data=data, headers=headers, auth=auth, verify=verify_ssl
-        )
-    except OSError as exc:
-        raise OSError(f"error: cannot connect to {url}: {err_to_str(exc)}")
+def http_download(url, target_path, headers=None, auth=None, chunk_size=None):
+    with open(target_path, "wb") as fp:
+        for chunk in http_iter_content(url, headers, auth, chunk_size):
+            fp.write(chunk)
 
-    mlrun.errors.raise_for_status(response)
+
+def http_head(url, headers=None, auth=None):
+    return _http_request("head", url, headers, auth).headers
+
+
+def http_put(url, data, headers=None, auth=None):
+    _http_request("put", url, headers, auth, data=data)
 
 
 def http_upload(url, file_path, headers=None, auth=None):
@@ -508,9 +584,35 @@ class HttpStore(DataStore):
         raise ValueError("unimplemented")
 
     def get(self, key, size=None, offset=0):
-        data = http_get(self.url + self._join(key), None, self.auth)
-        if offset:
+        headers = None
+        if size or offset:
+            headers = {"Range": get_range(size, offset)}
+        response = _http_request("get", self.url + self._join(key), headers, self.auth)
+        data = response.content
+        # servers which don't support range requests return the whole object
+        if offset and response.status_code != HTTPStatus.PARTIAL_CONTENT.value:
             data = data[offset:]
         if size:
             data = data[:size]
         return data
+
+    def stat(self, key):
+        headers = http_head(self.url + self._join(key), None, self.auth)
+        size = headers.get("Content-Length")
+        modified = headers.get("Last-Modified")
+        if modified:
+            modified = parsedate_to_datetime(modified).timestamp()
+        return FileStats(
+            int(size) if size else None,
+            modified,
+            content_type=headers.get("Content-Type"),
+            etag=headers.get("ETag"),
+        )
+
+    def download(self, key, target_path):
+        http_download(self.url + self._join(key), target_path, None, self.auth)
+
+    def iter_content(self, key, chunk_size=None):
+        return http_iter_content(
+            self.url + self._join(key), None, self.auth, chunk_size
+        )
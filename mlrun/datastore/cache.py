@@ -0,0 +1,172 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import os
+import tempfile
+import threading
+from os import path
+
+import mlrun
+from mlrun.utils import logger
+
+_temp_suffix = ".tmp"
+
+
+class LocalFileCache:
+    """persistent, size bounded, local disk cache of remote objects
+
+    the objects are stored under a file name derived from the object url and version, new objects are downloaded
+    into a temp file and atomically renamed into place, so multiple processes on the same node can share the cache
+    directory safely. the file modification time is refreshed on every hit and the least recently used objects are
+    evicted when the total size of the cache exceeds max_size.
+
+    the cached files are shared, and must not be modified by the users
+    """
+
+    def __init__(self, cache_path: str, max_size: int):
+        self.path = cache_path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    def get_stats(self) -> dict:
+        """return the cache hit/miss/eviction counters and its current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": sum(entry.stat().st_size for entry in self._list_entries()),
+        }
+
+    def get_local_path(self, url: str, version: str, download, suffix: str = ""):
+        """return the local path of a cached object, download the object into the cache if missing
+
+        :param url:      object url
+        :param version:  object version (e.g. hash or size + modification time), a new version is a new entry
+        :param download: function which downloads the object to a given local path
+        :param suffix:   file suffix (extension) of the cached file
+        """
+        key = hashlib.sha256(f"{url}:{version}".encode()).hexdigest()
+        local_path = path.join(self.path, key + suffix)
+        try:
+            # refresh the modification time which is used for the LRU eviction
+            os.utime(local_path)
+            self._count("hits")
+            return local_path
+        except FileNotFoundError:
+            pass
+
+        self._count("misses")
+        fd, temp_path = tempfile.mkstemp(suffix=_temp_suffix, prefix=key, dir=self.path)
+        os.close(fd)
+        try:
+            download(temp_path)
+            os.replace(temp_path, local_path)
+        except Exception:
+            if path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        logger.debug("Added object to the local cache", url=url, path=local_path)
+        self.evict(keep=local_path)
+        return local_path
+
+    def evict(self, keep: str = None):
+        """evict the least recently used objects until the cache size is below max_size"""
+        entries = []
+        total_size = 0
+        for entry in self._list_entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # removed by another process
+                continue
+            total_size += stat.st_size
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if entry_path == keep:
+                continue
+            try:
+                os.remove(entry_path)
+                self._count("evictions")
+            except FileNotFoundError:
+                # already evicted by another process
+                pass
+            total_size -= size
+
+    def clear(self):
+        """remove all the cached objects"""
+        for entry in self._list_entries():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def _list_entries(self):
+        return [
+            entry
+            for entry in os.scandir(self.path)
+            if entry.is_file() and not entry.name.endswith(_temp_suffix)
+        ]
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+_local_cache: LocalFileCache = None
+_local_cache_lock = threading.Lock()
+
+
+def get_local_cache() -> LocalFileCache:
+    """return the local disk cache of remote objects, None when the cache is disabled"""
+    global _local_cache
+    cache_config = mlrun.mlconf.datastore.local_cache
+    if not cache_config.enabled:
+        return None
+    cache_path = cache_config.path or path.join(tempfile.gettempdir(), "mlrun-cache")
+    max_size = int(cache_config.max_size)
+    with _local_cache_lock:
+        if (
+            _local_cache is None
+            or _local_cache.path != cache_path
+            or _local_cache.max_size != max_size
+        ):
+            _local_cache = LocalFileCache(cache_path, max_size)
+    return _local_cache
+
+
+def get_object_version(data_item) -> str:
+    """return the version of a remote object used as its cache key (artifact hash, etag or size + modification
+    time), None if it cannot be determined"""
+    object_hash = getattr(data_item.meta, "hash", None)
+    if object_hash:
+        return object_hash
+    try:
+        stats = data_item.stat()
+    except Exception:
+        return None
+    if not stats:
+        return None
+    etag = getattr(stats, "etag", None)
+    if etag:
+        return etag
+    if stats.size is None or not stats.modified:
+        return None
+    return f"{stats.size}-{stats.modified}"
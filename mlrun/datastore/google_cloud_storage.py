@@ -106,7 +106,18 @@ class GoogleCloudStorageStore(DataStore):
 
     def upload(self, key, src_path):
         path = self._prepare_path_and_verify_filesystem(key)
-        self._filesystem.put_file(src_path, path, overwrite=True)
+        # files larger than the chunk size are sent as a resumable upload, failed chunks are retried
+        self._filesystem.put_file(
+            src_path,
+            path,
+            overwrite=True,
+            chunksize=int(mlrun.mlconf.datastore.transfer.part_size),
+        )
+
+    def download(self, key, target_path):
+        path = self._prepare_path_and_verify_filesystem(key)
+        # stream the object straight to the target file instead of reading it into memory
+        self._filesystem.get_file(path, target_path)
 
     def stat(self, key):
         path = self._prepare_path_and_verify_filesystem(key)
@@ -15,7 +15,9 @@
 import time
 
 import boto3
+import botocore.config
 import fsspec
+from boto3.s3.transfer import TransferConfig
 
 import mlrun.errors
 
@@ -36,6 +38,13 @@ class S3Store(DataStore):
         profile_name = self._get_secret_or_env("AWS_PROFILE")
         assume_role_arn = self._get_secret_or_env("MLRUN_AWS_ROLE_ARN")
 
+        # the connection pool has to fit the concurrent parts of the parallel transfers, failed parts are retried
+        transfer_config = mlrun.mlconf.datastore.transfer
+        config = botocore.config.Config(
+            max_pool_connections=max(int(transfer_config.max_concurrency), 10),
+            retries={"max_attempts": int(transfer_config.max_attempts)},
+        )
+
         # If user asks to assume a role, this needs to go through the STS client and retrieve temporary creds
         if assume_role_arn:
             client = boto3.client(
@@ -56,6 +65,7 @@ class S3Store(DataStore):
                 aws_secret_access_key=self._temp_credentials["SecretAccessKey"],
                 aws_session_token=self._temp_credentials["SessionToken"],
                 endpoint_url=endpoint_url,
+                config=config,
             )
             return
 
@@ -67,6 +77,7 @@ class S3Store(DataStore):
                 "s3",
                 region_name=region,
                 endpoint_url=endpoint_url,
+                config=config,
             )
             return
 
@@ -77,11 +88,12 @@ class S3Store(DataStore):
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 endpoint_url=endpoint_url,
+                config=config,
             )
         else:
             # from env variables
             self.s3 = boto3.resource(
-                "s3", region_name=region, endpoint_url=endpoint_url
+                "s3", region_name=region, endpoint_url=endpoint_url, config=config
             )
             # If not using credentials, boto will still attempt to sign the requests, and will fail any operations
             # due to no credentials found. These commands disable signing and allow anonymous mode (same as
@@ -137,9 +149,26 @@ class S3Store(DataStore):
 
         return storage_options
 
+    @staticmethod
+    def _get_transfer_config():
+        transfer_config = mlrun.mlconf.datastore.transfer
+        return TransferConfig(
+            multipart_threshold=int(transfer_config.multipart_threshold),
+            multipart_chunksize=int(transfer_config.part_size),
+            max_concurrency=int(transfer_config.max_concurrency),
+            num_download_attempts=int(transfer_config.max_attempts),
+        )
+
     def upload(self, key, src_path):
-        self.s3.Object(self.endpoint, self._join(key)[1:]).put(
-            Body=open(src_path, "rb")
+        # large files are uploaded in parallel parts (multipart upload), failed parts are retried individually
+        self.s3.Object(self.endpoint, self._join(key)[1:]).upload_file(
+            src_path, Config=self._get_transfer_config()
+        )
+
+    def download(self, key, target_path):
+        # large objects are downloaded in parallel byte ranges straight to the target file
+        self.s3.Object(self.endpoint, self._join(key)[1:]).download_file(
+            target_path, Config=self._get_transfer_config()
         )
 
     def get(self, key, size=None, offset=0):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import ast
 from urllib.parse import urlparse
 
 
@@ -44,3 +45,127 @@ def parse_kafka_url(url, bootstrap_servers=None):
     topic = url.path
     topic = topic.lstrip("/")
     return topic, bootstrap_servers
+
+
+# "!=" and "not in" are left out since pandas keeps null values for them while pyarrow filters them out
+_filter_operators = {
+    ast.Eq: "==",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+}
+_reversed_filter_operators = {
+    "==": "==",
+    "<": ">",
+    "<=": ">=",
+    ">": "<",
+    ">=": "<=",
+}
+
+
+def and_filters(*filters):
+    """combine (AND) pyarrow filters, each given as a list of tuples or in DNF form (list of lists of tuples)
+
+    :return: combined filters in DNF form, or None if there are no filters
+    """
+    result = [[]]
+    for dnf in filters:
+        if not dnf:
+            continue
+        if not isinstance(dnf[0], list):
+            dnf = [dnf]
+        result = [conjunction + other for conjunction in result for other in dnf]
+    return result if result != [[]] else None
+
+
+def select_filters(filters, columns: dict):
+    """return only the parts of DNF filters which refer to the given columns
+
+    conditions on other columns are dropped, so the result may select more rows than the original filters,
+    but never less. returns None if every conjunction depends on other columns
+
+    :param filters: filters in DNF form
+    :param columns: dict of filter column name -> name to use for it in the result filters
+    """
+    result = []
+    for conjunction in filters or []:
+        selected = [
+            (columns[column], operator, value)
+            for column, operator, value in conjunction
+            if column in columns
+        ]
+        if not selected:
+            return None
+        result.append(selected)
+    return result or None
+
+
+def query_to_filters(query: str):
+    """convert a pandas query expression to pyarrow filters in DNF form
+
+    e.g. "a > 1 and (b == 'x' or b in ['y', 'z'])" -> [[("a", ">", 1), ("b", "==", "x")],
+    [("a", ">", 1), ("b", "in", ["y", "z"])]]. parts of a conjunction which cannot be converted
+    (e.g. expressions, functions, local variables) are left out, so the filters may select more rows
+    than the query and the query should still be applied to the result
+
+    :return: filters in DNF form, or None if the query cannot be converted
+    """
+    try:
+        tree = ast.parse(query.strip(), mode="eval")
+    except SyntaxError:
+        return None
+    return _query_node_to_filters(tree.body)
+
+
+def _query_node_to_filters(node):
+    if isinstance(node, ast.BoolOp):
+        is_and = isinstance(node.op, ast.And)
+        values = node.values
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+        is_and = isinstance(node.op, ast.BitAnd)
+        values = [node.left, node.right]
+    elif isinstance(node, ast.Compare):
+        conjunction = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            condition = _comparison_to_filter(left, op, right)
+            if condition:
+                conjunction.append(condition)
+            left = right
+        return [conjunction] if conjunction else None
+    else:
+        return None
+
+    parts = [_query_node_to_filters(value) for value in values]
+    if is_and:
+        return and_filters(*parts)
+    if any(part is None for part in parts):
+        # a branch of the "or" cannot be converted, so any row may match
+        return None
+    return [conjunction for part in parts for conjunction in part]
+
+
+def _comparison_to_filter(left, op, right):
+    operator = _filter_operators.get(type(op))
+    if operator is None:
+        return None
+    if isinstance(left, ast.Name) and not isinstance(right, ast.Name):
+        column, value_node = left.id, right
+    elif isinstance(right, ast.Name) and operator in _reversed_filter_operators:
+        column, value_node = right.id, left
+        operator = _reversed_filter_operators[operator]
+    else:
+        return None
+    try:
+        value = ast.literal_eval(value_node)
+    except ValueError:
+        return None
+    if operator == "in":
+        if not isinstance(value, (list, tuple, set)):
+            return None
+        value = list(value)
+    elif isinstance(value, (list, tuple, set, dict)) or value is None:
+        return None
+    return column, operator, value
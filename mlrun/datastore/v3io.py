@@ -29,8 +29,10 @@ from .base import (
     FileStats,
     basic_auth_header,
     get_range,
+    http_download,
     http_get,
     http_head,
+    http_iter_content,
     http_put,
     http_upload,
 )
@@ -131,6 +133,14 @@ class V3ioStore(DataStore):
             headers["Range"] = get_range(size, offset)
         return http_get(self.url + self._join(key), headers)
 
+    def download(self, key, target_path):
+        http_download(self.url + self._join(key), target_path, self.headers)
+
+    def iter_content(self, key, chunk_size=None):
+        return http_iter_content(
+            self.url + self._join(key), self.headers, chunk_size=chunk_size
+        )
+
     def _put(self, key, data, max_chunk_size: int = ONE_GB):
         """helper function for put method, allows for controlling max_chunk_size in testing"""
         buffer_size = len(data)  # in bytes
@@ -44,6 +44,15 @@ class RunDBInterface(ABC):
     def store_run(self, struct, uid, project="", iter=0):
         pass
 
+    def store_runs(self, runs: List[dict], project=""):
+        for run in runs:
+            self.store_run(
+                run,
+                run["metadata"]["uid"],
+                project,
+                iter=run["metadata"].get("iteration", 0),
+            )
+
     @abstractmethod
     def update_run(self, updates: dict, uid, project="", iter=0):
         pass
@@ -76,6 +85,7 @@ class RunDBInterface(ABC):
         partition_sort_by: Union[schemas.SortField, str] = None,
         partition_order: Union[schemas.OrderType, str] = schemas.OrderType.desc,
         max_partitions: int = 0,
+        fields: List[str] = None,
     ):
         pass
 
@@ -126,6 +136,32 @@ class RunDBInterface(ABC):
     def read_metric(self, keys, project="", query=""):
         warnings.warn("store_metric not implemented yet")
 
+    def read_run_metrics(
+        self,
+        uid,
+        project="",
+        iter=0,
+        keys: List[str] = None,
+        start_step: int = None,
+        end_step: int = None,
+        max_points: int = None,
+    ) -> dict:
+        """read the time-series metrics (logged with log_metric/log_metrics) of a run, long series are downsampled,
+        see :py:func:`~mlrun.utils.run_metrics.read_run_metrics`"""
+        from mlrun.utils.run_metrics import get_run_metrics_path, read_run_metrics
+
+        run = self.read_run(uid, project, iter=iter)
+        artifact_path = run.get("spec", {}).get("output_path")
+        if not artifact_path:
+            return {}
+        return read_run_metrics(
+            get_run_metrics_path(artifact_path, uid, iter),
+            keys=keys,
+            start_step=start_step,
+            end_step=end_step,
+            max_points=max_points,
+        )
+
     @abstractmethod
     def store_function(self, function, name, project="", tag="", versioned=False):
         pass
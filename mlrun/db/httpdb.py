@@ -19,7 +19,7 @@ import traceback
 import warnings
 from datetime import datetime
 from os import path, remove
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 import kfp
 import requests
@@ -495,6 +495,22 @@ class HTTPRunDB(RunDBInterface):
         body = _as_json(struct)
         self.api_call("POST", path, error, params=params, body=body)
 
+    def store_runs(self, runs: List[dict], project=""):
+        """Store the details of multiple runs (e.g. the iterations of a hyper-param job) in the DB, the runs are
+        sent in batches of ``mlconf.store_runs_batch_size`` runs per request.
+
+        :param runs: List of run dicts (with their metadata uid and iteration).
+        :param project: Project of the runs.
+        """
+
+        project = project or config.default_project
+        path = f"projects/{project}/runs"
+        error = f"store runs {project}"
+        batch_size = int(config.store_runs_batch_size)
+        for start in range(0, len(runs), batch_size):
+            body = _as_json({"runs": runs[start : start + batch_size]})
+            self.api_call("POST", path, error, body=body)
+
     def update_run(self, updates: dict, uid, project="", iter=0):
         """Update the details of a stored run in the DB."""
 
@@ -529,6 +545,43 @@ class HTTPRunDB(RunDBInterface):
         resp = self.api_call("GET", path, error, params=params)
         return resp.json()["data"]
 
+    def read_run_metrics(
+        self,
+        uid,
+        project="",
+        iter=0,
+        keys: List[str] = None,
+        start_step: int = None,
+        end_step: int = None,
+        max_points: int = None,
+    ) -> dict:
+        """Read the time-series metrics of a run (logged with ``log_metric``/``log_metrics``). Series longer than
+        ``max_points`` are downsampled by the server, each point of a downsampled series holds the mean, min and max
+        values of a range of steps.
+
+        :param uid: The run's unique ID.
+        :param project: Project name.
+        :param iter: Iteration within a specific execution.
+        :param keys: Metric keys to read (all the keys by default).
+        :param start_step: Read points from this step (inclusive).
+        :param end_step: Read points up to this step (inclusive).
+        :param max_points: Max points per metric key (0 for no downsampling).
+        :returns: Dict of metric key to its series, e.g. ``{"loss": {"step": [..], "timestamp": [..],
+            "value": [..]}}``.
+        """
+
+        path = self._path_of("run", project, uid) + "/metrics"
+        params = {
+            "iter": iter,
+            "key": keys or [],
+            "start-step": start_step,
+            "end-step": end_step,
+            "max-points": max_points,
+        }
+        error = f"get run metrics {project}/{uid}"
+        resp = self.api_call("GET", path, error, params=params)
+        return resp.json()["data"]
+
     def del_run(self, uid, project="", iter=0):
         """Delete details of a specific run from DB.
 
@@ -561,6 +614,7 @@ class HTTPRunDB(RunDBInterface):
         partition_sort_by: Union[schemas.SortField, str] = None,
         partition_order: Union[schemas.OrderType, str] = schemas.OrderType.desc,
         max_partitions: int = 0,
+        fields: List[str] = None,
     ) -> RunList:
         """Retrieve a list of runs, filtered by various options.
         Example::
@@ -594,6 +648,9 @@ class HTTPRunDB(RunDBInterface):
         :param partition_order: Order of sorting within partitions - `asc` or `desc`. Default is `desc`.
         :param max_partitions: Maximal number of partitions to include in the result. Default is `0` which means no
             limit.
+        :param fields: Return only these fields of each run (e.g. ``["metadata.name", "status.state"]``) instead of
+            the whole run object. Listing only fields which are stored as DB columns (name, uid, project, iteration,
+            kind label, state, results, start time and last update) doesn't load the run bodies at all.
         """
 
         project = project or config.default_project
@@ -602,6 +659,7 @@ class HTTPRunDB(RunDBInterface):
             "uid": uid,
             "project": project,
             "label": labels or [],
+            "field": fields or [],
             "state": state,
             "sort": bool2str(sort),
             "iter": bool2str(iter),
@@ -626,6 +684,60 @@ class HTTPRunDB(RunDBInterface):
         resp = self.api_call("GET", "runs", error, params=params)
         return RunList(resp.json()["runs"])
 
+    def iter_runs(
+        self,
+        name=None,
+        uid: Optional[Union[str, List[str]]] = None,
+        project=None,
+        labels=None,
+        state=None,
+        iter=False,
+        start_time_from: datetime = None,
+        start_time_to: datetime = None,
+        last_update_time_from: datetime = None,
+        last_update_time_to: datetime = None,
+        fields: List[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Lazily iterate over runs (sorted by start time, newest first), fetching them from the API a page at a time,
+        so large projects can be scanned in constant memory.
+
+        Example::
+
+            for run in db.iter_runs(project='iris', fields=['metadata.name', 'status.state']):
+                print(run['metadata']['name'], run['status']['state'])
+
+        :param page_size: Number of runs to fetch per API call.
+
+        See :py:func:`~list_runs` for the other parameters.
+        """
+        params = {
+            "name": name,
+            "uid": uid,
+            "project": project or config.default_project,
+            "label": labels or [],
+            "field": fields or [],
+            "state": state,
+            "iter": bool2str(iter),
+            "start_time_from": datetime_to_iso(start_time_from),
+            "start_time_to": datetime_to_iso(start_time_to),
+            "last_update_time_from": datetime_to_iso(last_update_time_from),
+            "last_update_time_to": datetime_to_iso(last_update_time_to),
+        }
+        return self._iter_pages("runs", "runs", "list runs", params, page_size)
+
+    def _iter_pages(
+        self, path: str, key: str, error: str, params: dict, page_size: int
+    ) -> Iterator[dict]:
+        params = dict(params, **{"page-size": page_size})
+        while True:
+            response = self.api_call("GET", path, error, params=params).json()
+            yield from response[key]
+            page_token = response.get("next_page_token")
+            if not page_token:
+                return
+            params["page-token"] = page_token
+
     def del_runs(self, name=None, project=None, labels=None, state=None, days_ago=0):
         """Delete a group of runs identified by the parameters of the function.
 
@@ -764,6 +876,46 @@ class HTTPRunDB(RunDBInterface):
         values.tag = tag
         return values
 
+    def iter_artifacts(
+        self,
+        name=None,
+        project=None,
+        tag=None,
+        labels: Optional[Union[Dict[str, str], List[str]]] = None,
+        iter: int = None,
+        best_iteration: bool = False,
+        kind: str = None,
+        category: Union[str, schemas.ArtifactCategories] = None,
+        page_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Lazily iterate over artifacts, fetching them from the API a page at a time.
+
+        :param page_size: Number of artifacts to fetch per API call.
+
+        See :py:func:`~list_artifacts` for the other parameters.
+        """
+        project = project or config.default_project
+        labels = labels or []
+        if isinstance(labels, dict):
+            labels = [f"{key}={value}" for key, value in labels.items()]
+        params = {
+            "name": name,
+            "tag": tag,
+            "label": labels,
+            "iter": iter,
+            "best-iteration": best_iteration,
+            "kind": kind,
+            "category": category,
+            "format": schemas.ArtifactsFormat.full.value,
+        }
+        return self._iter_pages(
+            f"projects/{project}/artifacts",
+            "artifacts",
+            "list artifacts",
+            params,
+            page_size,
+        )
+
     def del_artifacts(self, name=None, project=None, tag=None, labels=None, days_ago=0):
         """Delete artifacts referenced by the parameters.
 
@@ -854,6 +1006,23 @@ class HTTPRunDB(RunDBInterface):
         resp = self.api_call("GET", "funcs", error, params=params)
         return resp.json()["funcs"]
 
+    def iter_functions(
+        self, name=None, project=None, tag=None, labels=None, page_size: int = 1000
+    ) -> Iterator[dict]:
+        """Lazily iterate over functions, fetching them from the API a page at a time.
+
+        :param page_size: Number of functions to fetch per API call.
+
+        See :py:func:`~list_functions` for the other parameters.
+        """
+        params = {
+            "project": project or config.default_project,
+            "name": name,
+            "tag": tag,
+            "label": labels or [],
+        }
+        return self._iter_pages("funcs", "funcs", "list functions", params, page_size)
+
     def list_runtime_resources(
         self,
         project: Optional[str] = None,
@@ -83,6 +83,16 @@ class SQLDB(RunDBInterface):
             project,
         )
 
+    def store_runs(self, runs, project=""):
+        import mlrun.api.crud
+
+        return self._transform_db_error(
+            mlrun.api.crud.Runs().store_runs,
+            self.session,
+            runs,
+            project,
+        )
+
     def update_run(self, updates: dict, uid, project="", iter=0):
         import mlrun.api.crud
 
@@ -128,6 +138,7 @@ class SQLDB(RunDBInterface):
         partition_sort_by: Union[schemas.SortField, str] = None,
         partition_order: Union[schemas.OrderType, str] = schemas.OrderType.desc,
         max_partitions: int = 0,
+        fields: List[str] = None,
     ):
         import mlrun.api.crud
 
@@ -151,6 +162,7 @@ class SQLDB(RunDBInterface):
             partition_sort_by,
             partition_order,
             max_partitions,
+            fields=fields,
         )
 
     def del_run(self, uid, project=None, iter=None):
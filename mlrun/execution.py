@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import os
+import threading
 import uuid
+from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime
 from typing import List, Union
@@ -24,7 +26,7 @@ import yaml
 import mlrun
 from mlrun.artifacts import ModelArtifact
 from mlrun.datastore.store_resources import get_store_resource
-from mlrun.errors import MLRunInvalidArgumentError
+from mlrun.errors import MLRunInvalidArgumentError, err_to_str
 
 from .artifacts import DatasetArtifact
 from .artifacts.manager import ArtifactManager, extend_artifact_path
@@ -44,6 +46,7 @@ from .utils import (
     to_date_str,
     update_in,
 )
+from .utils.run_metrics import RunMetricsWriter, get_run_metrics_path
 
 
 class MLClientCtx(object):
@@ -78,7 +81,7 @@ class MLClientCtx(object):
         self._tmpfile = tmp
         self._logger = log_stream or logger
         self._log_level = "info"
-        self._matrics_db = None
+        self._metrics_writer = None
         self._autocommit = autocommit
 
         self._labels = {}
@@ -109,6 +112,8 @@ class MLClientCtx(object):
 
         self._project_object = None
         self._allow_empty_resources = None
+        self._state_writer = None
+        self._last_committed_updates = {}
 
     def __enter__(self):
         return self
@@ -117,6 +122,9 @@ class MLClientCtx(object):
         if exc_value:
             self.set_state(error=exc_value, commit=False)
         self.commit(completed=True)
+        if not self._parent and self._state_writer:
+            # the run may not be completed (e.g. on error), write its state and stop the background writes
+            self._state_writer.close()
 
     def get_child_context(self, with_parent_params=False, **params):
         """get child context (iteration)
@@ -285,13 +293,14 @@ class MLClientCtx(object):
             self._handler = spec.get("handler", self._handler)
             if not self._iteration:
                 self._hyperparams = spec.get("hyperparams", self._hyperparams)
-                self._hyper_param_options = spec.get(
-                    "hyper_param_options", self._hyper_param_options
+            # iterations get the early termination options only
+            self._hyper_param_options = (
+                spec.get("hyper_param_options") or self._hyper_param_options
+            )
+            if isinstance(self._hyper_param_options, dict):
+                self._hyper_param_options = HyperParamOptions.from_dict(
+                    self._hyper_param_options
                 )
-                if isinstance(self._hyper_param_options, dict):
-                    self._hyper_param_options = HyperParamOptions.from_dict(
-                        self._hyper_param_options
-                    )
             self._outputs = spec.get("outputs", self._outputs)
             self._allow_empty_resources = spec.get(
                 "allow_empty_resources", self._allow_empty_resources
@@ -576,21 +585,63 @@ class MLClientCtx(object):
         if commit:
             self._update_run(commit=True)
 
-    def log_metric(self, key: str, value, timestamp=None, labels=None):
-        """TBD, log a real-time time-series metric"""
-        labels = {} if labels is None else labels
-        if not timestamp:
-            timestamp = datetime.now()
-        if self._rundb:
-            self._rundb.store_metric({key: value}, timestamp, labels)
+    def log_metric(self, key: str, value, timestamp=None, labels=None, step=None):
+        """log a time-series metric point (e.g. per training step)
 
-    def log_metrics(self, keyvals: dict, timestamp=None, labels=None):
-        """TBD, log a set of real-time time-series metrics"""
-        labels = {} if labels is None else labels
-        if not timestamp:
-            timestamp = datetime.now()
-        if self._rundb:
-            self._rundb.store_metric(keyvals, timestamp, labels)
+        the points are buffered and written in batches as chunk files under the artifact path (not in the run
+        object), use ``db.read_run_metrics()`` to read them (downsampled)
+
+        example::
+
+            for step, batch in enumerate(batches):
+                context.log_metric("loss", train(batch), step=step)
+
+        :param key:       metric key
+        :param value:     metric value (numeric)
+        :param timestamp: point time (default is now)
+        :param labels:    point labels (reserved, not stored)
+        :param step:      point step, incremented per key when not specified
+        """
+        metrics_writer = self._get_metrics_writer()
+        if metrics_writer:
+            metrics_writer.log(key, value, step=step, timestamp=timestamp)
+
+    def log_metrics(self, keyvals: dict, timestamp=None, labels=None, step=None):
+        """log a set of time-series metric points with the same step and timestamp
+
+        example::
+
+            context.log_metrics({"loss": loss, "accuracy": accuracy}, step=step)
+
+        :param keyvals:   dict of metric key to value (numeric)
+        :param timestamp: points time (default is now)
+        :param labels:    points labels (reserved, not stored)
+        :param step:      points step, incremented per key when not specified
+        """
+        timestamp = timestamp or datetime.now()
+        for key, value in keyvals.items():
+            self.log_metric(key, value, timestamp=timestamp, step=step)
+
+    def should_prune(self, step: int, value=None) -> bool:
+        """report an intermediate result of a hyper-param iteration and check if the iteration should stop
+
+        used with the ``early_termination`` hyper-param option, the intermediate value of the selector result
+        (e.g. accuracy in "max.accuracy") is logged as a time-series metric, and at the early termination steps
+        (min_resource * reduction_factor ** n) the iteration should stop when its value is not in the top
+        1/reduction_factor of the iterations which reached the same step
+
+        example::
+
+            for epoch in range(1, epochs + 1):
+                context.log_result("accuracy", train_epoch(model))
+                if context.should_prune(epoch):
+                    break
+
+        :param step:  current step (e.g. number of completed epochs)
+        :param value: intermediate result (default is the current value of the selector result)
+        :returns: True if the iteration should stop
+        """
+        return mlrun.runtimes.generators.should_prune_iteration(self, step, value)
 
     def log_artifact(
         self,
@@ -872,6 +923,11 @@ class MLClientCtx(object):
             self.update_child_iterations(commit_children=True, completed=completed)
         self._last_update = now_date()
         self._update_run(commit=True, message=message)
+        if self._metrics_writer:
+            self._metrics_writer.flush()
+        if completed and not self._parent and self._state_writer:
+            # the run (and its children) state must be written before the run is considered complete
+            self._state_writer.close()
         if completed and not self.iteration:
             mlrun.runtimes.utils.global_context.set(None)
 
@@ -905,18 +961,14 @@ class MLClientCtx(object):
         self._last_update = now_date()
 
         if self._rundb and commit:
-            self._rundb.update_run(
-                updates, self._uid, self.project, iter=self._iteration
-            )
+            self._write_updates(updates)
 
     def set_hostname(self, host: str):
         """update the hostname, for internal use"""
         self._host = host
         if self._rundb:
             updates = {"status.host": host}
-            self._rundb.update_run(
-                updates, self._uid, self.project, iter=self._iteration
-            )
+            self._write_updates(updates)
 
     def to_dict(self):
         """convert the run context to a dictionary"""
@@ -1017,20 +1069,77 @@ class MLClientCtx(object):
         update the required fields in the run object (using mlrun.utils.helpers.update_in)
         instead of overwriting existing
         """
-        self._merge_tmpfile()
-        if commit or self._autocommit:
+        commit = commit or self._autocommit
+        if commit:
             self._commit = message
-            if self._rundb:
-                self._rundb.update_run(
-                    self._get_updates(), self._uid, self.project, iter=self._iteration
+        state_writer = self._get_state_writer()
+        if state_writer:
+            state_writer.submit(self, commit)
+            return
+
+        self._merge_tmpfile()
+        if commit and self._rundb:
+            self._rundb.update_run(
+                self._get_updates(), self._uid, self.project, iter=self._iteration
+            )
+
+    def _write_updates(self, updates: dict):
+        """update fields of the run in the db immediately, after the pending (older) background commits"""
+        state_writer = (
+            self._parent._state_writer if self._parent else self._state_writer
+        )
+        if state_writer:
+            state_writer.write(self, updates)
+        else:
+            self._rundb.update_run(
+                updates, self._uid, self.project, iter=self._iteration
+            )
+
+    def _get_metrics_writer(self):
+        """return the time-series metrics writer of the run, None if there is no artifact path to write to"""
+        if self._metrics_writer is None:
+            if self.artifact_path:
+                self._metrics_writer = RunMetricsWriter(
+                    get_run_metrics_path(self.artifact_path, self._uid, self._iteration)
                 )
+            else:
+                logger.warning(
+                    "Metric points are not stored, the run has no artifact path"
+                )
+                # warn only once
+                self._metrics_writer = False
+        return self._metrics_writer or None
 
-    def _merge_tmpfile(self):
+    def _get_state_writer(self):
+        """return the background run state writer (shared by the run and its children), None if disabled"""
+        if self._parent:
+            return self._parent._get_state_writer()
+        if self._state_writer is None and mlrun.mlconf.run_state_commits.background:
+            self._state_writer = _RunStateWriter(
+                float(mlrun.mlconf.run_state_commits.flush_interval)
+            )
+        return self._state_writer
+
+    def _commit_updates(self, updates: dict):
+        """update the run in the db with the fields which changed since the last commit"""
+        changed_updates = {
+            key: value
+            for key, value in updates.items()
+            if key not in self._last_committed_updates
+            or self._last_committed_updates[key] != value
+        }
+        if changed_updates:
+            self._rundb.update_run(
+                changed_updates, self._uid, self.project, iter=self._iteration
+            )
+            self._last_committed_updates.update(changed_updates)
+
+    def _merge_tmpfile(self, dict_run=None):
         if not self._tmpfile:
             return
 
         loaded_run = self._read_tmpfile()
-        dict_run = self.to_dict()
+        dict_run = dict_run or self.to_dict()
         if loaded_run:
             for key, val in dict_run.items():
                 update_in(loaded_run, key, val)
@@ -1055,6 +1164,86 @@ class MLClientCtx(object):
                 fp.close()
 
 
+class _RunStateWriter:
+    """coalesce the run state commits of an execution (and its children) and write them from a background thread
+
+    every submit takes a snapshot of the run state which replaces the pending (not yet written) snapshot of the same
+    run, the snapshots are written in order by a single writer (every flush_interval seconds or on flush()), and only
+    the fields which changed since the last write are sent to the db. the writer thread is started by submit and
+    stops once there is nothing to write, so contexts which are never completed do not keep it running
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = None
+
+    def submit(self, context: MLClientCtx, commit: bool):
+        dict_run = deepcopy(context.to_dict()) if context._tmpfile else None
+        with self._lock:
+            pending = self._pending.get(id(context))
+            # a pending commit is not dropped by a following tmpfile only update
+            commit = commit or (pending is not None and pending[2] is not None)
+            updates = (
+                deepcopy(context._get_updates()) if commit and context._rundb else None
+            )
+            self._pending[id(context)] = (context, dict_run, updates)
+            if self._thread is None and not self._closed.is_set():
+                self._thread = threading.Thread(target=self._write_loop, daemon=True)
+                self._thread.start()
+        if self._closed.is_set():
+            # commits after the run completed are written immediately
+            self.flush()
+
+    def flush(self):
+        """write all the pending run states"""
+        with self._write_lock:
+            self._write_pending()
+
+    def write(self, context: MLClientCtx, updates: dict):
+        """write updates of a run immediately, after the pending run states (which would otherwise overwrite them
+        with older values)"""
+        with self._write_lock:
+            self._write_pending()
+            context._rundb.update_run(
+                updates, context.uid, context.project, iter=context.iteration
+            )
+
+    def _write_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+        for context, dict_run, updates in pending.values():
+            try:
+                if dict_run is not None:
+                    context._merge_tmpfile(dict_run)
+                if updates is not None:
+                    context._commit_updates(updates)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to write the run state",
+                    uid=context.uid,
+                    iteration=context.iteration,
+                    error=err_to_str(exc),
+                )
+
+    def close(self):
+        """write all the pending run states and stop the background writes"""
+        self._closed.set()
+        self.flush()
+
+    def _write_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+            with self._lock:
+                if not self._pending:
+                    # idle, the next submit starts the thread again
+                    self._thread = None
+                    return
+
+
 def _cast_result(value):
     if isinstance(value, (int, str, float)):
         return value
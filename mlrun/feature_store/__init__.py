@@ -31,6 +31,7 @@ __all__ = [
     "RunConfig",
     "OfflineVectorResponse",
     "OnlineVectorService",
+    "OnlineFeatureCache",
     "FixedWindowType",
 ]
 
@@ -54,5 +55,6 @@ from .feature_vector import (
     FeatureVector,
     FixedWindowType,
     OfflineVectorResponse,
+    OnlineFeatureCache,
     OnlineVectorService,
 )
@@ -23,6 +23,7 @@ import mlrun
 import mlrun.errors
 
 from ..data_types import InferOptions, get_infer_interface
+from ..data_types.sketch import DFStatsSketch
 from ..datastore.sources import BaseSourceDriver, StreamSource
 from ..datastore.store_resources import parse_store_uri
 from ..datastore.targets import (
@@ -52,6 +53,7 @@ from .feature_vector import (
     FeatureVector,
     FixedWindowType,
     OfflineVectorResponse,
+    OnlineFeatureCache,
     OnlineVectorService,
 )
 from .ingestion import (
@@ -147,7 +149,10 @@ def get_offline_features(
     :param with_indexes:    return vector with index columns and timestamp_key from the feature sets (default False)
     :param update_stats:    update features statistics from the requested feature sets on the vector. Default is False.
     :param engine:          processing engine kind ("local", "dask", or "spark")
-    :param engine_args:     kwargs for the processing engine
+    :param engine_args:     kwargs for the processing engine, e.g. for the "local" engine
+                            {"entity_chunk_size": 1000000} joins the entity rows with all the feature sets
+                            in chunks of that many rows to bound the memory usage, and {"pushdown": False}
+                            disables pushing the time window, query and entity keys down to the parquet reads
     :param query:           The query string used to filter rows
     :param spark_service:   Name of the spark service to be used (when using a remote-spark runtime)
     :param join_type:               {'left', 'right', 'outer', 'inner'}, default 'inner'
@@ -221,6 +226,9 @@ def get_online_feature_service(
     fixed_window_type: FixedWindowType = FixedWindowType.LastClosedWindow,
     impute_policy: dict = None,
     update_stats: bool = False,
+    max_batch_size: int = None,
+    flush_after_seconds: float = None,
+    cache: Union[dict, OnlineFeatureCache] = None,
 ) -> OnlineVectorService:
     """initialize and return online feature vector service api,
     returns :py:class:`~mlrun.feature_store.OnlineVectorService`
@@ -276,6 +284,14 @@ def get_online_feature_service(
                             values. "*" is used to specify the default for all features, example: `{"*": "$mean"}`
     :param fixed_window_type: determines how to query the fixed window values which were previously inserted by ingest
     :param update_stats:      update features statistics from the requested feature sets on the vector. Default: False.
+    :param max_batch_size:    when set, concurrent requests are gathered into micro batches of up to this many
+                            entities, and the distinct keys of a batch are queried from all the feature sets in
+                            parallel (instead of querying each entity from each feature set one after the other)
+    :param flush_after_seconds: max time to wait for a micro batch to fill (when max_batch_size is set),
+                            default 0.005 seconds
+    :param cache:             optional per process cache of the feature set lookups, an
+                            :py:class:`~mlrun.feature_store.OnlineFeatureCache` object or a dict with its args,
+                            e.g. {"max_entries": 100000, "ttl": 60, "feature_set_ttls": {"transactions": 5}}
     """
     if isinstance(feature_vector, FeatureVector):
         update_stats = True
@@ -287,11 +303,18 @@ def get_online_feature_service(
     if impute_policy and not feature_vector.status.stats:
         update_stats = True
 
+    if isinstance(cache, dict):
+        cache = OnlineFeatureCache(**cache)
     graph, index_columns = init_feature_vector_graph(
-        feature_vector, fixed_window_type, update_stats=update_stats
+        feature_vector,
+        fixed_window_type,
+        update_stats=update_stats,
+        max_batch_size=max_batch_size,
+        flush_after_seconds=flush_after_seconds,
+        cache=cache,
     )
     service = OnlineVectorService(
-        feature_vector, graph, index_columns, impute_policy=impute_policy
+        feature_vector, graph, index_columns, impute_policy=impute_policy, cache=cache
     )
     service.initialize()
 
@@ -570,19 +593,32 @@ def ingest(
     calculate_df = return_df or infer_stats != InferOptions.Null
     featureset.save()
 
+    if not InferOptions.get_common_options(
+        infer_stats, InferOptions.Index
+    ) and InferOptions.get_common_options(infer_options, InferOptions.Index):
+        infer_stats += InferOptions.Index
+
+    # only the first chunk of chunked sources is returned, the stats are collected over all the chunks
+    stats_sketch = None
+    if (
+        hasattr(source, "is_iterator")
+        and source.is_iterator()
+        and InferOptions.get_common_options(infer_stats, InferOptions.Stats)
+    ):
+        stats_sketch = DFStatsSketch(infer_stats)
+
     df = init_featureset_graph(
         source,
         featureset,
         namespace,
         targets=targets_to_ingest,
         return_df=calculate_df,
+        stats_sketch=stats_sketch,
     )
-    if not InferOptions.get_common_options(
-        infer_stats, InferOptions.Index
-    ) and InferOptions.get_common_options(infer_options, InferOptions.Index):
-        infer_stats += InferOptions.Index
 
-    _infer_from_static_df(df, featureset, options=infer_stats)
+    _infer_from_static_df(
+        df, featureset, options=infer_stats, stats_sketch=stats_sketch
+    )
 
     if isinstance(source, DataSource):
         for target in featureset.status.targets:
@@ -945,12 +981,21 @@ def _infer_from_static_df(
     entity_columns=None,
     options: InferOptions = InferOptions.default(),
     sample_size=None,
+    stats_sketch: DFStatsSketch = None,
 ):
-    """infer feature-set schema & stats from static dataframe (without pipeline)"""
+    """infer feature-set schema & stats from static dataframe (without pipeline)
+
+    the stats of chunked data are taken from the stats_sketch (updated with all the chunks), the schema and
+    preview are inferred from the first chunk
+    """
     if hasattr(df, "to_dataframe"):
         if df.is_iterator():
-            # todo: describe over multiple chunks
-            df = next(df.to_dataframe())
+            chunks = df.to_dataframe()
+            df = next(chunks)
+            if InferOptions.get_common_options(options, InferOptions.Stats):
+                stats_sketch = DFStatsSketch(options).update(df)
+                for chunk in chunks:
+                    stats_sketch.update(chunk)
         else:
             df = df.to_dataframe()
     inferer = get_infer_interface(df)
@@ -964,9 +1009,12 @@ def _infer_from_static_df(
             options=options,
         )
     if InferOptions.get_common_options(options, InferOptions.Stats):
-        featureset.status.stats = inferer.get_stats(
-            df, options, sample_size=sample_size
-        )
+        if stats_sketch is not None and stats_sketch.columns:
+            featureset.status.stats = stats_sketch.get_stats()
+        else:
+            featureset.status.stats = inferer.get_stats(
+                df, options, sample_size=sample_size
+            )
     if InferOptions.get_common_options(options, InferOptions.Preview):
         featureset.status.preview = inferer.get_preview(df)
     return df
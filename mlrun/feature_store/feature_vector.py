@@ -13,6 +13,8 @@
 # limitations under the License.
 import collections
 import logging
+import threading
+import time
 from copy import copy
 from enum import Enum
 from typing import List, Union
@@ -381,12 +383,117 @@ class FeatureVector(ModelObj):
         return feature_set_objects, feature_set_fields
 
 
+class OnlineFeatureCache:
+    """per process read-through cache for the online feature set lookups
+
+    entries are kept per feature set and entity key, and are evicted when they expire (after the
+    feature set ttl) or when the cache is full (least recently used first).
+
+    example::
+
+        cache = OnlineFeatureCache(max_entries=100000, ttl=60, feature_set_ttls={"transactions": 5})
+        svc = fstore.get_online_feature_service(vector_uri, cache=cache)
+        ...
+        print(cache.stats())
+        cache.invalidate("transactions", key="C123487")
+
+    :param max_entries:      max number of (feature set, key) entries to hold in memory
+    :param ttl:              default time to live (in seconds) of an entry
+    :param feature_set_ttls: time to live (in seconds) per feature set name, overrides the default ttl
+    """
+
+    def __init__(
+        self, max_entries: int = 10000, ttl: float = 60, feature_set_ttls: dict = None
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.feature_set_ttls = feature_set_ttls or {}
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _to_key(key):
+        if isinstance(key, (list, tuple)):
+            key = [str(value) for value in key]
+            return key[0] if len(key) == 1 else ".".join(key)
+        return str(key)
+
+    def get(self, feature_set: str, key):
+        """return the cached value of a feature set key, or None if missing or expired"""
+        entry_key = (feature_set, self._to_key(key))
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                expiration, value = entry
+                if expiration > time.monotonic():
+                    self._entries.move_to_end(entry_key)
+                    self.hits += 1
+                    return value
+                del self._entries[entry_key]
+                self.evictions += 1
+            self.misses += 1
+            return None
+
+    def set(self, feature_set: str, key, value):
+        """cache the value of a feature set key"""
+        ttl = self.feature_set_ttls.get(feature_set, self.ttl)
+        if not ttl or not self.max_entries:
+            return
+        entry_key = (feature_set, self._to_key(key))
+        with self._lock:
+            self._entries[entry_key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, feature_set: str = None, key=None):
+        """drop cached entries, of a specific feature set and/or entity key, or all the entries (default)
+
+        :param feature_set: feature set name
+        :param key:         entity key value, or list of values for a feature set with multiple entities
+        """
+        with self._lock:
+            if feature_set is None and key is None:
+                self._entries.clear()
+                return
+            key = None if key is None else self._to_key(key)
+            for entry_key in list(self._entries.keys()):
+                entry_feature_set, entry_entity_key = entry_key
+                if (feature_set is None or entry_feature_set == feature_set) and (
+                    key is None or entry_entity_key == key
+                ):
+                    del self._entries[entry_key]
+
+    def stats(self) -> dict:
+        """return the cache counters (hits, misses, evictions) and size"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
 class OnlineVectorService:
     """get_online_feature_service response object"""
 
-    def __init__(self, vector, graph, index_columns, impute_policy: dict = None):
+    def __init__(
+        self,
+        vector,
+        graph,
+        index_columns,
+        impute_policy: dict = None,
+        cache: OnlineFeatureCache = None,
+    ):
         self.vector = vector
         self.impute_policy = impute_policy or {}
+        self.cache = cache
 
         self._controller = graph.controller
         self._index_columns = index_columns
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import concurrent.futures
 import uuid
 
 import pandas as pd
@@ -42,8 +44,12 @@ def init_featureset_graph(
     return_df=True,
     verbose=False,
     rows_limit=None,
+    stats_sketch=None,
 ):
-    """create storey ingestion graph/DAG from feature set object"""
+    """create storey ingestion graph/DAG from feature set object
+
+    when stats_sketch (DFStatsSketch) is specified it is updated with every processed chunk of the (sync) graph
+    """
 
     cache = ResourceCache()
     graph = featureset.spec.graph.copy()
@@ -94,30 +100,51 @@ def init_featureset_graph(
     targets = [get_target_driver(target, featureset) for target in targets]
     if featureset.spec.passthrough:
         targets = [target for target in targets if not target.is_offline]
-    for chunk in chunks:
+
+    def process_chunk(chunk):
         event = MockEvent(body=chunk)
         if len(featureset.spec.entities) and isinstance(event.body, pd.DataFrame):
             # set the entities to be the indexes of the df
             event.body = entities_to_index(featureset, event.body)
-
-        data = server.run(event, get_body=True)
-        if data is not None:
-            for i, target in enumerate(targets):
-                size = target.write_dataframe(
-                    data,
-                    key_column=key_fields,
-                    timestamp_key=featureset.spec.timestamp_key,
-                    chunk_id=chunk_id,
-                )
-                if size:
-                    sizes[i] += size
-        chunk_id += 1
-        if data_result is None:
-            # in case of multiple chunks only return the first chunk (last may be too small)
-            data_result = data
-        total_rows += data.shape[0]
-        if rows_limit and total_rows >= rows_limit:
-            break
+        return server.run(event, get_body=True)
+
+    def write_target(index, data, chunk_id):
+        size = targets[index].write_dataframe(
+            data,
+            key_column=key_fields,
+            timestamp_key=featureset.spec.timestamp_key,
+            chunk_id=chunk_id,
+        )
+        if size:
+            sizes[index] += size
+
+    max_workers = int(mlrun.mlconf.feature_store.ingestion.max_workers or 1)
+    if max_workers > 1 and chunk_id:
+        for data in _pipelined_ingestion(
+            chunks, chunk_id, process_chunk, write_target, len(targets), max_workers
+        ):
+            if data_result is None:
+                data_result = data
+            if stats_sketch is not None:
+                stats_sketch.update(data)
+            total_rows += data.shape[0]
+            if rows_limit and total_rows >= rows_limit:
+                break
+    else:
+        for chunk in chunks:
+            data = process_chunk(chunk)
+            if data is not None:
+                for i in range(len(targets)):
+                    write_target(i, data, chunk_id)
+            chunk_id += 1
+            if data_result is None:
+                # in case of multiple chunks only return the first chunk (last may be too small)
+                data_result = data
+            if stats_sketch is not None:
+                stats_sketch.update(data)
+            total_rows += data.shape[0]
+            if rows_limit and total_rows >= rows_limit:
+                break
 
     # todo: fire termination event if iterator
 
@@ -129,6 +156,65 @@ def init_featureset_graph(
     return data_result
 
 
+def _pipelined_ingestion(
+    chunks, first_chunk_id, process_chunk, write_target, targets_count, max_workers
+):
+    """run the ingestion graph over the chunks in a thread pool while the next chunks are read and the previous
+    results are written, yields the processed chunks in their original order
+
+    the number of chunks which are read ahead is bounded by mlconf.feature_store.ingestion.max_pending_chunks, the
+    chunk ids are assigned by the order of the chunks in the source (same as in the sequential ingestion), and each
+    target writes the chunks in order (different targets are written in parallel)
+    """
+    max_pending_chunks = max(
+        int(mlrun.mlconf.feature_store.ingestion.max_pending_chunks), max_workers
+    )
+    pending_chunks = collections.deque()
+    pending_writes = []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as process_executor, concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(targets_count, 1)
+    ) as write_executor:
+
+        def write_chunk(chunk_id, data):
+            # the writes of the previous chunk must complete before the targets get the next chunk
+            for future in pending_writes:
+                future.result()
+            pending_writes.clear()
+            if data is not None:
+                for i in range(targets_count):
+                    pending_writes.append(
+                        write_executor.submit(write_target, i, data, chunk_id)
+                    )
+
+        try:
+            chunk_id = first_chunk_id
+            for chunk in chunks:
+                pending_chunks.append(
+                    (chunk_id, process_executor.submit(process_chunk, chunk))
+                )
+                chunk_id += 1
+                if len(pending_chunks) < max_pending_chunks:
+                    continue
+                completed_chunk_id, future = pending_chunks.popleft()
+                data = future.result()
+                write_chunk(completed_chunk_id, data)
+                yield data
+
+            while pending_chunks:
+                completed_chunk_id, future = pending_chunks.popleft()
+                data = future.result()
+                write_chunk(completed_chunk_id, data)
+                yield data
+        finally:
+            # stop processing the pending chunks when stopped early (e.g. rows limit or error)
+            for _, future in pending_chunks:
+                future.cancel()
+            for future in pending_writes:
+                future.result()
+
+
 def featureset_initializer(server):
     """graph server hook to initialize feature set ingestion graph/DAG"""
 
@@ -13,9 +13,16 @@
 # limitations under the License.
 
 import re
+from collections import Counter
 
 import pandas as pd
 
+import mlrun
+from mlrun.datastore.targets import ParquetTarget, get_offline_target
+from mlrun.datastore.utils import and_filters, query_to_filters, select_filters
+
+from ...errors import err_to_str
+from ...utils import logger
 from ..feature_vector import OfflineVectorResponse
 from .base import BaseMerger
 
@@ -25,6 +32,11 @@ class LocalFeatureMerger(BaseMerger):
 
     def __init__(self, vector, **engine_args):
         super().__init__(vector, **engine_args)
+        # when set, the entity rows are joined with all the feature sets in chunks of this many rows,
+        # bounding the memory used by the intermediate joins
+        self._entity_chunk_size = engine_args.get("entity_chunk_size")
+        # push the time window, query and entity keys down to the (parquet) feature set reads
+        self._pushdown = engine_args.get("pushdown", True)
 
     def _generate_vector(
         self,
@@ -49,6 +61,12 @@ class LocalFeatureMerger(BaseMerger):
         fs_link_list = self._create_linked_relation_list(
             feature_set_objects, feature_set_fields
         )
+        query_filters = query_to_filters(query) if query and self._pushdown else None
+        result_columns = Counter(
+            alias or col
+            for fields in feature_set_fields.values()
+            for col, alias in fields
+        )
 
         for node in fs_link_list:
             name = node.name
@@ -64,21 +82,28 @@ class LocalFeatureMerger(BaseMerger):
 
             # handling case where there are multiple feature sets and user creates vector where entity_timestamp_
             # column is from a specific feature set (can't be entity timestamp)
+            read_args = {}
             if (
                 entity_timestamp_column in column_names
                 or feature_set.spec.timestamp_key == entity_timestamp_column
             ):
-                df = feature_set.to_dataframe(
-                    columns=column_names,
-                    start_time=start_time,
-                    end_time=end_time,
-                    time_column=entity_timestamp_column,
-                )
-            else:
-                df = feature_set.to_dataframe(
-                    columns=column_names,
-                    time_column=entity_timestamp_column,
-                )
+                read_args = {"start_time": start_time, "end_time": end_time}
+            filters = self._get_pushdown_filters(
+                feature_set,
+                columns,
+                node,
+                entity_rows,
+                query_filters,
+                result_columns,
+                is_first=node is fs_link_list.head,
+            )
+            df = self._read_feature_set(
+                feature_set,
+                filters,
+                columns=column_names,
+                time_column=entity_timestamp_column,
+                **read_args,
+            )
             if df.index.names[0]:
                 df.reset_index(inplace=True)
             column_names += node.data["save_index"]
@@ -153,6 +178,163 @@ class LocalFeatureMerger(BaseMerger):
 
         return OfflineVectorResponse(self)
 
+    def _get_pushdown_filters(
+        self,
+        feature_set,
+        columns,
+        node,
+        entity_rows,
+        query_filters,
+        result_columns,
+        is_first=False,
+    ):
+        """return pyarrow filters for reading only the feature set rows which can affect the result"""
+        if not self._pushdown or feature_set.spec.passthrough:
+            return None
+        if not isinstance(get_offline_target(feature_set), ParquetTarget):
+            return None
+        # as-of joins and inner/left joins drop the feature rows which don't match an entity row,
+        # with other joins every feature row may end in the result
+        if not feature_set.spec.timestamp_key and self._join_type not in [
+            "inner",
+            "left",
+        ]:
+            return None
+
+        entities = list(feature_set.spec.entities.keys())
+        query_columns = {
+            entity: entity for entity in entities if not result_columns[entity]
+        }
+        if not feature_set.spec.timestamp_key and self._join_type == "inner":
+            # only an inner join keeps exactly the feature rows that match the query, an as-of join
+            # must first find the latest row of each entity and only then apply the query to it
+            query_columns.update(
+                {
+                    alias or col: col
+                    for col, alias in columns
+                    if result_columns[alias or col] == 1
+                }
+            )
+        filters = select_filters(query_filters, query_columns)
+
+        key_filters = []
+        if entity_rows is not None:
+            if is_first:
+                left_keys = right_keys = entities
+            else:
+                left_keys, right_keys = node.data["left_keys"], node.data["right_keys"]
+            max_keys = mlrun.mlconf.feature_store.pushdown_max_keys
+            for left_key, right_key in zip(left_keys, right_keys):
+                if left_key in entity_rows.columns:
+                    values = entity_rows[left_key].dropna().unique()
+                    if 0 < len(values) <= max_keys:
+                        key_filters.append((right_key, "in", values.tolist()))
+        return and_filters(key_filters, filters)
+
+    @staticmethod
+    def _read_feature_set(feature_set, filters, **kwargs):
+        if filters:
+            try:
+                return feature_set.to_dataframe(filters=filters, **kwargs)
+            except Exception as exc:
+                # e.g. a query comparing a column to a value of a different type
+                logger.warning(
+                    "Failed to read feature set with pushdown filters, reading without them",
+                    feature_set=feature_set.metadata.name,
+                    filters=str(filters),
+                    exc=err_to_str(exc),
+                )
+        return feature_set.to_dataframe(**kwargs)
+
+    def merge(
+        self,
+        entity_df,
+        entity_timestamp_column: str,
+        featuresets: list,
+        featureset_dfs: list,
+        keys: list = None,
+        all_columns: list = None,
+    ):
+        """join the entities and feature set features into a result dataframe
+
+        the entity and feature set frames are converted and sorted by time once, so the following
+        as-of joins can skip it, and with `entity_chunk_size` all the feature sets are joined
+        to one chunk of sorted entity rows at a time
+        """
+        time_indexes = []
+        for featureset, featureset_df in zip(featuresets, featureset_dfs):
+            timestamp_key = featureset.spec.timestamp_key
+            if timestamp_key:
+                self._sort_by_time(featureset_df, timestamp_key)
+                time_indexes.append(featureset_df[timestamp_key])
+            else:
+                time_indexes.append(None)
+        if entity_df is not None and any(index is not None for index in time_indexes):
+            entity_df = self._sort_by_time(entity_df, entity_timestamp_column)
+
+        if not self._should_merge_in_chunks(
+            entity_df, entity_timestamp_column, featuresets
+        ):
+            return super().merge(
+                entity_df,
+                entity_timestamp_column,
+                featuresets,
+                featureset_dfs,
+                keys=keys,
+                all_columns=all_columns,
+            )
+
+        chunk_size = self._entity_chunk_size
+        result_chunks = []
+        for start in range(0, len(entity_df), chunk_size):
+            entity_chunk = entity_df.iloc[start : start + chunk_size]
+            chunk_end_time = entity_chunk[entity_timestamp_column].iloc[-1]
+            # an as-of join only looks backwards, so feature rows later than the chunk can be skipped
+            featureset_chunks = [
+                featureset_df
+                if time_index is None
+                else featureset_df.iloc[
+                    : time_index.searchsorted(chunk_end_time, side="right")
+                ]
+                for featureset_df, time_index in zip(featureset_dfs, time_indexes)
+            ]
+            super().merge(
+                entity_chunk,
+                entity_timestamp_column,
+                featuresets,
+                featureset_chunks,
+                keys=keys,
+                all_columns=all_columns,
+            )
+            result_chunks.append(self._result_df)
+        self._result_df = pd.concat(result_chunks, ignore_index=True)
+
+    def _should_merge_in_chunks(
+        self, entity_df, entity_timestamp_column, featuresets
+    ) -> bool:
+        if (
+            not self._entity_chunk_size
+            or entity_df is None
+            or not entity_timestamp_column
+            or len(entity_df) <= self._entity_chunk_size
+        ):
+            return False
+        # as-of joins and inner/left joins are row-wise on the entity side, other joins need all the rows
+        return self._join_type in ["inner", "left"] or all(
+            featureset.spec.timestamp_key for featureset in featuresets
+        )
+
+    @staticmethod
+    def _sort_by_time(df, time_column):
+        if not time_column or time_column not in df.columns:
+            return df
+        if not pd.api.types.is_datetime64_any_dtype(df[time_column]):
+            df[time_column] = pd.to_datetime(df[time_column])
+        # merge_asof keeps the order of the left frame, so following joins find it already sorted
+        if not df[time_column].is_monotonic_increasing:
+            df.sort_values(by=time_column, inplace=True)
+        return df
+
     def _asof_join(
         self,
         entity_df,
@@ -169,14 +351,8 @@ class LocalFeatureMerger(BaseMerger):
             indexes = list(featureset.spec.entities.keys())
         index_col_not_in_entity = "index" not in entity_df.columns
         index_col_not_in_featureset = "index" not in featureset_df.columns
-        entity_df[entity_timestamp_column] = pd.to_datetime(
-            entity_df[entity_timestamp_column]
-        )
-        featureset_df[featureset.spec.timestamp_key] = pd.to_datetime(
-            featureset_df[featureset.spec.timestamp_key]
-        )
-        entity_df.sort_values(by=entity_timestamp_column, inplace=True)
-        featureset_df.sort_values(by=entity_timestamp_column, inplace=True)
+        entity_df = self._sort_by_time(entity_df, entity_timestamp_column)
+        featureset_df = self._sort_by_time(featureset_df, featureset.spec.timestamp_key)
 
         merged_df = pd.merge_asof(
             entity_df,
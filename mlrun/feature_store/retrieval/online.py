@@ -12,11 +12,255 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
+import storey
+from storey.dtypes import _termination_obj
+from storey.utils import stringify_key
 
 import mlrun
 from mlrun.datastore.store_resources import ResourceCache
 from mlrun.datastore.targets import get_online_target
+from mlrun.errors import err_to_str
 from mlrun.serving.server import create_graph_server
+from mlrun.utils import logger
+
+# default max time (in seconds) to wait for more requests before querying a batch
+default_flush_after_seconds = 0.005
+
+# storey has no public API to load (or read) the keys of a batch, BatchedQueryByKey uses these internals of the
+# storey table and QueryByKey step (available in the storey versions mlrun supports)
+_storey_table_internals = [
+    "_lazy_load_key_with_aggregates",
+    "_get_features",
+    "_get_static_attrs",
+]
+_storey_query_internals = [
+    "_table",
+    "_key_extractor",
+    "_get_timestamp",
+    "_augmentation_fn",
+    "_aliases",
+    "_enrich_with",
+]
+
+
+def batched_queries_supported() -> bool:
+    """whether the installed storey version has the internals which BatchedQueryByKey uses"""
+    return all(
+        hasattr(storey.Table, name) for name in _storey_table_internals
+    ) and hasattr(storey.QueryByKey, "_get_timestamp")
+
+
+class BatchedQueryByKey(storey.Flow):
+    def __init__(
+        self,
+        queries: list,
+        max_batch_size: int = None,
+        flush_after_seconds: float = None,
+        feature_sets: list = None,
+        cache=None,
+        **kwargs,
+    ):
+        """Query the features of multiple feature sets for micro batches of events
+
+        events are gathered until `max_batch_size` events arrived or `flush_after_seconds` passed,
+        the distinct keys of the batch are then loaded concurrently from all the feature set tables,
+        and the enriched events are emitted downstream in their original order
+
+        :param queries:             list of storey.QueryByKey args (features, table, key_field, ..), one per
+                                    feature set, in the order their features are added to the event
+        :param max_batch_size:      max number of events to query together
+        :param flush_after_seconds: max time to wait for more events before querying a batch
+        :param feature_sets:        feature set names (in the order of the queries), used as the cache keys
+        :param cache:               optional OnlineFeatureCache object, the features of cached keys are
+                                    not loaded from the tables
+        """
+        super().__init__(**kwargs)
+        self.queries = queries
+        self.max_batch_size = max_batch_size or 1
+        self.flush_after_seconds = (
+            default_flush_after_seconds
+            if flush_after_seconds is None
+            else flush_after_seconds
+        )
+        self.feature_sets = feature_sets or [query["table"] for query in queries]
+        self.cache = cache
+        self._queries = [
+            storey.QueryByKey(context=self.context, **query) for query in queries
+        ]
+        if not batched_queries_supported() or any(
+            not hasattr(query, name)
+            for query in self._queries[:1]
+            for name in _storey_query_internals
+        ):
+            raise mlrun.errors.MLRunRuntimeError(
+                f"batched feature queries are not supported by storey {getattr(storey, '__version__', None)}, "
+                "use storey.QueryByKey steps instead"
+            )
+        self._closeables = [query._table for query in self._queries]
+
+    def _init(self):
+        super()._init()
+        self._batch = []
+        self._flush_task = None
+        self._batch_lock = asyncio.Lock()
+
+    async def _do(self, event):
+        if event is _termination_obj:
+            await self._flush()
+            return await self._do_downstream(_termination_obj)
+
+        self._batch.append(event)
+        if len(self._batch) >= self.max_batch_size:
+            await self._flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_after_timeout()
+            )
+
+    async def _flush_after_timeout(self):
+        await asyncio.sleep(self.flush_after_seconds)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self):
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        events, self._batch = self._batch, []
+        if not events:
+            return
+
+        async with self._batch_lock:
+            try:
+                await self._query_batch(events)
+            except Exception as exc:
+                for event in events:
+                    self._set_error(event, exc)
+                return
+            for event in events:
+                try:
+                    await self._do_downstream(event)
+                except Exception as exc:
+                    self._set_error(event, exc)
+
+    def _set_error(self, event, exc):
+        # errors are reported per event, since a timed flush doesnt run in the context of any event
+        if self.logger:
+            self.logger.error(f"failed to query features: {err_to_str(exc)}")
+        if getattr(event, "_awaitable_result", None):
+            event._awaitable_result._set_error(exc)
+
+    async def _query_batch(self, events):
+        pending = list(range(len(self._queries)))
+        while pending:
+            # query together all the feature sets which have their keys in every event, a key may
+            # also come from the features of another feature set, in that case it's queried after it
+            event_keys = {index: self._get_keys(index, events) for index in pending}
+            stage = [index for index in pending if None not in event_keys[index]]
+            if not stage:
+                stage = pending[:1]
+            cached = {
+                index: self._get_cached_features(index, event_keys[index])
+                for index in stage
+            }
+            await asyncio.gather(
+                *[
+                    self._queries[index]._table._lazy_load_key_with_aggregates(
+                        safe_key, timestamp
+                    )
+                    for index in stage
+                    for safe_key, timestamp in self._distinct_keys(
+                        index, events, event_keys[index]
+                    ).items()
+                    if safe_key not in cached[index]
+                ]
+            )
+            for index in stage:
+                await self._enrich_events(
+                    index, events, event_keys[index], cached[index]
+                )
+                pending.remove(index)
+
+    def _get_keys(self, index, events):
+        keys = []
+        key_extractor = self._queries[index]._key_extractor
+        for event in events:
+            key = key_extractor(event.body) if event.body else None
+            if key is None or key == [None] or (isinstance(key, list) and None in key):
+                key = None
+            keys.append(key)
+        return keys
+
+    def _distinct_keys(self, index, events, keys):
+        query = self._queries[index]
+        distinct_keys = {}
+        for event, key in zip(events, keys):
+            if key is not None:
+                safe_key = stringify_key(key)
+                timestamp = query._get_timestamp(event)
+                distinct_keys[safe_key] = min(
+                    distinct_keys.get(safe_key, timestamp), timestamp
+                )
+        return distinct_keys
+
+    def _get_cached_features(self, index, keys):
+        cached = {}
+        if not self.cache:
+            return cached
+        missing = set()
+        for key in keys:
+            if key is None:
+                continue
+            safe_key = stringify_key(key)
+            if safe_key not in cached and safe_key not in missing:
+                value = self.cache.get(self.feature_sets[index], key)
+                if value is None:
+                    missing.add(safe_key)
+                else:
+                    cached[safe_key] = value
+        return cached
+
+    async def _enrich_events(self, index, events, keys, cached):
+        # same enrichment as storey.QueryByKey, but over keys which were already loaded
+        query = self._queries[index]
+        for event, key in zip(events, keys):
+            if key is None or event.body is None:
+                event.body = None
+                continue
+            safe_key = stringify_key(key)
+            if safe_key in cached:
+                features, static_features = cached[safe_key]
+            else:
+                features, static_features = await self._get_features(
+                    query, safe_key, query._get_timestamp(event)
+                )
+                if self.cache:
+                    cached[safe_key] = (features, static_features)
+                    self.cache.set(
+                        self.feature_sets[index], key, (features, static_features)
+                    )
+            features = query._augmentation_fn(event.body, dict(features))
+            features.update(static_features)
+            event.key = key
+            event.body = features
+
+    @staticmethod
+    async def _get_features(query, safe_key, timestamp):
+        table = query._table
+        features = await table._get_features(safe_key, timestamp)
+        for name in list(features.keys()):
+            alias = query._aliases.get(name)
+            if alias and alias != name:
+                features[alias] = features.pop(name)
+        static_attrs = table._get_static_attrs(safe_key) or {}
+        static_features = {
+            query._aliases.get(column) or column: static_attrs[column]
+            for column in query._enrich_with
+            if column in static_attrs
+        }
+        return features, static_features
 
 
 def _build_feature_vector_graph(
@@ -24,6 +268,9 @@ def _build_feature_vector_graph(
     feature_set_fields,
     feature_set_objects,
     fixed_window_type,
+    max_batch_size=None,
+    flush_after_seconds=None,
+    cache=None,
 ):
     graph = vector.spec.graph.copy()
     start_states, default_final_state, responders = graph.check_and_process_graph(
@@ -31,21 +278,45 @@ def _build_feature_vector_graph(
     )
     next = graph
 
+    queries = []
     for name, columns in feature_set_fields.items():
         featureset = feature_set_objects[name]
         column_names = [name for name, alias in columns]
         aliases = {name: alias for name, alias in columns if alias}
 
         entity_list = list(featureset.spec.entities.keys())
+        queries.append(
+            dict(
+                name=f"query-{name}",
+                features=column_names,
+                table=featureset.uri,
+                key_field=entity_list,
+                aliases=aliases,
+                fixed_window_type=fixed_window_type.to_qbk_fixed_window_type(),
+            )
+        )
+
+    if (max_batch_size or cache) and not batched_queries_supported():
+        logger.warning(
+            "Batched and cached feature queries are not supported by the installed storey version, "
+            "querying the features of every event separately",
+            storey_version=getattr(storey, "__version__", None),
+        )
+        max_batch_size = cache = None
+    if max_batch_size or cache:
         next = next.to(
-            "storey.QueryByKey",
-            f"query-{name}",
-            features=column_names,
-            table=featureset.uri,
-            key_field=entity_list,
-            aliases=aliases,
-            fixed_window_type=fixed_window_type.to_qbk_fixed_window_type(),
+            "mlrun.feature_store.retrieval.online.BatchedQueryByKey",
+            "query-features",
+            queries=queries,
+            max_batch_size=max_batch_size,
+            flush_after_seconds=flush_after_seconds,
+            feature_sets=list(feature_set_fields.keys()),
+            cache=cache,
         )
+    else:
+        for query in queries:
+            query = query.copy()
+            next = next.to("storey.QueryByKey", query.pop("name"), **query)
     for name in start_states:
         next.set_next(name)
 
@@ -60,7 +331,14 @@ def _build_feature_vector_graph(
     return graph
 
 
-def init_feature_vector_graph(vector, query_options, update_stats=False):
+def init_feature_vector_graph(
+    vector,
+    query_options,
+    update_stats=False,
+    max_batch_size=None,
+    flush_after_seconds=None,
+    cache=None,
+):
     try:
         from storey import SyncEmitSource
     except ImportError as exc:
@@ -70,7 +348,13 @@ def init_feature_vector_graph(vector, query_options, update_stats=False):
         offline=False, update_stats=update_stats
     )
     graph = _build_feature_vector_graph(
-        vector, feature_set_fields, feature_set_objects, query_options
+        vector,
+        feature_set_fields,
+        feature_set_objects,
+        query_options,
+        max_batch_size=max_batch_size,
+        flush_after_seconds=flush_after_seconds,
+        cache=cache,
     )
     graph.set_flow_source(SyncEmitSource())
     server = create_graph_server(graph=graph, parameters={})
@@ -89,6 +89,8 @@ class MLRunLogger(Logger):
           * A chart for each of the metrics iteration results in training.
           * A chart for each of the metrics iteration results in validation.
 
+        * Time-series metrics: The iteration results of the epoch for training and validation metrics.
+
         :param epoch: The epoch number that has just ended.
         """
         # Log the collected hyperparameters and values as results (the most recent value collected (-1 index)):
@@ -122,6 +124,9 @@ class MLRunLogger(Logger):
         )
         for loop, metrics_dictionary in zip(loops, metrics_dictionaries):
             for metric_name in metrics_dictionary:
+                # Log the epoch iterations results as time-series metrics (the steps continue across epochs):
+                for result in metrics_dictionary[metric_name][-1]:
+                    self._context.log_metric(f"{loop}_{metric_name}", result)
                 # Create the plotly artifact:
                 artifact = self._generate_metric_results_artifact(
                     loop=loop,
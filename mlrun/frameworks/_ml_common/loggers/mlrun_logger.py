@@ -104,6 +104,8 @@ class MLRunLogger(Logger):
 
           * A chart for each of the metrics iteration results.
           * A chart for each of the dynamic hyperparameters values.
+
+        * Time-series metrics: The metric results.
         """
         # Log the collected hyperparameters:
         for static_parameter, value in self._static_hyperparameters.items():
@@ -129,6 +131,8 @@ class MLRunLogger(Logger):
         }.items():
             # Log as a result to the context:
             self._context.log_result(metric_name, metric_results[-1])
+            # Log as a time-series metric (the step is the iteration):
+            self._context.log_metric(metric_name, metric_results[-1])
             # Create the plotly artifact:
             artifact = self._produce_convergence_plot_artifact(
                 name=f"{metric_name}_plot",
@@ -410,6 +410,9 @@ class HyperParamStrategies:
     list = "list"
     random = "random"
     custom = "custom"
+    successive_halving = "successive_halving"
+    hyperband = "hyperband"
+    bayesian = "bayesian"
 
     @staticmethod
     def all():
@@ -418,6 +421,26 @@ class HyperParamStrategies:
             HyperParamStrategies.list,
             HyperParamStrategies.random,
             HyperParamStrategies.custom,
+            HyperParamStrategies.successive_halving,
+            HyperParamStrategies.hyperband,
+            HyperParamStrategies.bayesian,
+        ]
+
+    @staticmethod
+    def sampling_strategies():
+        """strategies which sample a limited number (max_iterations) of param combinations"""
+        return [
+            HyperParamStrategies.random,
+            HyperParamStrategies.successive_halving,
+            HyperParamStrategies.bayesian,
+        ]
+
+    @staticmethod
+    def budget_strategies():
+        """strategies which allocate a growing budget (resource param) to the best param combinations"""
+        return [
+            HyperParamStrategies.successive_halving,
+            HyperParamStrategies.hyperband,
         ]
 
 
@@ -425,15 +448,26 @@ class HyperParamOptions(ModelObj):
     """Hyper Parameter Options
 
     Parameters:
-        param_file (str):       hyper params input file path/url, instead of inline
-        strategy (str):         hyper param strategy - grid, list or random
-        selector (str):         selection criteria for best result ([min|max.]<result>), e.g. max.accuracy
-        stop_condition (str):   early stop condition e.g. "accuracy > 0.9"
-        parallel_runs (int):    number of param combinations to run in parallel (over Dask)
-        dask_cluster_uri (str): db uri for a deployed dask cluster function, e.g. db://myproject/dask
-        max_iterations (int):   max number of runs (in random strategy)
-        max_errors (int):       max number of child runs errors for the overall job to fail
-        teardown_dask (bool):   kill the dask cluster pods after the runs
+        param_file (str):        hyper params input file path/url, instead of inline
+        strategy (str):          hyper param strategy - grid, list, random, successive_halving, hyperband
+                                 or bayesian
+        selector (str):          selection criteria for best result ([min|max.]<result>), e.g. max.accuracy
+        stop_condition (str):    early stop condition e.g. "accuracy > 0.9"
+        parallel_runs (int):     number of param combinations to run in parallel (over Dask)
+        dask_cluster_uri (str):  db uri for a deployed dask cluster function, e.g. db://myproject/dask
+        max_iterations (int):    max number of runs (in random and bayesian strategies), number of initial param
+                                 combinations (in successive_halving strategy)
+        max_errors (int):        max number of child runs errors for the overall job to fail
+        teardown_dask (bool):    kill the dask cluster pods after the runs
+        resource (str):          name of the budget param (e.g. epochs) which is set by the successive_halving and
+                                 hyperband strategies, and is the step of the early termination
+        min_resource (int):      min budget of a run (successive_halving and hyperband strategies), first step of
+                                 the early termination (default 1)
+        max_resource (int):      max budget of a run (successive_halving and hyperband strategies)
+        reduction_factor (int):  only 1/reduction_factor of the runs are promoted to the next budget (successive
+                                 halving, hyperband) or continue after an early termination step (default 3)
+        early_termination (bool): stop underperforming runs mid-run, the runs report their intermediate selector
+                                 results with context.should_prune()
     """
 
     def __init__(
@@ -447,6 +481,11 @@ class HyperParamOptions(ModelObj):
         max_iterations=None,
         max_errors=None,
         teardown_dask=None,
+        resource=None,
+        min_resource=None,
+        max_resource=None,
+        reduction_factor=None,
+        early_termination=None,
     ):
         self.param_file = param_file
         self.strategy = strategy
@@ -457,15 +496,34 @@ class HyperParamOptions(ModelObj):
         self.parallel_runs = parallel_runs
         self.dask_cluster_uri = dask_cluster_uri
         self.teardown_dask = teardown_dask
+        self.resource = resource
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.reduction_factor = reduction_factor
+        self.early_termination = early_termination
 
     def validate(self):
         if self.strategy and self.strategy not in HyperParamStrategies.all():
             raise mlrun.errors.MLRunInvalidArgumentError(
                 f"illegal hyper param strategy, use {','.join(HyperParamStrategies.all())}"
             )
-        if self.max_iterations and self.strategy != HyperParamStrategies.random:
+        if (
+            self.max_iterations
+            and self.strategy not in HyperParamStrategies.sampling_strategies()
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "max_iterations is only valid in "
+                f"{', '.join(HyperParamStrategies.sampling_strategies())} strategies"
+            )
+        if self.strategy in HyperParamStrategies.budget_strategies() and not (
+            self.resource and self.max_resource
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"resource and max_resource must be set in {self.strategy} strategy"
+            )
+        if self.reduction_factor is not None and self.reduction_factor < 2:
             raise mlrun.errors.MLRunInvalidArgumentError(
-                "max_iterations is only valid in random strategy"
+                "reduction_factor must be 2 or higher"
             )
 
 
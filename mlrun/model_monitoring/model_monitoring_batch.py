@@ -13,6 +13,7 @@
 # limitations under the License.
 #
 import collections
+import concurrent.futures
 import dataclasses
 import datetime
 import json
@@ -62,6 +63,9 @@ class TotalVarianceDistance:
 
     :args distrib_t: array of distribution t (usually the latest dataset distribution)
     :args distrib_u: array of distribution u (usually the sample dataset distribution)
+
+    The distributions may also be 2-D arrays with a distribution per column, in which case the distance is computed for
+    all the columns at once.
     """
 
     distrib_t: np.ndarray
@@ -69,13 +73,13 @@ class TotalVarianceDistance:
 
     NAME: ClassVar[str] = "tvd"
 
-    def compute(self) -> float:
+    def compute(self) -> Union[float, np.ndarray]:
         """
         Calculate Total Variance distance.
 
-        :returns:  Total Variance Distance.
+        :returns:  Total Variance Distance (per column for 2-D distributions).
         """
-        return np.sum(np.abs(self.distrib_t - self.distrib_u)) / 2
+        return np.sum(np.abs(self.distrib_t - self.distrib_u), axis=0) / 2
 
 
 @dataclasses.dataclass
@@ -88,6 +92,9 @@ class HellingerDistance:
 
     :args distrib_t: array of distribution t (usually the latest dataset distribution)
     :args distrib_u: array of distribution u (usually the sample dataset distribution)
+
+    The distributions may also be 2-D arrays with a distribution per column, in which case the distance is computed for
+    all the columns at once.
     """
 
     distrib_t: np.ndarray
@@ -95,13 +102,13 @@ class HellingerDistance:
 
     NAME: ClassVar[str] = "hellinger"
 
-    def compute(self) -> float:
+    def compute(self) -> Union[float, np.ndarray]:
         """
         Calculate Hellinger Distance
 
-        :returns: Hellinger Distance
+        :returns: Hellinger Distance (per column for 2-D distributions).
         """
-        return np.sqrt(1 - np.sum(np.sqrt(self.distrib_u * self.distrib_t)))
+        return np.sqrt(1 - np.sum(np.sqrt(self.distrib_u * self.distrib_t), axis=0))
 
 
 @dataclasses.dataclass
@@ -113,6 +120,9 @@ class KullbackLeiblerDivergence:
 
     :args distrib_t: array of distribution t (usually the latest dataset distribution)
     :args distrib_u: array of distribution u (usually the sample dataset distribution)
+
+    The distributions may also be 2-D arrays with a distribution per column, in which case the divergence is computed
+    for all the columns at once.
     """
 
     distrib_t: np.ndarray
@@ -120,39 +130,32 @@ class KullbackLeiblerDivergence:
 
     NAME: ClassVar[str] = "kld"
 
-    def compute(self, capping: float = None, kld_scaling: float = 1e-4) -> float:
+    def compute(
+        self, capping: float = None, kld_scaling: float = 1e-4
+    ) -> Union[float, np.ndarray]:
         """
         :param capping:      A bounded value for the KL Divergence. For infinite distance, the result is replaced with
                              the capping value which indicates a huge differences between the distributions.
         :param kld_scaling:  Will be used to replace 0 values for executing the logarithmic operation.
 
-        :returns: KL Divergence
+        :returns: KL Divergence (per column for 2-D distributions).
         """
+        # Zero probabilities do not contribute to the divergence, their log is masked out to avoid warnings
+        distrib_t = np.asarray(self.distrib_t, dtype=float)
+        distrib_u = np.asarray(self.distrib_u, dtype=float)
+        t_nonzero = distrib_t != 0
+        u_nonzero = distrib_u != 0
+        scaled_t = np.where(t_nonzero, distrib_t, kld_scaling)
+        scaled_u = np.where(u_nonzero, distrib_u, kld_scaling)
         t_u = np.sum(
-            np.where(
-                self.distrib_t != 0,
-                (self.distrib_t)
-                * np.log(
-                    self.distrib_t
-                    / np.where(self.distrib_u != 0, self.distrib_u, kld_scaling)
-                ),
-                0,
-            )
+            np.where(t_nonzero, distrib_t * np.log(scaled_t / scaled_u), 0), axis=0
         )
         u_t = np.sum(
-            np.where(
-                self.distrib_u != 0,
-                (self.distrib_u)
-                * np.log(
-                    self.distrib_u
-                    / np.where(self.distrib_t != 0, self.distrib_t, kld_scaling)
-                ),
-                0,
-            )
+            np.where(u_nonzero, distrib_u * np.log(scaled_u / scaled_t), 0), axis=0
         )
         result = t_u + u_t
         if capping:
-            return capping if result == float("inf") else result
+            return np.where(np.isinf(result), capping, result)[()]
         return result
 
 
@@ -234,16 +237,15 @@ class VirtualDrift:
 
         :returns: A dictionary in which for each metric (key) we assign the values for each feature.
         """
+        features = list(base_histogram.columns)
 
-        # compute the different metrics for each feature distribution and store the results in dictionary
+        # each metric is computed over all the features distributions at once (a distribution per column)
+        base_distributions = base_histogram.to_numpy(dtype=float)
+        latest_distributions = latest_histogram.loc[:, features].to_numpy(dtype=float)
         drift_measures = {}
         for metric_name, metric in self.metrics.items():
-            drift_measures[metric_name] = {
-                feature: metric(
-                    base_histogram.loc[:, feature], latest_histogram.loc[:, feature]
-                ).compute()
-                for feature in base_histogram
-            }
+            values = metric(base_distributions, latest_distributions).compute()
+            drift_measures[metric_name] = dict(zip(features, values.tolist()))
 
         return drift_measures
 
@@ -290,52 +292,33 @@ class VirtualDrift:
             latest_histogram.loc[:, features_common],
         )
 
-        # compute total value for each metric
-        for metric_name in self.metrics.keys():
-            feature_values = list(features_drift_measures[metric_name].values())
-            features_drift_measures[metric_name]["total_sum"] = np.sum(feature_values)
-            features_drift_measures[metric_name]["total_mean"] = np.mean(feature_values)
+        # define drift result dictionary with values as a dictionary
+        drift_result = collections.defaultdict(dict)
+
+        # fill drift result dictionary with the statistical metrics results per feature
+        # and the total sum and mean of each metric
+        for metric, values in features_drift_measures.items():
+            for feature, value in values.items():
+                drift_result[feature][metric] = value
+            feature_values = np.fromiter(values.values(), dtype=float)
+            drift_result[f"{metric}_sum"] = np.sum(feature_values)
+            drift_result[f"{metric}_mean"] = np.mean(feature_values)
 
             # add weighted mean by given feature weights if provided
             if self.feature_weights:
-                features_drift_measures[metric_name]["total_weighted_mean"] = np.dot(
+                drift_result[f"{metric}_weighted_mean"] = np.dot(
                     feature_values, self.feature_weights
                 )
 
-        # define drift result dictionary with values as a dictionary
-        drift_result = collections.defaultdict(dict)
-
-        # fill drift result dictionary with the statistical metrics results per feature
-        # and the total sum and mean of each metric
-        for feature in features_common:
-            for metric, values in features_drift_measures.items():
-                drift_result[feature][metric] = values[feature]
-                sum = features_drift_measures[metric]["total_sum"]
-                mean = features_drift_measures[metric]["total_mean"]
-                drift_result[f"{metric}_sum"] = sum
-                drift_result[f"{metric}_mean"] = mean
-                if self.feature_weights:
-                    metric_measure = features_drift_measures[metric]
-                    weighted_mean = metric_measure["total_weighted_mean"]
-                    drift_result[f"{metric}_weighted_mean"] = weighted_mean
-
-        # compute the drift metric over the labels
-        if self.label_col:
-            label_drift_measures = self.compute_metrics_over_df(
-                base_histogram.loc[:, self.label_col],
-                latest_histogram.loc[:, self.label_col],
-            )
-            for metric, values in label_drift_measures.items():
-                drift_result[self.label_col][metric] = values[metric]
-
-        # compute the drift metric over the predictions
-        if self.prediction_col:
-            prediction_drift_measures = self.compute_metrics_over_df(
-                base_histogram.loc[:, self.prediction_col],
-                latest_histogram.loc[:, self.prediction_col],
-            )
-            for metric, values in prediction_drift_measures.items():
-                drift_result[self.prediction_col][metric] = values[metric]
+        # compute the drift metric over the labels and the predictions
+        for column in [self.label_col, self.prediction_col]:
+            if column:
+                column_drift_measures = self.compute_metrics_over_df(
+                    base_histogram.loc[:, [column]],
+                    latest_histogram.loc[:, [column]],
+                )
+                for metric, values in column_drift_measures.items():
+                    drift_result[column][metric] = values[column]
 
         return drift_result
 
@@ -461,13 +444,25 @@ def calculate_inputs_statistics(
 
     :returns: The calculated statistics of the inputs data.
     """
-    # Use `DFDataInfer` to calculate the statistics over the inputs:
+    # Use `DFDataInfer` to calculate the statistics over the inputs, only the features which are not in the sample-set
+    # need their histograms calculated over new bins:
+    new_features = [
+        feature for feature in inputs.columns if feature not in sample_set_statistics
+    ]
     inputs_statistics = mlrun.data_types.infer.DFDataInfer.get_stats(
         df=inputs,
-        options=mlrun.data_types.infer.InferOptions.Histogram,
+        options=mlrun.data_types.infer.InferOptions.Null,
     )
+    if new_features:
+        new_features_statistics = mlrun.data_types.infer.DFDataInfer.get_stats(
+            df=inputs[new_features],
+            options=mlrun.data_types.infer.InferOptions.Histogram,
+        )
+        for feature, statistics in new_features_statistics.items():
+            if "hist" in statistics:
+                inputs_statistics[feature]["hist"] = statistics["hist"]
 
-    # Recalculate the histograms over the bins that are set in the sample-set of the end point:
+    # Calculate the histograms over the bins that are set in the sample-set of the end point:
     for feature in inputs_statistics.keys():
         if feature in sample_set_statistics:
             counts, bins = np.histogram(
@@ -482,6 +477,102 @@ def calculate_inputs_statistics(
     return inputs_statistics
 
 
+def calculate_inputs_incremental_statistics(
+    sample_set_statistics: dict, inputs: pd.DataFrame, bins: Dict[str, list] = None
+) -> dict:
+    """
+    Calculate mergeable statistics of the inputs data (counts, sums and histograms), so statistics of different
+    batches of inputs can be merged using `merge_inputs_incremental_statistics`.
+
+    :param sample_set_statistics: The sample set (stored end point's dataset to reference) statistics. The bins of the
+                                  histograms of each feature will be used to calculate the histograms of the inputs.
+    :param inputs:                The inputs to calculate their statistics.
+    :param bins:                  Bins to use for the histograms of features which are not in the sample set. Values
+                                  out of the bins range are not counted in the histogram. Features without bins get
+                                  bins according to their values.
+
+    :returns: The mergeable statistics of the inputs data.
+    """
+    bins = bins or {}
+    inputs_statistics = {}
+    for feature in inputs.columns:
+        if not pd.api.types.is_numeric_dtype(inputs[feature]):
+            continue
+        values = inputs[feature].dropna().to_numpy(dtype=float)
+        if not len(values):
+            continue
+        if feature in sample_set_statistics:
+            feature_bins = sample_set_statistics[feature]["hist"][1]
+        elif feature in bins:
+            feature_bins = bins[feature]
+        else:
+            feature_bins = np.histogram_bin_edges(
+                values, bins=mlrun.data_types.infer.default_num_bins
+            ).tolist()
+        counts, _ = np.histogram(values, bins=feature_bins)
+        inputs_statistics[feature] = {
+            "count": len(values),
+            "sum": float(np.sum(values)),
+            "sum_of_squares": float(np.sum(np.square(values))),
+            "min": float(np.min(values)),
+            "max": float(np.max(values)),
+            "hist": [counts.tolist(), list(feature_bins)],
+        }
+
+    return inputs_statistics
+
+
+def merge_inputs_incremental_statistics(statistics: List[dict]) -> dict:
+    """
+    Merge statistics calculated by `calculate_inputs_incremental_statistics` into the inputs data statistics used for
+    drift monitoring (count, mean, std, min, max and histogram of each feature).
+
+    :param statistics: The list of statistics to merge.
+
+    :returns: The merged statistics of the inputs data.
+    """
+    merged_statistics = {}
+    for batch_statistics in statistics:
+        for feature, feature_statistics in batch_statistics.items():
+            if feature not in merged_statistics:
+                merged_statistics[feature] = {
+                    **feature_statistics,
+                    "hist": [
+                        np.array(feature_statistics["hist"][0]),
+                        feature_statistics["hist"][1],
+                    ],
+                }
+                continue
+            merged = merged_statistics[feature]
+            for key in ["count", "sum", "sum_of_squares"]:
+                merged[key] += feature_statistics[key]
+            merged["min"] = min(merged["min"], feature_statistics["min"])
+            merged["max"] = max(merged["max"], feature_statistics["max"])
+            merged["hist"][0] = merged["hist"][0] + np.array(
+                feature_statistics["hist"][0]
+            )
+
+    inputs_statistics = {}
+    for feature, merged in merged_statistics.items():
+        count = merged["count"]
+        mean = merged["sum"] / count
+        inputs_statistics[feature] = {
+            "count": count,
+            "mean": mean,
+            "min": merged["min"],
+            "max": merged["max"],
+            "hist": [merged["hist"][0].tolist(), merged["hist"][1]],
+        }
+        # Sample standard deviation, same as calculated by pandas describe (undefined for a single value)
+        if count > 1:
+            variance = max(merged["sum_of_squares"] - count * mean**2, 0) / (
+                count - 1
+            )
+            inputs_statistics[feature]["std"] = float(np.sqrt(variance))
+
+    return inputs_statistics
+
+
 class BatchProcessor:
     """
     The main object to handle the batch processing job. This object is used to get the required configurations and
@@ -543,6 +634,21 @@ class BatchProcessor:
                 project=project, kind="parquet"
             )
         )
+        self.incremental_state_path = (
+            mlrun.mlconf.model_endpoint_monitoring.store_prefixes.user_space.format(
+                project=project, kind="batch-state"
+            )
+        )
+
+        # Number of endpoints to process concurrently and whether to keep the histograms state between runs, so each
+        # run reads only the events that are newer than the last processed event
+        self.max_workers = max(
+            int(mlrun.mlconf.model_endpoint_monitoring.batch_processing_max_workers),
+            1,
+        )
+        self.incremental = (
+            mlrun.mlconf.model_endpoint_monitoring.batch_processing_incremental
+        )
 
         logger.info(
             "Initializing BatchProcessor",
@@ -556,6 +662,8 @@ class BatchProcessor:
             tsdb_path=self.tsdb_path,
             stream_container=self.stream_container,
             stream_path=self.stream_path,
+            max_workers=self.max_workers,
+            incremental=self.incremental,
         )
 
         # Get drift thresholds from the model monitoring configuration
@@ -628,94 +736,146 @@ class BatchProcessor:
             ):
                 active_endpoints.add(endpoint.metadata.uid)
 
-        # perform drift analysis for each model endpoint
-        for endpoint_id in active_endpoints:
-            try:
+        # perform drift analysis for each model endpoint, the endpoints are independent of each other so they can be
+        # processed concurrently (bounded by the configured number of workers)
+        max_workers = min(self.max_workers, len(active_endpoints))
+        if max_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                list(executor.map(self.update_drift_status, active_endpoints))
+        else:
+            for endpoint_id in active_endpoints:
+                self.update_drift_status(endpoint_id)
+
+    def update_drift_status(self, endpoint_id: str):
+        """
+        Perform the drift analysis of a single model endpoint and write the results into tsdb and KV table. Errors are
+        logged and kept in `self.exception` so the other endpoints are still processed.
 
-                # Get model endpoint object:
-                endpoint = self.db.get_model_endpoint(
-                    project=self.project, endpoint_id=endpoint_id
-                )
+        :param endpoint_id: The unique id of the model endpoint.
+        """
+        try:
 
-                # Skip router endpoint:
-                if (
-                    endpoint.status.endpoint_type
-                    == mlrun.utils.model_monitoring.EndpointType.ROUTER
-                ):
-                    # endpoint.status.feature_stats is None
-                    logger.info(f"{endpoint_id} is router skipping")
-                    continue
-
-                # convert feature set into dataframe and get the latest dataset
-                (
-                    _,
-                    serving_function_name,
-                    _,
-                    _,
-                ) = mlrun.utils.helpers.parse_versioned_object_uri(
-                    endpoint.spec.function_uri
-                )
+            # Get model endpoint object:
+            endpoint = self.db.get_model_endpoint(
+                project=self.project, endpoint_id=endpoint_id
+            )
 
-                model_name = endpoint.spec.model.replace(":", "-")
+            # Skip router endpoint:
+            if (
+                endpoint.status.endpoint_type
+                == mlrun.utils.model_monitoring.EndpointType.ROUTER
+            ):
+                # endpoint.status.feature_stats is None
+                logger.info(f"{endpoint_id} is router skipping")
+                return
+
+            # convert feature set into dataframe and get the latest dataset
+            (
+                _,
+                serving_function_name,
+                _,
+                _,
+            ) = mlrun.utils.helpers.parse_versioned_object_uri(
+                endpoint.spec.function_uri
+            )
 
-                m_fs = fstore.get_feature_set(
-                    f"store://feature-sets/{self.project}/monitoring-{serving_function_name}-{model_name}"
-                )
+            model_name = endpoint.spec.model.replace(":", "-")
 
-                # Getting batch interval start time and end time
-                start_time, end_time = self.get_interval_range()
+            m_fs = fstore.get_feature_set(
+                f"store://feature-sets/{self.project}/monitoring-{serving_function_name}-{model_name}"
+            )
 
-                try:
-                    df = m_fs.to_dataframe(
-                        start_time=start_time,
-                        end_time=end_time,
-                        time_column="timestamp",
+            # Getting batch interval start time and end time
+            start_time, end_time = self.get_interval_range()
+
+            incremental_state = None
+            read_start_time = start_time
+            if self.incremental:
+                incremental_state = self._load_incremental_state(endpoint_id)
+                watermark = incremental_state["watermark"]
+                if watermark is not None:
+                    # Only the events which are newer than the last processed event are read
+                    naive_watermark = (
+                        watermark.tz_convert(None) if watermark.tzinfo else watermark
                     )
+                    read_start_time = max(start_time, naive_watermark.to_pydatetime())
 
-                    if len(df) == 0:
-                        logger.warn(
-                            "Not enough model events since the beginning of the batch interval",
-                            parquet_target=m_fs.status.targets[0].path,
-                            endpoint=endpoint_id,
-                            min_rqeuired_events=mlrun.mlconf.model_endpoint_monitoring.parquet_batching_max_events,
-                            start_time=str(
-                                datetime.datetime.now() - datetime.timedelta(hours=1)
-                            ),
-                            end_time=str(datetime.datetime.now()),
-                        )
-                        continue
-
-                # TODO: The below warn will be removed once the state of the Feature Store target is updated
-                #       as expected. In that case, the existence of the file will be checked before trying to get
-                #       the offline data from the feature set.
-                # Continue if not enough events provided since the deployment of the model endpoint
-                except FileNotFoundError:
+            try:
+                df = m_fs.to_dataframe(
+                    start_time=read_start_time,
+                    end_time=end_time,
+                    time_column="timestamp",
+                )
+                if incremental_state and incremental_state["watermark"] is not None:
+                    df = df[
+                        pd.to_datetime(df["timestamp"]) > incremental_state["watermark"]
+                    ]
+
+                if len(df) == 0 and not (
+                    incremental_state
+                    and self._has_incremental_buckets(incremental_state, start_time)
+                ):
                     logger.warn(
-                        "Parquet not found, probably due to not enough model events",
+                        "Not enough model events since the beginning of the batch interval",
                         parquet_target=m_fs.status.targets[0].path,
                         endpoint=endpoint_id,
                         min_rqeuired_events=mlrun.mlconf.model_endpoint_monitoring.parquet_batching_max_events,
+                        start_time=str(
+                            datetime.datetime.now() - datetime.timedelta(hours=1)
+                        ),
+                        end_time=str(datetime.datetime.now()),
                     )
-                    continue
+                    return
+
+            # TODO: The below warn will be removed once the state of the Feature Store target is updated
+            #       as expected. In that case, the existence of the file will be checked before trying to get
+            #       the offline data from the feature set.
+            # Continue if not enough events provided since the deployment of the model endpoint
+            except FileNotFoundError:
+                logger.warn(
+                    "Parquet not found, probably due to not enough model events",
+                    parquet_target=m_fs.status.targets[0].path,
+                    endpoint=endpoint_id,
+                    min_rqeuired_events=mlrun.mlconf.model_endpoint_monitoring.parquet_batching_max_events,
+                )
+                return
 
-                # Get feature names from monitoring feature set
-                feature_names = [
-                    feature_name["name"]
-                    for feature_name in m_fs.spec.features.to_dict()
-                ]
+            # Get feature names from monitoring feature set
+            feature_names = [
+                feature_name["name"] for feature_name in m_fs.spec.features.to_dict()
+            ]
 
-                # Create DataFrame based on the input features
-                stats_columns = [
-                    "timestamp",
-                    *feature_names,
-                ]
+            # Create DataFrame based on the input features
+            stats_columns = [
+                "timestamp",
+                *feature_names,
+            ]
 
-                # Add label names if provided
-                if endpoint.spec.label_names:
-                    stats_columns.extend(endpoint.spec.label_names)
+            # Add label names if provided
+            if endpoint.spec.label_names:
+                stats_columns.extend(endpoint.spec.label_names)
 
-                named_features_df = df[stats_columns].copy()
+            named_features_df = df[stats_columns].copy()
 
+            if incremental_state:
+                # Get the current stats by merging the statistics of the new events with the statistics of the
+                # previous runs which are still within the batch interval:
+                timestamp, current_stats = self._update_incremental_state(
+                    endpoint_id=endpoint_id,
+                    incremental_state=incremental_state,
+                    sample_set_statistics=endpoint.status.feature_stats,
+                    inputs=named_features_df,
+                    start_time=start_time,
+                )
+                if len(named_features_df):
+                    m_fs.status.stats = current_stats
+                    m_fs.status.preview = mlrun.data_types.infer.get_df_preview(
+                        named_features_df
+                    )
+                    m_fs.save()
+            else:
                 # Infer feature set stats and schema
                 fstore.api._infer_from_static_df(
                     named_features_df,
@@ -735,103 +895,198 @@ class BatchProcessor:
                     inputs=named_features_df,
                 )
 
-                # Compute the drift based on the histogram of the current stats and the histogram of the original
-                # feature stats that can be found in the model endpoint object:
-                drift_result = self.virtual_drift.compute_drift_from_histograms(
-                    feature_stats=endpoint.status.feature_stats,
-                    current_stats=current_stats,
-                )
-                logger.info("Drift result", drift_result=drift_result)
+            # Compute the drift based on the histogram of the current stats and the histogram of the original
+            # feature stats that can be found in the model endpoint object:
+            drift_result = self.virtual_drift.compute_drift_from_histograms(
+                feature_stats=endpoint.status.feature_stats,
+                current_stats=current_stats,
+            )
+            logger.info("Drift result", drift_result=drift_result)
 
-                # Get drift thresholds from the model configuration:
-                monitor_configuration = endpoint.spec.monitor_configuration or {}
-                possible_drift = monitor_configuration.get(
-                    "possible_drift", self.default_possible_drift_threshold
-                )
-                drift_detected = monitor_configuration.get(
-                    "drift_detected", self.default_drift_detected_threshold
+            # Get drift thresholds from the model configuration:
+            monitor_configuration = endpoint.spec.monitor_configuration or {}
+            possible_drift = monitor_configuration.get(
+                "possible_drift", self.default_possible_drift_threshold
+            )
+            drift_detected = monitor_configuration.get(
+                "drift_detected", self.default_drift_detected_threshold
+            )
+
+            # Check for possible drift based on the results of the statistical metrics defined above:
+            drift_status, drift_measure = self.virtual_drift.check_for_drift(
+                metrics_results_dictionary=drift_result,
+                possible_drift_threshold=possible_drift,
+                drift_detected_threshold=drift_detected,
+            )
+            logger.info(
+                "Drift status",
+                endpoint_id=endpoint_id,
+                drift_status=drift_status.value,
+                drift_measure=drift_measure,
+            )
+
+            # If drift was detected, add the results to the input stream
+            if (
+                drift_status == DriftStatus.POSSIBLE_DRIFT
+                or drift_status == DriftStatus.DRIFT_DETECTED
+            ):
+                self.v3io.stream.put_records(
+                    container=self.stream_container,
+                    stream_path=self.stream_path,
+                    records=[
+                        {
+                            "data": json.dumps(
+                                {
+                                    "endpoint_id": endpoint_id,
+                                    "drift_status": drift_status.value,
+                                    "drift_measure": drift_measure,
+                                    "drift_per_feature": {**drift_result},
+                                }
+                            )
+                        }
+                    ],
                 )
 
-                # Check for possible drift based on the results of the statistical metrics defined above:
-                drift_status, drift_measure = self.virtual_drift.check_for_drift(
-                    metrics_results_dictionary=drift_result,
-                    possible_drift_threshold=possible_drift,
-                    drift_detected_threshold=drift_detected,
+            attributes = {
+                "current_stats": json.dumps(current_stats),
+                "drift_measures": json.dumps(drift_result),
+                "drift_status": drift_status.value,
+            }
+
+            self.db.patch_model_endpoint(
+                project=self.project,
+                endpoint_id=endpoint_id,
+                attributes=attributes,
+            )
+
+            # Update the results in tsdb:
+            tsdb_drift_measures = {
+                "endpoint_id": endpoint_id,
+                "timestamp": pd.to_datetime(
+                    timestamp,
+                    format=EventFieldType.TIME_FORMAT,
+                ),
+                "record_type": "drift_measures",
+                "tvd_mean": drift_result["tvd_mean"],
+                "kld_mean": drift_result["kld_mean"],
+                "hellinger_mean": drift_result["hellinger_mean"],
+            }
+
+            try:
+                self.frames.write(
+                    backend="tsdb",
+                    table=self.tsdb_path,
+                    dfs=pd.DataFrame.from_dict([tsdb_drift_measures]),
+                    index_cols=["timestamp", "endpoint_id", "record_type"],
                 )
-                logger.info(
-                    "Drift status",
-                    endpoint_id=endpoint_id,
-                    drift_status=drift_status.value,
-                    drift_measure=drift_measure,
+            except v3io_frames.errors.Error as err:
+                logger.warn(
+                    "Could not write drift measures to TSDB",
+                    err=err,
+                    tsdb_path=self.tsdb_path,
+                    endpoint=endpoint_id,
                 )
 
-                # If drift was detected, add the results to the input stream
-                if (
-                    drift_status == DriftStatus.POSSIBLE_DRIFT
-                    or drift_status == DriftStatus.DRIFT_DETECTED
-                ):
-                    self.v3io.stream.put_records(
-                        container=self.stream_container,
-                        stream_path=self.stream_path,
-                        records=[
-                            {
-                                "data": json.dumps(
-                                    {
-                                        "endpoint_id": endpoint_id,
-                                        "drift_status": drift_status.value,
-                                        "drift_measure": drift_measure,
-                                        "drift_per_feature": {**drift_result},
-                                    }
-                                )
-                            }
-                        ],
-                    )
+            logger.info("Done updating drift measures", endpoint_id=endpoint_id)
 
-                attributes = {
-                    "current_stats": json.dumps(current_stats),
-                    "drift_measures": json.dumps(drift_result),
-                    "drift_status": drift_status.value,
-                }
+        except Exception as e:
+            logger.error(f"Exception for endpoint {endpoint_id}")
+            self.exception = e
 
-                self.db.patch_model_endpoint(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    attributes=attributes,
-                )
+    def _get_incremental_state_path(self, endpoint_id: str) -> str:
+        return f"{self.incremental_state_path}/{endpoint_id}.json"
 
-                # Update the results in tsdb:
-                tsdb_drift_measures = {
-                    "endpoint_id": endpoint_id,
-                    "timestamp": pd.to_datetime(
-                        timestamp,
-                        format=EventFieldType.TIME_FORMAT,
-                    ),
-                    "record_type": "drift_measures",
-                    "tvd_mean": drift_result["tvd_mean"],
-                    "kld_mean": drift_result["kld_mean"],
-                    "hellinger_mean": drift_result["hellinger_mean"],
-                }
+    def _load_incremental_state(self, endpoint_id: str) -> dict:
+        """
+        Load the histograms state that was kept by the previous runs of the endpoint. The state holds the watermark
+        (timestamp of the latest processed event) and a bucket of mergeable statistics per run.
+        """
+        path = self._get_incremental_state_path(endpoint_id)
+        try:
+            state = json.loads(mlrun.get_dataitem(path).get())
+        except Exception as exc:
+            logger.info(
+                "No incremental state found for endpoint, processing the whole batch interval",
+                endpoint=endpoint_id,
+                path=path,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            return {"watermark": None, "buckets": []}
+        for bucket in state["buckets"]:
+            bucket["end_time"] = pd.Timestamp(bucket["end_time"])
+        return {
+            "watermark": pd.Timestamp(state["watermark"]),
+            "buckets": state["buckets"],
+        }
 
-                try:
-                    self.frames.write(
-                        backend="tsdb",
-                        table=self.tsdb_path,
-                        dfs=pd.DataFrame.from_dict([tsdb_drift_measures]),
-                        index_cols=["timestamp", "endpoint_id", "record_type"],
-                    )
-                except v3io_frames.errors.Error as err:
-                    logger.warn(
-                        "Could not write drift measures to TSDB",
-                        err=err,
-                        tsdb_path=self.tsdb_path,
-                        endpoint=endpoint_id,
-                    )
+    @staticmethod
+    def _is_bucket_in_interval(bucket: dict, start_time: datetime.datetime) -> bool:
+        end_time = bucket["end_time"]
+        if end_time.tzinfo:
+            end_time = end_time.tz_convert(None)
+        return end_time >= start_time
+
+    def _has_incremental_buckets(
+        self, incremental_state: dict, start_time: datetime.datetime
+    ) -> bool:
+        return any(
+            self._is_bucket_in_interval(bucket, start_time)
+            for bucket in incremental_state["buckets"]
+        )
 
-                logger.info("Done updating drift measures", endpoint_id=endpoint_id)
+    def _update_incremental_state(
+        self,
+        endpoint_id: str,
+        incremental_state: dict,
+        sample_set_statistics: dict,
+        inputs: pd.DataFrame,
+        start_time: datetime.datetime,
+    ) -> Tuple[pd.Timestamp, dict]:
+        """
+        Add the statistics of the new events to the endpoint's incremental state, expire the buckets which are out of
+        the batch interval and save the state.
 
-            except Exception as e:
-                logger.error(f"Exception for endpoint {endpoint_id}")
-                self.exception = e
+        :returns: A tuple of the latest event timestamp and the current stats of the batch interval.
+        """
+        buckets = [
+            bucket
+            for bucket in incremental_state["buckets"]
+            if self._is_bucket_in_interval(bucket, start_time)
+        ]
+        watermark = incremental_state["watermark"]
+        if len(inputs):
+            timestamps = pd.to_datetime(inputs["timestamp"])
+            watermark = timestamps.max()
+            # Histograms of features which are not in the sample set must keep the bins of the previous buckets to be
+            # mergeable
+            bins = {}
+            for bucket in buckets:
+                for feature, statistics in bucket["statistics"].items():
+                    bins.setdefault(feature, statistics["hist"][1])
+            buckets.append(
+                {
+                    "end_time": watermark,
+                    "statistics": calculate_inputs_incremental_statistics(
+                        sample_set_statistics=sample_set_statistics,
+                        inputs=inputs.drop(columns=["timestamp"]),
+                        bins=bins,
+                    ),
+                }
+            )
+
+        state = {
+            "watermark": watermark.isoformat(),
+            "buckets": [
+                {**bucket, "end_time": bucket["end_time"].isoformat()}
+                for bucket in buckets
+            ],
+        }
+        mlrun.get_dataitem(self._get_incremental_state_path(endpoint_id)).put(
+            json.dumps(state)
+        )
+        return watermark, merge_inputs_incremental_statistics(
+            [bucket["statistics"] for bucket in buckets]
+        )
 
     def get_interval_range(self) -> Tuple[datetime.datetime, datetime.datetime]:
         """Getting batch interval time range"""
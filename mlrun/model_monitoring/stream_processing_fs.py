@@ -616,6 +616,50 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         if found_errors:
             return None
 
+        # Micro batches of records (pushed by the model server when batching is enabled) are split into records, both
+        # the columnar format ("columns" per header) and the row format ("values" per record) are supported
+        if "headers" in event:
+            headers = event["headers"]
+            if "columns" in event:
+                rows = zip(*event["columns"])
+            else:
+                rows = event.get("values", [])
+            base_event = {
+                key: value
+                for key, value in event.items()
+                if key not in ["headers", "columns", "values"]
+            }
+            events = []
+            for row in rows:
+                record_events = self._process_record(
+                    {**base_event, **dict(zip(headers, row))},
+                    endpoint_id,
+                    function_uri,
+                    versioned_model,
+                )
+                events.extend(record_events or [])
+            if not events:
+                return None
+        else:
+            events = self._process_record(
+                event, endpoint_id, function_uri, versioned_model
+            )
+            if events is None:
+                return None
+
+        # Create a storey event object with list of events, based on endpoint_id which will be used
+        # in the upcoming steps
+        storey_event = storey.Event(body=events, key=endpoint_id)
+        return storey_event
+
+    def _process_record(
+        self, event: dict, endpoint_id: str, function_uri: str, versioned_model: str
+    ) -> typing.Optional[typing.List[dict]]:
+        """
+        Validate a single model server record and split it into sub-events, one per model invocation.
+
+        :returns: The list of sub-events or None if the record is not valid.
+        """
         # Validate event fields
         model_class = event.get("model_class") or event.get("class")
         timestamp = event.get("when")
@@ -714,10 +758,7 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
                 }
             )
 
-        # Create a storey event object with list of events, based on endpoint_id which will be used
-        # in the upcoming steps
-        storey_event = storey.Event(body=events, key=endpoint_id)
-        return storey_event
+        return events
 
     def is_list_of_numerics(
         self,
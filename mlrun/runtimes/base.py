@@ -456,6 +456,9 @@ class BaseRuntime(ModelObj):
             # verify valid task parameters
             tasks = task_generator.generate(run)
             for task in tasks:
+                if task is None:
+                    # adaptive generators wait for results before proposing more tasks
+                    break
                 self._verify_run_params(task.spec.parameters)
 
         # post verifications, store execution in db and run pre run hooks
@@ -890,10 +893,14 @@ class BaseRuntime(ModelObj):
         num_errors = 0
         tasks = generator.generate(runobj)
         for task in tasks:
+            if task is None:
+                # the results of all the previous tasks are already reported, there is nothing to wait for
+                break
             try:
                 self.store_run(task)
                 resp = self._run(task, execution)
                 resp = self._update_run_state(resp, task=task)
+                generator.report_result(resp)
                 run_results = resp["status"].get("results", {})
                 if generator.eval_stop_condition(run_results):
                     logger.info(
@@ -907,6 +914,7 @@ class BaseRuntime(ModelObj):
                 error_string = err_to_str(err)
                 task.status.error = error_string
                 resp = self._update_run_state(task=task, err=error_string)
+                generator.report_result(resp)
                 num_errors += 1
                 if num_errors > generator.max_errors:
                     logger.error("too many errors, stopping iterations!")
@@ -936,8 +944,9 @@ class BaseRuntime(ModelObj):
         resp: dict = None,
         task: RunObject = None,
         err=None,
+        update_db: bool = True,
     ) -> dict:
-        """update the task state in the DB"""
+        """update the task state in the DB (or only in the returned run dict when update_db is False)"""
         was_none = False
         if resp is None and task:
             was_none = True
@@ -987,7 +996,10 @@ class BaseRuntime(ModelObj):
             last_state=last_state,
             updates=updates,
         )
-        if self._get_db() and updates:
+        if updates and not update_db:
+            for key, value in updates.items():
+                update_in(resp, key, value)
+        elif self._get_db() and updates:
             project = get_in(resp, "metadata.project")
             iter = get_in(resp, "metadata.iteration", 0)
             self._get_db().update_run(updates, uid, project, iter=iter)
@@ -959,62 +959,81 @@ class RemoteRuntime(KubeResource):
 
     async def _invoke_async(self, tasks, url, headers, secrets, generator):
         results = RunList()
-        runs = []
+        runs = set()
         num_errors = 0
         stop = False
         parallel_runs = generator.options.parallel_runs or 1
         semaphore = asyncio.Semaphore(parallel_runs)
 
+        def process_result(status, resp, logs, task):
+            nonlocal num_errors
+            if status != 200:
+                err_message = f"failed to access {url} - {resp}"
+                # TODO: store logs using async calls to improve performance
+                log_std(
+                    self._db_conn,
+                    task,
+                    parse_logs(logs) if logs else None,
+                    err_message,
+                    silent=True,
+                )
+                # TODO: update run using async calls to improve performance
+                resp = self._update_run_state(task=task, err=err_message)
+                results.append(resp)
+                generator.report_result(resp)
+                num_errors += 1
+            else:
+                if logs:
+                    log_std(self._db_conn, task, parse_logs(logs))
+                resp = self._update_run_state(json.loads(resp))
+                state = get_in(resp, "status.state", "")
+                if state == "error":
+                    num_errors += 1
+                results.append(resp)
+                generator.report_result(resp)
+
+                run_results = get_in(resp, "status.results", {})
+                if generator.eval_stop_condition(run_results):
+                    logger.info(
+                        f"reached early stop condition ({generator.options.stop_condition}), stopping iterations!"
+                    )
+                    return True
+
+            if num_errors > generator.max_errors:
+                logger.error("max errors reached, stopping iterations!")
+                return True
+            return False
+
         async with ClientSession() as session:
             for task in tasks:
+                if task is None:
+                    # adaptive generators wait for the running tasks results before proposing more tasks
+                    if not runs:
+                        break
+                    done, runs = await asyncio.wait(
+                        runs, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for run in done:
+                        stop = process_result(*run.result()) or stop
+                    if stop:
+                        break
+                    continue
                 # TODO: store run using async calls to improve performance
                 self.store_run(task)
                 task.spec.secret_sources = secrets or []
                 resp = submit(session, url, task, semaphore, headers=headers)
-                runs.append(
+                runs.add(
                     asyncio.ensure_future(
                         resp,
                     )
                 )
 
-            for result in asyncio.as_completed(runs):
-                status, resp, logs, task = await result
-
-                if status != 200:
-                    err_message = f"failed to access {url} - {resp}"
-                    # TODO: store logs using async calls to improve performance
-                    log_std(
-                        self._db_conn,
-                        task,
-                        parse_logs(logs) if logs else None,
-                        err_message,
-                        silent=True,
-                    )
-                    # TODO: update run using async calls to improve performance
-                    results.append(self._update_run_state(task=task, err=err_message))
-                    num_errors += 1
-                else:
-                    if logs:
-                        log_std(self._db_conn, task, parse_logs(logs))
-                    resp = self._update_run_state(json.loads(resp))
-                    state = get_in(resp, "status.state", "")
-                    if state == "error":
-                        num_errors += 1
-                    results.append(resp)
-
-                    run_results = get_in(resp, "status.results", {})
-                    stop = generator.eval_stop_condition(run_results)
+            if not stop:
+                for result in asyncio.as_completed(runs):
+                    stop = process_result(*await result)
                     if stop:
-                        logger.info(
-                            f"reached early stop condition ({generator.options.stop_condition}), stopping iterations!"
-                        )
                         break
 
-                if num_errors > generator.max_errors:
-                    logger.error("max errors reached, stopping iterations!")
-                    stop = True
-                    break
-
         if stop:
             for task in runs:
                 task.cancel()
@@ -12,18 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import math
 import random
 import sys
 from copy import deepcopy
 
 import pandas as pd
 
-from ..model import HyperParamOptions, RunObject, RunSpec
-from ..utils import get_in
+import mlrun.errors
 
-hyper_types = ["list", "grid", "random"]
+from ..model import HyperParamOptions, HyperParamStrategies, RunObject, RunSpec
+from ..utils import get_in, logger
+from ..utils.run_metrics import read_run_metrics
+
+hyper_types = [
+    "list",
+    "grid",
+    "random",
+    "successive_halving",
+    "hyperband",
+    "bayesian",
+]
 default_max_iterations = 10
 default_max_errors = 3
+default_reduction_factor = 3
+default_initial_points = 5
+# fraction of the completed runs which are considered good by the bayesian (TPE) proposals
+tpe_gamma = 0.25
+tpe_candidates = 24
 
 
 def get_generator(spec: RunSpec, execution, param_file_secrets: dict = None):
@@ -49,7 +65,7 @@ def get_generator(spec: RunSpec, execution, param_file_secrets: dict = None):
         obj = execution.get_dataitem(param_file, secrets=param_file_secrets)
         if not strategy and obj.suffix == ".csv":
             strategy = "list"
-        if not strategy or strategy in ["grid", "random"]:
+        if not strategy or strategy != "list":
             hyperparams = json.loads(obj.get())
 
     if not strategy or strategy == "grid":
@@ -58,6 +74,16 @@ def get_generator(spec: RunSpec, execution, param_file_secrets: dict = None):
     if strategy == "random":
         return RandomGenerator(hyperparams, options)
 
+    if strategy in HyperParamStrategies.budget_strategies():
+        return HyperbandGenerator(
+            hyperparams,
+            options,
+            single_bracket=strategy == HyperParamStrategies.successive_halving,
+        )
+
+    if strategy == "bayesian":
+        return BayesianGenerator(hyperparams, options)
+
     if obj:
         df = obj.as_df()
     else:
@@ -66,6 +92,9 @@ def get_generator(spec: RunSpec, execution, param_file_secrets: dict = None):
 
 
 class TaskGenerator:
+    # adaptive generators propose tasks based on the results of the completed tasks
+    is_adaptive = False
+
     def __init__(self, options: HyperParamOptions):
         self.options = options
 
@@ -83,6 +112,10 @@ class TaskGenerator:
     def generate(self, run: RunObject):
         pass
 
+    def report_result(self, result: dict):
+        """report the result (run dict) of a completed task, used by the adaptive generators"""
+        pass
+
     def eval_stop_condition(self, results) -> bool:
         if not self.options.stop_condition:
             return False
@@ -162,11 +195,265 @@ class ListGenerator(TaskGenerator):
             yield newrun
 
 
+class AdaptiveGenerator(TaskGenerator):
+    """base of the generators which propose the next tasks based on the results of the completed tasks
+
+    the generate() iterator yields None when it cannot propose more tasks before the results of the running tasks
+    are reported (with report_result()), the runners should wait for a running task to complete when they get None
+    """
+
+    is_adaptive = True
+
+    def __init__(self, hyperparams: dict, options=None):
+        super().__init__(options)
+        self.hyperparams = hyperparams
+        if not options.selector:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"selector must be set in {options.strategy} strategy"
+            )
+        self._op, self._field = parse_selector(options.selector)
+        self._results = {}
+
+    @property
+    def reduction_factor(self):
+        return self.options.reduction_factor or default_reduction_factor
+
+    def report_result(self, result: dict):
+        self._results[get_in(result, ["metadata", "iteration"])] = result
+
+    def _reset(self):
+        self._results = {}
+
+    def _wait_for(self, iterations):
+        while any(iteration not in self._results for iteration in iterations):
+            yield None
+
+    def _score(self, iteration):
+        """the selector result of a completed task (higher is better), None if the task failed"""
+        val = _get_result_value(self._results.get(iteration, {}), self._field)
+        if val is None:
+            return None
+        return val if self._op == "max" else -val
+
+    def _sample_params(self):
+        return {key: random.choice(values) for key, values in self.hyperparams.items()}
+
+    @staticmethod
+    def _new_task(run: RunObject, params: dict, iteration: int):
+        newrun = get_run_copy(run)
+        param_dict = newrun.spec.parameters or {}
+        param_dict.update(params)
+        newrun.spec.parameters = param_dict
+        newrun.metadata.iteration = iteration
+        return newrun
+
+
+class HyperbandGenerator(AdaptiveGenerator):
+    """successive halving and hyperband strategies
+
+    successive halving runs max_iterations random param combinations with min_resource budget (the resource param,
+    e.g. epochs), and promotes the best 1/reduction_factor of them to a reduction_factor times larger budget, until
+    the max_resource budget. hyperband runs several successive halving brackets, from the most aggressive (many
+    combinations with min_resource) to a plain random search (few combinations with max_resource)
+    """
+
+    def __init__(self, hyperparams: dict, options=None, single_bracket=False):
+        super().__init__(hyperparams, options)
+        self.single_bracket = single_bracket
+
+    def generate(self, run: RunObject):
+        self._reset()
+        eta = self.reduction_factor
+        min_resource = self.options.min_resource or 1
+        max_resource = self.options.max_resource
+        max_bracket = 0
+        while min_resource * eta ** (max_bracket + 1) <= max_resource:
+            max_bracket += 1
+        brackets = [max_bracket] if self.single_bracket else range(max_bracket, -1, -1)
+
+        iteration = 0
+        for bracket in brackets:
+            if self.single_bracket:
+                num_configs = self.options.max_iterations or eta**bracket
+            else:
+                num_configs = math.ceil(
+                    (max_bracket + 1) / (bracket + 1) * eta**bracket
+                )
+            configs = [self._sample_params() for _ in range(num_configs)]
+            for rung in range(bracket + 1):
+                resource = max(round(max_resource / eta ** (bracket - rung)), 1)
+                rung_tasks = []
+                for config in configs:
+                    iteration += 1
+                    rung_tasks.append((iteration, config))
+                    yield self._new_task(
+                        run, {**config, self.options.resource: resource}, iteration
+                    )
+                if rung == bracket:
+                    break
+
+                # promote the best param combinations of the rung to the next budget
+                yield from self._wait_for([task[0] for task in rung_tasks])
+                scored_tasks = [
+                    (self._score(task_iteration), config)
+                    for task_iteration, config in rung_tasks
+                    if self._score(task_iteration) is not None
+                ]
+                scored_tasks.sort(key=lambda task: task[0], reverse=True)
+                configs = [
+                    config for _, config in scored_tasks[: max(len(configs) // eta, 1)]
+                ]
+                logger.info(
+                    "promoting param combinations",
+                    bracket=bracket,
+                    rung=rung,
+                    promoted=len(configs),
+                    resource=resource,
+                )
+
+
+class BayesianGenerator(AdaptiveGenerator):
+    """bayesian optimization strategy (tree-structured parzen estimator)
+
+    after the initial random param combinations, the next combinations are proposed by the results of the
+    completed runs, the proposals are sampled from the distribution of the param values in the best runs and the
+    candidate with the highest ratio between its likelihood in the best runs and in the other runs is selected
+    """
+
+    def generate(self, run: RunObject):
+        self._reset()
+        initial_points = min(
+            self.max_iterations,
+            max(default_initial_points, self.options.parallel_runs or 1),
+        )
+        tried_params = {}
+        for iteration in range(1, self.max_iterations + 1):
+            if iteration > initial_points:
+                yield from self._wait_for(range(1, initial_points + 1))
+                params = self._propose(tried_params)
+            else:
+                params = self._sample_params()
+            tried_params[iteration] = params
+            yield self._new_task(run, params, iteration)
+
+    def _propose(self, tried_params: dict):
+        completed = [
+            (self._score(iteration), params)
+            for iteration, params in tried_params.items()
+            if self._score(iteration) is not None
+        ]
+        if not completed:
+            return self._sample_params()
+        completed.sort(key=lambda item: item[0], reverse=True)
+        num_good = max(math.ceil(tpe_gamma * len(completed)), 1)
+        good = [params for _, params in completed[:num_good]]
+        bad = [params for _, params in completed[num_good:]]
+
+        best_candidate, best_ratio = None, -1
+        for _ in range(tpe_candidates):
+            candidate = {}
+            ratio = 1.0
+            for key, values in self.hyperparams.items():
+                good_weights = _category_weights(values, good, key)
+                value_index = random.choices(range(len(values)), good_weights)[0]
+                candidate[key] = values[value_index]
+                ratio *= (
+                    good_weights[value_index]
+                    / _category_weights(values, bad, key)[value_index]
+                )
+            if candidate in tried_params.values():
+                # prefer new param combinations
+                ratio /= len(tried_params)
+            if ratio > best_ratio:
+                best_candidate, best_ratio = candidate, ratio
+        return best_candidate
+
+
+def _category_weights(values: list, params_list: list, key: str):
+    """smoothed probability of each of the param values in the given param combinations"""
+    counts = [
+        sum(1 for params in params_list if params[key] == value) for value in values
+    ]
+    return [(count + 1) / (len(params_list) + len(values)) for count in counts]
+
+
+def should_prune_iteration(context, step: int, value=None) -> bool:
+    """record the intermediate selector result of a hyper-param iteration and decide if it should stop
+
+    the intermediate results are stored as time-series metrics of the iterations (so the decision works across
+    processes and hosts), at the early termination steps (min_resource * reduction_factor ** n) the iteration stops
+    if its result is not in the top 1/reduction_factor of the iterations which reached the same step
+    """
+    options = context._hyper_param_options
+    if not (options and options.early_termination and options.selector):
+        return False
+    if not context.iteration:
+        return False
+    op, field = parse_selector(options.selector)
+    if value is None:
+        value = context._results.get(field)
+        if value is None:
+            return False
+    context.log_metric(field, value, step=step)
+    metrics_writer = context._get_metrics_writer()
+    if not metrics_writer:
+        return False
+
+    eta = options.reduction_factor or default_reduction_factor
+    rung_step = options.min_resource or 1
+    while rung_step < step:
+        rung_step *= eta
+    if rung_step != step:
+        return False
+
+    # the other iterations must see this iteration result
+    metrics_writer.flush()
+    iterations_path = metrics_writer.path.rsplit("/", 1)[0]
+    iterations = {
+        name.strip("/").split("/")[0]
+        for name in mlrun.store_manager.object(url=iterations_path).listdir()
+    }
+    values = [float(value)]
+    for iteration in iterations - {str(context.iteration), "0"}:
+        metrics = read_run_metrics(
+            f"{iterations_path}/{iteration}",
+            keys=[field],
+            start_step=step,
+            end_step=step,
+            max_points=0,
+        )
+        values.extend(metrics.get(field, {}).get("value", [])[-1:])
+    if len(values) < eta:
+        return False
+
+    sign = 1 if op == "max" else -1
+    ranked = sorted((sign * val for val in values), reverse=True)
+    threshold = ranked[max(len(values) // eta, 1) - 1]
+    if sign * float(value) < threshold:
+        logger.info(
+            "stopping underperforming iteration",
+            iteration=context.iteration,
+            step=step,
+            value=value,
+        )
+        return True
+    return False
+
+
 def get_run_copy(run):
+    options = run.spec.hyper_param_options
     newrun = deepcopy(run)
     newrun.spec.hyperparams = None
     newrun.spec.param_file = None
     newrun.spec.hyper_param_options = None
+    if options.early_termination:
+        # the iterations use the early termination options to decide if they should stop
+        newrun.spec.hyper_param_options = HyperParamOptions(
+            selector=options.selector,
+            min_resource=options.min_resource,
+            reduction_factor=options.reduction_factor,
+            early_termination=True,
+        )
     return newrun
 
 
@@ -200,17 +487,24 @@ def selector(results: list, criteria):
 
     i = 0
     for task in results:
-        state = get_in(task, ["status", "state"])
         id = get_in(task, ["metadata", "iteration"])
-        val = get_in(task, ["status", "results", criteria])
-        if isinstance(val, str):
-            try:
-                val = float(val)
-            except Exception:
-                val = None
-        if state != "error" and val is not None:
+        val = _get_result_value(task, criteria)
+        if val is not None:
             if (op == "max" and val > best_val) or (op == "min" and val < best_val):
                 best_id, best_item, best_val = id, i, val
         i += 1
 
     return best_item, best_id
+
+
+def _get_result_value(task: dict, criteria):
+    """the numeric result of a task, None if the task failed or has no such result"""
+    if get_in(task, ["status", "state"]) == "error":
+        return None
+    val = get_in(task, ["status", "results", criteria])
+    if isinstance(val, str):
+        try:
+            val = float(val)
+        except Exception:
+            val = None
+    return val
@@ -16,10 +16,13 @@ import importlib.util as imputil
 import inspect
 import json
 import os
+import queue
 import socket
 import sys
 import tempfile
+import threading
 import traceback
+from collections import deque
 from contextlib import redirect_stdout
 from copy import copy
 from io import StringIO
@@ -37,7 +40,7 @@ from mlrun.lists import RunList
 from ..errors import err_to_str
 from ..execution import MLClientCtx
 from ..model import RunObject
-from ..utils import get_handler_extended, get_in, logger, set_paths
+from ..utils import get_handler_extended, logger, set_paths
 from ..utils.clones import extract_source
 from .base import BaseRuntime, FunctionSpec, spec_fields
 from .kubejob import KubejobRuntime
@@ -73,20 +76,48 @@ class ParallelRunner:
 
         client, function_name = self._get_dask_client(generator.options)
         parallel_runs = generator.options.parallel_runs or 4
+        project = runobj.metadata.project
+        # the run states and logs are written by a background collector, in batches
+        collector = _RunResultsCollector(
+            self._get_db(), project, store_logs=not self.is_child
+        )
+        registered_tasks = deque()
+        generator_state = {"exhausted": False}
         queued_runs = 0
         num_errors = 0
 
+        def register_tasks(max_tasks):
+            """get tasks from the generator and store them in the db with a single bulk request"""
+            batch = []
+            while len(batch) < max_tasks:
+                task = next(tasks, _generator_exhausted)
+                if task is _generator_exhausted:
+                    generator_state["exhausted"] = True
+                    break
+                if task is None:
+                    # adaptive generators wait for the running tasks results before proposing more tasks
+                    break
+                batch.append(task)
+            if batch:
+                mlrun.get_run_db().store_runs(
+                    [task.to_dict() for task in batch], project=project
+                )
+                registered_tasks.extend(batch)
+
         def process_result(future):
             nonlocal num_errors
             resp, sout, serr = future.result()
             runobj = RunObject.from_dict(resp)
-            try:
-                log_std(self._db_conn, runobj, sout, serr, skip=self.is_child)
-                resp = self._update_run_state(resp)
-            except RunError as err:
-                resp = self._update_run_state(resp, err=err_to_str(err))
+            # the output is shown here, the logs are stored by the collector
+            log_std(None, runobj, sout, serr, silent=True)
+            if serr:
                 num_errors += 1
+            resp = self._update_run_state(
+                resp, err=err_to_str(serr) if serr else None, update_db=False
+            )
+            collector.add(resp, sout)
             results.append(resp)
+            generator.report_result(resp)
             if num_errors > generator.max_errors:
                 logger.error("max errors reached, stopping iterations!")
                 return True
@@ -99,28 +130,49 @@ class ParallelRunner:
             return stop
 
         completed_iter = as_completed([])
-        for task in tasks:
-            task_struct = task.to_dict()
-            project = get_in(task_struct, "metadata.project")
-            uid = get_in(task_struct, "metadata.uid")
-            iter = get_in(task_struct, "metadata.iteration", 0)
-            mlrun.get_run_db().store_run(
-                task_struct, uid=uid, project=project, iter=iter
-            )
-            resp = client.submit(
-                remote_handler_wrapper, task.to_json(), handler, self.spec.workdir
-            )
-            completed_iter.add(resp)
-            queued_runs += 1
-            if queued_runs >= parallel_runs:
-                future = next(completed_iter)
-                early_stop = process_result(future)
+        try:
+            while True:
+                if not registered_tasks and not generator_state["exhausted"]:
+                    # adaptive generators propose tasks only for the free slots (so they use the latest results)
+                    register_tasks(
+                        parallel_runs - queued_runs
+                        if generator.is_adaptive
+                        else int(mlrun.mlconf.store_runs_batch_size)
+                    )
+                if registered_tasks and queued_runs < parallel_runs:
+                    task = registered_tasks.popleft()
+                    resp = client.submit(
+                        remote_handler_wrapper,
+                        task.to_json(),
+                        handler,
+                        self.spec.workdir,
+                    )
+                    completed_iter.add(resp)
+                    queued_runs += 1
+                    continue
+                if not queued_runs:
+                    break
+                early_stop = process_result(next(completed_iter))
                 queued_runs -= 1
                 if early_stop:
                     break
 
-        for future in completed_iter:
-            process_result(future)
+            for future in completed_iter:
+                process_result(future)
+
+            for task in registered_tasks:
+                # registered tasks which were not submitted because of an early stop
+                task.status.state = "aborted"
+                task.status.status_text = "stopped before execution (early stop)"
+                collector.add(task.to_dict())
+        finally:
+            collector.close()
+            if collector.failed_runs:
+                # the states of these iterations in the db are stale (e.g. running)
+                execution.set_state(
+                    error="failed to write the results of iterations "
+                    f"{sorted(collector.failed_runs)}: {list(collector.failed_runs.values())[-1]}"
+                )
 
         client.close()
         if function_name and generator.options.teardown_dask:
@@ -132,6 +184,86 @@ class ParallelRunner:
         return results
 
 
+_generator_exhausted = object()
+
+
+class _RunResultsCollector:
+    """write the final state and logs of completed runs from a background thread
+
+    the run states are written in batches (a single store_runs request per batch), so the thread which submits the
+    runs and processes their results is not blocked by the db requests. when a batch fails the runs are written one
+    by one, the runs which could not be written are listed in failed_runs (iteration to error)
+    """
+
+    def __init__(self, db, project: str, store_logs=True):
+        self._db = db
+        self._project = project
+        self._store_logs = store_logs
+        self._batch_size = int(mlrun.mlconf.store_runs_batch_size)
+        self.failed_runs = {}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def add(self, run: dict, logs: str = None):
+        self._queue.put((run, logs))
+
+    def close(self):
+        """write all the collected runs and stop the collector"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _write_loop(self):
+        closed = False
+        while not closed:
+            items = [self._queue.get()]
+            while len(items) < self._batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            closed = items[-1] is None
+            self._write([item for item in items if item is not None])
+
+    def _write(self, items):
+        if not items or not self._db:
+            return
+        if self._store_logs:
+            for run, logs in items:
+                if not logs:
+                    continue
+                try:
+                    log_std(self._db, RunObject.from_dict(run), logs, show=False)
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to store the run logs",
+                        iteration=run["metadata"].get("iteration"),
+                        error=err_to_str(exc),
+                    )
+        try:
+            self._db.store_runs([run for run, _ in items], project=self._project)
+            return
+        except Exception as exc:
+            logger.warning(
+                "Failed to write the runs results, writing them one by one",
+                count=len(items),
+                error=err_to_str(exc),
+            )
+        for run, _ in items:
+            iteration = run["metadata"].get("iteration")
+            try:
+                self._db.store_run(
+                    run, run["metadata"].get("uid"), self._project, iter=iteration
+                )
+            except Exception as exc:
+                logger.error(
+                    "Failed to write the run results",
+                    iteration=iteration,
+                    error=err_to_str(exc),
+                )
+                self.failed_runs[iteration] = err_to_str(exc)
+
+
 def remote_handler_wrapper(task, handler, workdir=None):
     if task and not isinstance(task, dict):
         task = json.loads(task)
@@ -254,7 +254,7 @@ class ServingRuntime(RemoteRuntime):
                    can specify special router class and router arguments
 
           flow   - workflow (DAG) with a chain of states
-                   flow support "sync" and "async" engines, branches are not allowed in sync mode
+                   flow support "sync" and "async" engines, in sync mode branches run concurrently in a thread pool
                    when using async mode calling state.respond() will mark the state as the
                    one which generates the (REST) call response
 
@@ -297,6 +297,11 @@ class ServingRuntime(RemoteRuntime):
         sample: int = None,
         stream_args: dict = None,
         tracking_policy: Union[model_monitoring.TrackingPolicy, dict] = None,
+        flush_interval: float = None,
+        background: bool = None,
+        queue_size: int = None,
+        overflow: str = None,
+        exit_timeout: float = None,
     ):
         """set tracking parameters:
 
@@ -305,6 +310,14 @@ class ServingRuntime(RemoteRuntime):
         :param batch:           Micro batch size (send micro batches of N records at a time).
         :param sample:          Sample size (send only one of N records).
         :param stream_args:     Stream initialization parameters, e.g. shards, retention_in_hours, ..
+        :param flush_interval:  Max seconds to hold a partial micro batch before sending it (default 1).
+        :param background:      Push the records to the stream from a background thread instead of the request
+                                thread, the records are kept in a bounded queue until pushed.
+        :param queue_size:      Max number of records waiting in the background queue (default 10000).
+        :param overflow:        What to do with new records when the background queue is full, "drop" the records
+                                (default) or "block" the request until there is room in the queue.
+        :param exit_timeout:    Max seconds to wait for the background queue to be pushed when the worker exits
+                                (default 10).
         :param tracking_policy: Tracking policy object or a dictionary that will be converted into a tracking policy
                                 object. By using TrackingPolicy, the user can apply his model monitoring requirements,
                                 such as setting the scheduling policy of the model monitoring batch job or changing
@@ -333,6 +346,16 @@ class ServingRuntime(RemoteRuntime):
             self.spec.parameters["log_stream_batch"] = batch
         if sample:
             self.spec.parameters["log_stream_sample"] = sample
+        if flush_interval:
+            self.spec.parameters["log_stream_flush_interval"] = flush_interval
+        if background is not None:
+            self.spec.parameters["log_stream_background"] = background
+        if queue_size:
+            self.spec.parameters["log_stream_queue_size"] = queue_size
+        if overflow:
+            self.spec.parameters["log_stream_overflow"] = overflow
+        if exit_timeout is not None:
+            self.spec.parameters["log_stream_exit_timeout"] = exit_timeout
         if stream_args:
             self.spec.parameters["stream_args"] = stream_args
 
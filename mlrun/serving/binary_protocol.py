@@ -0,0 +1,255 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""binary tensor payloads of the serving graph
+
+the request format is selected by the request content type (or the v2 binary extension header) and the response
+format by the Accept header (default to the request format):
+
+* v2 - the V2 inference protocol binary tensor data extension, a json header (its length is set in the
+  Inference-Header-Content-Length header) followed by the raw tensors data
+* npy - a single numpy array in the .npy format (application/x-npy)
+* arrow - an Arrow IPC stream (application/vnd.apache.arrow.stream), a single column of fixed size lists is a 2d
+  array (rows x dim), a single primitive column is a 1d array and multiple primitive columns are stacked
+
+the request tensors are decoded (zero-copy when possible, as read-only arrays) into the body "inputs", a single
+tensor is an array and multiple (v2) tensors are a list of arrays. the response "outputs" are encoded as binary
+tensors, responses which cannot be encoded (e.g. not numeric outputs) are returned as json
+"""
+import io
+import json
+
+import numpy as np
+
+
+class BinaryFormats:
+    v2 = "v2"
+    npy = "npy"
+    arrow = "arrow"
+
+
+v2_header_length_key = "Inference-Header-Content-Length"
+npy_content_type = "application/x-npy"
+arrow_content_type = "application/vnd.apache.arrow.stream"
+octet_stream_content_type = "application/octet-stream"
+
+_content_type_formats = {
+    npy_content_type: BinaryFormats.npy,
+    arrow_content_type: BinaryFormats.arrow,
+}
+_format_content_types = {
+    BinaryFormats.v2: octet_stream_content_type,
+    BinaryFormats.npy: npy_content_type,
+    BinaryFormats.arrow: arrow_content_type,
+}
+
+_v2_datatypes = {
+    "BOOL": np.bool_,
+    "UINT8": np.uint8,
+    "UINT16": np.uint16,
+    "UINT32": np.uint32,
+    "UINT64": np.uint64,
+    "INT8": np.int8,
+    "INT16": np.int16,
+    "INT32": np.int32,
+    "INT64": np.int64,
+    "FP16": np.float16,
+    "FP32": np.float32,
+    "FP64": np.float64,
+}
+_numpy_v2_datatypes = {np.dtype(dtype): name for name, dtype in _v2_datatypes.items()}
+
+
+def get_header(headers, key: str):
+    """case insensitive header lookup"""
+    if not headers:
+        return None
+    key = key.lower()
+    for header_key, value in headers.items():
+        if header_key.lower() == key:
+            return value
+    return None
+
+
+def _base_content_type(content_type: str) -> str:
+    return (content_type or "").split(";")[0].strip().lower()
+
+
+def get_request_format(event) -> str:
+    """return the binary format of the request body, None for json/text bodies"""
+    if get_header(event.headers, v2_header_length_key) is not None:
+        return BinaryFormats.v2
+    return _content_type_formats.get(_base_content_type(event.content_type))
+
+
+def get_response_format(event, request_format: str = None) -> str:
+    """return the (negotiated) binary format of the response, None for json responses"""
+    accept = get_header(event.headers, "Accept")
+    if not accept:
+        return request_format
+    for accepted in accept.split(","):
+        accepted = _base_content_type(accepted)
+        if accepted in _content_type_formats:
+            return _content_type_formats[accepted]
+        if accepted == octet_stream_content_type:
+            return BinaryFormats.v2
+        if accepted == "application/json":
+            return None
+    return request_format
+
+
+def decode_body(body, binary_format: str, headers=None) -> dict:
+    """decode a binary request body into a dict body with the "inputs" tensor(s)"""
+    if isinstance(body, str):
+        body = body.encode("latin-1")
+    if binary_format == BinaryFormats.v2:
+        return _decode_v2(body, int(get_header(headers, v2_header_length_key)))
+    if binary_format == BinaryFormats.npy:
+        return {"inputs": _decode_npy(body)}
+    if binary_format == BinaryFormats.arrow:
+        return {"inputs": _decode_arrow(body)}
+    raise ValueError(f"unsupported binary format {binary_format}")
+
+
+def encode_response(body: dict, binary_format: str):
+    """encode the response "outputs" as binary tensors
+
+    :return: (body bytes, content type, headers), None if the response cannot be encoded
+    """
+    if not isinstance(body, dict) or "outputs" not in body:
+        return None
+    outputs = body["outputs"]
+    if (
+        isinstance(outputs, (list, tuple))
+        and outputs
+        and all(isinstance(output, np.ndarray) for output in outputs)
+    ):
+        tensors = list(outputs)
+    else:
+        try:
+            tensors = [np.asarray(outputs)]
+        except ValueError:
+            # ragged (inhomogeneous) outputs
+            return None
+    if any(tensor.dtype not in _numpy_v2_datatypes for tensor in tensors):
+        return None
+
+    content_type = _format_content_types[binary_format]
+    if binary_format == BinaryFormats.v2:
+        data, headers = _encode_v2(body, tensors)
+        return data, content_type, headers
+    if len(tensors) > 1:
+        return None
+    if binary_format == BinaryFormats.npy:
+        return _encode_npy(tensors[0]), content_type, {}
+    if binary_format == BinaryFormats.arrow:
+        return _encode_arrow(tensors[0]), content_type, {}
+    raise ValueError(f"unsupported binary format {binary_format}")
+
+
+def _decode_v2(body: bytes, header_length: int) -> dict:
+    header = json.loads(body[:header_length])
+    buffer = memoryview(body)
+    offset = header_length
+    tensors = []
+    for tensor_header in header.get("inputs", []):
+        datatype = tensor_header.get("datatype")
+        if datatype not in _v2_datatypes:
+            raise ValueError(f"unsupported tensor datatype {datatype}")
+        dtype = np.dtype(_v2_datatypes[datatype])
+        shape = tensor_header.get("shape", [-1])
+        size = (tensor_header.get("parameters") or {}).get("binary_data_size")
+        if size is None:
+            tensors.append(np.asarray(tensor_header.get("data"), dtype=dtype))
+            continue
+        if offset + size > len(buffer):
+            raise ValueError("binary tensor data is shorter than the header sizes")
+        tensors.append(
+            np.frombuffer(buffer[offset : offset + size], dtype=dtype).reshape(shape)
+        )
+        offset += size
+
+    decoded = {key: value for key, value in header.items() if key != "inputs"}
+    decoded["inputs"] = tensors[0] if len(tensors) == 1 else tensors
+    return decoded
+
+
+def _encode_v2(body: dict, tensors: list):
+    header = {key: value for key, value in body.items() if key != "outputs"}
+    header["outputs"] = [
+        {
+            "name": f"output{index}",
+            "shape": list(tensor.shape),
+            "datatype": _numpy_v2_datatypes[tensor.dtype],
+            "parameters": {"binary_data_size": tensor.nbytes},
+        }
+        for index, tensor in enumerate(tensors)
+    ]
+    header_bytes = json.dumps(header).encode()
+    data = b"".join(
+        [header_bytes] + [np.ascontiguousarray(tensor).data for tensor in tensors]
+    )
+    return data, {v2_header_length_key: str(len(header_bytes))}
+
+
+def _decode_npy(body: bytes) -> np.ndarray:
+    stream = io.BytesIO(body)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject:
+        raise ValueError("npy arrays of python objects are not supported")
+    count = int(np.prod(shape))
+    array = np.frombuffer(body, dtype=dtype, count=count, offset=stream.tell())
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
+
+def _encode_npy(tensor: np.ndarray) -> bytes:
+    stream = io.BytesIO()
+    np.lib.format.write_array(stream, tensor, allow_pickle=False)
+    return stream.getvalue()
+
+
+def _decode_arrow(body: bytes) -> np.ndarray:
+    import pyarrow as pa
+
+    with pa.ipc.open_stream(pa.py_buffer(body)) as reader:
+        table = reader.read_all()
+    columns = [column.combine_chunks() for column in table.columns]
+    if len(columns) == 1 and pa.types.is_fixed_size_list(columns[0].type):
+        column = columns[0]
+        values = column.flatten().to_numpy(zero_copy_only=False)
+        return values.reshape(len(column), column.type.list_size)
+    arrays = [column.to_numpy(zero_copy_only=False) for column in columns]
+    return arrays[0] if len(arrays) == 1 else np.column_stack(arrays)
+
+
+def _encode_arrow(tensor: np.ndarray) -> bytes:
+    import pyarrow as pa
+
+    if tensor.ndim > 2:
+        tensor = tensor.reshape(len(tensor), -1)
+    if tensor.ndim == 2:
+        column = pa.FixedSizeListArray.from_arrays(
+            pa.array(np.ascontiguousarray(tensor).ravel()), tensor.shape[1]
+        )
+    else:
+        column = pa.array(np.atleast_1d(tensor))
+    batch = pa.record_batch([column], names=["outputs"])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
@@ -15,6 +15,9 @@
 import concurrent
 import copy
 import json
+import multiprocessing
+import threading
+import time
 import traceback
 from enum import Enum
 from io import BytesIO
@@ -40,6 +43,12 @@ from .server import GraphServer
 from .utils import RouterToDict, _extract_input_data, _update_result_body
 from .v2_serving import _ModelLogPusher
 
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # python < 3.8, the arrays are pickled to the process pool workers
+    resource_tracker = shared_memory = None
+
 # Used by `ParallelRun` in process mode, so it can be accessed from different processes.
 local_routes = {}
 
@@ -270,6 +279,7 @@ class ParallelRun(BaseModelRouter):
         health_prefix: str = None,
         extend_event=None,
         executor_type: Union[ParallelRunnerModes, str] = ParallelRunnerModes.thread,
+        shared_memory_threshold: int = None,
         **kwargs,
     ):
         """Process multiple steps (child routes) in parallel and merge the results
@@ -306,6 +316,11 @@ class ParallelRun(BaseModelRouter):
                               * thread - running in separated threads
                               by default `threads`
         :param extend_event:  True will add the event body to the result
+        :param shared_memory_threshold: in process mode, numpy arrays in the event body (and in the results) which
+                              are at least this size (bytes) are passed to/from the worker processes through
+                              shared memory instead of being pickled, the request arrays are placed in shared
+                              memory once and are read-only in the routes (default 64KB, -1 to disable,
+                              requires python 3.8+)
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -327,10 +342,13 @@ class ParallelRun(BaseModelRouter):
                 FutureWarning,
             )
         self.executor_type = ParallelRunnerModes(executor_type)
+        self.shared_memory_threshold = shared_memory_threshold
         self._pool: Union[
             concurrent.futures.ProcessPoolExecutor,
             concurrent.futures.ThreadPoolExecutor,
         ] = None
+        # the ignored (still running) futures of routes which missed the quorum/deadline, per route
+        self._stragglers: Dict[str, concurrent.futures.Future] = {}
 
     def _apply_logic(self, results: dict, event=None):
         """
@@ -403,11 +421,18 @@ class ParallelRun(BaseModelRouter):
                     if step._object:
                         step._object.context = None
                     routes[key] = step
+                # forked workers share the resource tracker (of shared memory segments) of this process
+                shared_resource_tracker = (
+                    shared_memory is not None
+                    and multiprocessing.get_start_method() == "fork"
+                )
+                if shared_resource_tracker:
+                    resource_tracker.ensure_running()
                 executor_class = concurrent.futures.ProcessPoolExecutor
                 self._pool = executor_class(
                     max_workers=len(self.routes),
                     initializer=ParallelRun.init_pool,
-                    initargs=(server, routes, id(self)),
+                    initargs=(server, routes, id(self), shared_resource_tracker),
                 )
             elif self.executor_type == ParallelRunnerModes.thread:
                 executor_class = concurrent.futures.ThreadPoolExecutor
@@ -425,28 +450,58 @@ class ParallelRun(BaseModelRouter):
                 local_routes.pop(id(self))
             self._pool.shutdown()
             self._pool = None
+            self._stragglers = {}
 
-    def _parallel_run(self, event: dict):
+    def _parallel_run(self, event: dict, quorum: int = None, deadline: float = None):
         """
         Execute parallel run
 
-        :param event: event to run in parallel
+        :param event:    event to run in parallel
+        :param quorum:   return once this number of routes returned results (all the routes by default)
+        :param deadline: return once this time (seconds) has passed, even if less than the quorum of routes returned
 
-        :return: All the results of the runs
+        :return: All the results of the runs (which returned in time)
         """
         results = {}
+        quorum = min(quorum or len(self.routes), len(self.routes))
+        end_time = time.monotonic() + deadline if deadline else None
         if self.executor_type == ParallelRunnerModes.array:
-            results = {
-                model_name: model.run(copy.copy(event)).body
-                for model_name, model in self.routes.items()
-            }
+            for model_name, model in self.routes.items():
+                if len(results) >= quorum or (
+                    end_time and time.monotonic() >= end_time
+                ):
+                    break
+                results[model_name] = model.run(copy.copy(event)).body
             return results
-        futures = []
+        futures = {}
         executor = self._init_pool()
+        shared_segments = []
+        shared_body = None
+        if self.executor_type == ParallelRunnerModes.process:
+            # the request arrays are placed in shared memory once for all the routes
+            shared_body = _to_shared_memory(
+                event.body, self._get_shared_memory_threshold(), shared_segments
+            )
         for route in self.routes.keys():
+            straggler = self._stragglers.get(route)
+            if straggler is not None:
+                if not straggler.done():
+                    # the route still holds a worker with a previous (ignored) event, skip it so the other
+                    # routes are not queued behind it
+                    self.context.logger.debug(
+                        f"skipping route {route}, its previous event is still running"
+                    )
+                    continue
+                del self._stragglers[route]
             if self.executor_type == ParallelRunnerModes.process:
+                route_event = copy.copy(event)
+                route_event.body = shared_body
                 future = executor.submit(
-                    ParallelRun._wrap_step, route, id(self), copy.copy(event)
+                    ParallelRun._wrap_step,
+                    route,
+                    id(self),
+                    route_event,
+                    self._get_shared_memory_threshold(),
                 )
             elif self.executor_type == ParallelRunnerModes.thread:
                 step = self.routes[route]
@@ -457,23 +512,49 @@ class ParallelRun(BaseModelRouter):
                     copy.copy(event),
                 )
 
-            futures.append(future)
+            futures[future] = route
 
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                key, result = future.result()
-                results[key] = result.body
-            except Exception as exc:
-                logger.error(traceback.format_exc())
-                print(f"child route generated an exception: {exc}")
+        pending = set(futures)
+        try:
+            while pending and len(results) < quorum:
+                timeout = max(end_time - time.monotonic(), 0) if end_time else None
+                done, pending = concurrent.futures.wait(
+                    pending,
+                    timeout=timeout,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                if not done:
+                    # the deadline has passed
+                    break
+                for future in done:
+                    try:
+                        key, result = future.result()
+                        if self.executor_type == ParallelRunnerModes.process:
+                            result.body = _from_shared_memory(result.body)
+                        results[key] = result.body
+                    except Exception as exc:
+                        logger.error(traceback.format_exc())
+                        print(f"child route generated an exception: {exc}")
+        finally:
+            running = []
+            for future in pending:
+                # cancel the stragglers which did not start yet, the results of the running ones are ignored
+                if not future.cancel():
+                    self._stragglers[futures[future]] = future
+                    running.append(future)
+                    if self.executor_type == ParallelRunnerModes.process:
+                        future.add_done_callback(_release_shared_result)
+            # the running stragglers may not have attached the request segments yet
+            _release_shared_segments_when_done(shared_segments, running)
         self.context.logger.debug(f"Collected results from children: {results}")
         return results
 
     @staticmethod
-    def init_pool(server_spec, routes, object_id):
+    def init_pool(server_spec, routes, object_id, shared_resource_tracker=False):
         server = mlrun.serving.GraphServer.from_dict(server_spec)
         server.init_states(None, None)
-        global local_routes
+        global local_routes, _shared_resource_tracker
+        _shared_resource_tracker = shared_resource_tracker
         if object_id in local_routes:
             return
         for route in routes.values():
@@ -482,19 +563,158 @@ class ParallelRun(BaseModelRouter):
                 route._object.context = server.context
         local_routes[object_id] = routes
 
+    def _get_shared_memory_threshold(self):
+        if shared_memory is None:
+            return -1
+        if self.shared_memory_threshold is None:
+            return _default_shared_memory_threshold
+        return self.shared_memory_threshold
+
     @staticmethod
-    def _wrap_step(route, object_id, event):
+    def _wrap_step(route, object_id, event, shared_memory_threshold=-1):
         global local_routes
         routes = local_routes.get(object_id, None).copy()
         if routes is None:
             return None, None
-        return route, routes[route].run(event)
+        input_segments = []
+        event.body = _from_shared_memory(event.body, input_segments)
+        try:
+            result = routes[route].run(event)
+            if result is not None:
+                result.body = _to_shared_memory(
+                    result.body, shared_memory_threshold, owned_by_receiver=True
+                )
+        finally:
+            for segment in input_segments:
+                try:
+                    segment.close()
+                except BufferError:
+                    # the array is still referenced (e.g. kept by the route), it is released when collected
+                    pass
+        return route, result
 
     @staticmethod
     def _wrap_method(route, handler, event):
         return route, handler(event)
 
 
+_default_shared_memory_threshold = 64 * 1024
+# set in the process pool workers, True when the worker shares the resource tracker of the parent process
+_shared_resource_tracker = False
+
+
+class _SharedArray:
+    """picklable handle of a numpy array in a shared memory segment"""
+
+    def __init__(self, name: str, shape: tuple, dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+def _to_shared_memory(
+    value, threshold: int, segments: list = None, owned_by_receiver: bool = False
+):
+    """replace the (big enough) numpy arrays in a body with shared memory handles
+
+    the created segments are added to segments, when owned_by_receiver the segments are closed and the receiver
+    is responsible for unlinking them
+    """
+    if threshold < 0:
+        return value
+    if isinstance(value, dict):
+        return {
+            key: _to_shared_memory(item, threshold, segments, owned_by_receiver)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        items = [
+            _to_shared_memory(item, threshold, segments, owned_by_receiver)
+            for item in value
+        ]
+        return items if isinstance(value, list) else tuple(items)
+    if (
+        isinstance(value, np.ndarray)
+        and value.dtype != object
+        and value.nbytes >= max(threshold, 1)
+    ):
+        segment = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        shared = np.ndarray(value.shape, dtype=value.dtype, buffer=segment.buf)
+        shared[...] = value
+        handle = _SharedArray(segment.name, value.shape, value.dtype.str)
+        del shared
+        if owned_by_receiver:
+            # the receiver unlinks the segment, stop tracking it in this process
+            if not _shared_resource_tracker:
+                resource_tracker.unregister(segment._name, "shared_memory")
+            segment.close()
+        elif segments is not None:
+            segments.append(segment)
+        return handle
+    return value
+
+
+def _release_shared_result(future: concurrent.futures.Future):
+    """release the shared memory of the result of an ignored (straggler) route"""
+    try:
+        _, result = future.result()
+        if result is not None:
+            _from_shared_memory(result.body)
+    except Exception:
+        pass
+
+
+def _release_shared_segments_when_done(segments: list, futures: list):
+    """close and unlink the shared memory segments once all the futures are done"""
+    if not segments:
+        return
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def release(_=None):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] > 0:
+                return
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+    if not futures:
+        release()
+    for future in futures:
+        future.add_done_callback(release)
+
+
+def _from_shared_memory(value, segments: list = None):
+    """replace the shared memory handles in a body with numpy arrays
+
+    when segments is given the arrays are read-only views of the shared memory (zero-copy) and the attached
+    segments are added to segments (which must be closed once the arrays are no longer used), otherwise the
+    arrays are copied and the segments are unlinked
+    """
+    if isinstance(value, dict):
+        return {key: _from_shared_memory(item, segments) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_from_shared_memory(item, segments) for item in value]
+        return items if isinstance(value, list) else tuple(items)
+    if isinstance(value, _SharedArray):
+        segment = shared_memory.SharedMemory(name=value.name)
+        array = np.ndarray(value.shape, dtype=np.dtype(value.dtype), buffer=segment.buf)
+        if segments is not None:
+            # the segment is owned (and unlinked) by the sender, stop tracking it in this process
+            if not _shared_resource_tracker:
+                resource_tracker.unregister(segment._name, "shared_memory")
+            array.flags.writeable = False
+            segments.append(segment)
+            return array
+        array = array.copy()
+        segment.close()
+        segment.unlink()
+        return array
+    return value
+
+
 class VotingEnsemble(ParallelRun):
     def __init__(
         self,
@@ -509,6 +729,9 @@ class VotingEnsemble(ParallelRun):
         executor_type: Union[ParallelRunnerModes, str] = ParallelRunnerModes.thread,
         format_response_with_col_name_flag: bool = False,
         prediction_col_name: str = "prediction",
+        shared_memory_threshold: int = None,
+        quorum: int = None,
+        deadline: float = None,
         **kwargs,
     ):
         """Voting Ensemble
@@ -598,6 +821,15 @@ class VotingEnsemble(ParallelRun):
                               `{id: <id>, model_name: <name>, outputs: {..., prediction: [<predictions>], ...}}`
                               the prediction_col_name should be `prediction`.
                               by default, `prediction`
+        :param shared_memory_threshold: min size (bytes) of numpy arrays which are passed to/from the models
+                              through shared memory in process mode (default 64KB, -1 to disable)
+        :param quorum:        vote once this number of models returned predictions, without waiting for the rest
+                              (all the models by default)
+        :param deadline:      max time (seconds) to wait for the models predictions, the vote is done over the
+                              predictions which returned in time (no deadline by default).
+                              the models which were not voted are listed in the response `skipped_models`, and
+                              the weights of the voted models are re-normalized. a model which is still running
+                              an earlier (ignored) request is skipped until it is done
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -608,6 +840,7 @@ class VotingEnsemble(ParallelRun):
             url_prefix=url_prefix,
             health_prefix=health_prefix,
             executor_type=executor_type,
+            shared_memory_threshold=shared_memory_threshold,
             **kwargs,
         )
         self.name = name or "VotingEnsemble"
@@ -623,6 +856,8 @@ class VotingEnsemble(ParallelRun):
         self.log_router = True
         self.prediction_col_name = prediction_col_name or "prediction"
         self.format_response_with_col_name_flag = format_response_with_col_name_flag
+        self.quorum = quorum
+        self.deadline = deadline
         self.model_endpoint_uid = None
 
     def post_init(self, mode="sync"):
@@ -824,8 +1059,11 @@ class VotingEnsemble(ParallelRun):
                 )
             )
         ).T
-        weights = [self._weights[model_name] for model_name in results.keys()]
-        return self.logic(flattened_predictions, np.array(weights))
+        weights = np.array([self._weights[model_name] for model_name in results.keys()])
+        if len(results) < len(self.routes) and weights.sum() > 0:
+            # only part of the models were voted (quorum/deadline)
+            weights = weights / weights.sum()
+        return self.logic(flattened_predictions, weights)
 
     def do_event(self, event, *args, **kwargs):
         """Handles incoming requests.
@@ -881,7 +1119,20 @@ class VotingEnsemble(ParallelRun):
 
             # If this is a Router Operation
             if name == self.name and event.method != "GET":
-                predictions = self._parallel_run(event)
+                predictions = self._parallel_run(
+                    event, quorum=self.quorum, deadline=self.deadline
+                )
+                if not predictions:
+                    raise RuntimeError(
+                        f"none of the models of {self.name} returned a prediction"
+                    )
+                skipped_models = [
+                    model for model in self.routes.keys() if model not in predictions
+                ]
+                if skipped_models:
+                    self.context.logger.debug(
+                        f"{self.name} voted without models {skipped_models}"
+                    )
                 votes = self._apply_logic(predictions)
                 # Format the prediction response like the regular
                 # model's responses
@@ -895,6 +1146,8 @@ class VotingEnsemble(ParallelRun):
                 }
                 if self.version:
                     response_body["model_version"] = self.version
+                if skipped_models:
+                    response_body["skipped_models"] = skipped_models
                 response.body = response_body
             elif name == self.name and event.method == "GET" and not subpath:
                 response = copy.copy(event)
@@ -1128,6 +1381,7 @@ class EnrichmentModelRouter(ModelRouter):
         health_prefix: str = None,
         feature_vector_uri: str = "",
         impute_policy: dict = {},
+        feature_service_args: dict = None,
         **kwargs,
     ):
         """Model router with feature enrichment (from the feature store)
@@ -1146,6 +1400,8 @@ class EnrichmentModelRouter(ModelRouter):
                               constants or $mean, $max, $min, $std, $count for statistical values.
                               “*” is used to specify the default for all features, example:
                               impute_policy={"*": "$mean", "age": 33}
+        :param feature_service_args: extra args for the online feature service (see `get_online_feature_service`),
+                              e.g. {"max_batch_size": 64} to query concurrent requests in micro batches
         :param context:       for internal use (passed in init)
         :param name:          step name
         :param routes:        for internal use (routes passed in init)
@@ -1173,6 +1429,7 @@ class EnrichmentModelRouter(ModelRouter):
 
         self.feature_vector_uri = feature_vector_uri
         self.impute_policy = impute_policy
+        self.feature_service_args = feature_service_args
 
         self._feature_service = None
 
@@ -1181,6 +1438,7 @@ class EnrichmentModelRouter(ModelRouter):
         self._feature_service = mlrun.feature_store.get_online_feature_service(
             feature_vector=self.feature_vector_uri,
             impute_policy=self.impute_policy,
+            **(self.feature_service_args or {}),
         )
 
     def preprocess(self, event):
@@ -1209,6 +1467,7 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
         prediction_col_name: str = None,
         feature_vector_uri: str = "",
         impute_policy: dict = {},
+        feature_service_args: dict = None,
         **kwargs,
     ):
         """Voting Ensemble with feature enrichment (from the feature store)
@@ -1282,6 +1541,8 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
                               the replaced value can be fixed number for constants or $mean, $max, $min, $std, $count
                               for statistical values. “*” is used to specify the default for all features, example:
                               impute_policy={"*": "$mean", "age": 33}
+        :param feature_service_args: extra args for the online feature service (see `get_online_feature_service`),
+                              e.g. {"max_batch_size": 64} to query concurrent requests in micro batches
         :param input_path:    when specified selects the key/path in the event to use as body
                               this require that the event body will behave like a dict, example:
                               event: {"data": {"a": 5, "b": 7}}, input_path="data.b" means request body will be 7
@@ -1299,6 +1560,15 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
                                        {id: <id>, model_name: <name>, outputs: {..., prediction: [<predictions>], ...}}
                                        the prediction_col_name should be `prediction`.
                               by default, `prediction`
+        :param shared_memory_threshold: min size (bytes) of numpy arrays which are passed to/from the models
+                              through shared memory in process mode (default 64KB, -1 to disable)
+        :param quorum:        vote once this number of models returned predictions, without waiting for the rest
+                              (all the models by default)
+        :param deadline:      max time (seconds) to wait for the models predictions, the vote is done over the
+                              predictions which returned in time (no deadline by default).
+                              the models which were not voted are listed in the response `skipped_models`, and
+                              the weights of the voted models are re-normalized. a model which is still running
+                              an earlier (ignored) request is skipped until it is done
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -1316,6 +1586,7 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
 
         self.feature_vector_uri = feature_vector_uri
         self.impute_policy = impute_policy
+        self.feature_service_args = feature_service_args
 
         self._feature_service = None
 
@@ -1324,6 +1595,7 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
         self._feature_service = mlrun.feature_store.get_online_feature_service(
             feature_vector=self.feature_vector_uri,
             impute_policy=self.impute_policy,
+            **(self.feature_service_args or {}),
         )
 
     def preprocess(self, event):
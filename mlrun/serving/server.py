@@ -32,7 +32,13 @@ from ..datastore import get_stream_pusher
 from ..datastore.store_resources import ResourceCache
 from ..errors import MLRunInvalidArgumentError
 from ..model import ModelObj
-from ..utils import create_logger, get_caller_globals, parse_versioned_object_uri
+from ..utils import (
+    create_logger,
+    dict_to_json,
+    get_caller_globals,
+    parse_versioned_object_uri,
+)
+from . import binary_protocol
 from .states import RootFlowStep, RouterStep, get_function, graph_root_setter
 from .utils import event_id_key, event_path_key
 
@@ -246,7 +252,22 @@ class GraphServer(ModelObj):
             if event_path_key in event.headers:
                 event.path = event.headers.get(event_path_key)
 
-        if isinstance(event.body, (str, bytes)) and (
+        request_format = binary_protocol.get_request_format(event)
+        response_format = binary_protocol.get_response_format(event, request_format)
+        if request_format and isinstance(event.body, (str, bytes)):
+            # binary tensors payload
+            try:
+                event.body = binary_protocol.decode_body(
+                    event.body, request_format, event.headers
+                )
+            except Exception as exc:
+                message = f"failed to decode {request_format} event, {err_to_str(exc)}"
+                context.logger.error(message)
+                server_context.push_error(event, message, source="_handler")
+                return context.Response(
+                    body=message, content_type="text/plain", status_code=400
+                )
+        elif isinstance(event.body, (str, bytes)) and (
             not event.content_type or event.content_type in ["json", "application/json"]
         ):
             # assume it is json and try to load
@@ -275,20 +296,42 @@ class GraphServer(ModelObj):
             )
 
         if asyncio.iscoroutine(response):
-            return self._process_async_response(context, response, get_body)
+            return self._process_async_response(
+                context, response, get_body, response_format, request_format
+            )
         else:
-            return self._process_response(context, response, get_body)
+            return self._process_response(
+                context, response, get_body, response_format, request_format
+            )
 
-    async def _process_async_response(self, context, response, get_body):
-        return self._process_response(context, await response, get_body)
+    async def _process_async_response(
+        self, context, response, get_body, response_format=None, request_format=None
+    ):
+        return self._process_response(
+            context, await response, get_body, response_format, request_format
+        )
 
-    def _process_response(self, context, response, get_body):
+    def _process_response(
+        self, context, response, get_body, response_format=None, request_format=None
+    ):
         body = response.body
         if isinstance(body, context.Response) or get_body:
             return body
 
+        if response_format:
+            encoded = binary_protocol.encode_response(body, response_format)
+            if encoded:
+                data, content_type, headers = encoded
+                return context.Response(
+                    body=data,
+                    content_type=content_type,
+                    headers=headers,
+                    status_code=200,
+                )
+
         if body and not isinstance(body, (str, bytes)):
-            body = json.dumps(body)
+            # binary requests hold numpy arrays which are not json serializable
+            body = dict_to_json(body) if request_format else json.dumps(body)
             return context.Response(
                 body=body, content_type="application/json", status_code=200
             )
@@ -14,8 +14,10 @@
 
 __all__ = ["TaskStep", "RouterStep", "RootFlowStep"]
 
+import concurrent.futures
 import os
 import pathlib
+import time
 import traceback
 from copy import copy, deepcopy
 from inspect import getfullargspec, signature
@@ -673,6 +675,8 @@ class FlowStep(BaseStep):
         self._wait_for_result = False
         self._source = None
         self._start_steps = []
+        self._sync_plan = None
+        self._sync_pool = None
 
     def get_children(self):
         return self._steps.values()
@@ -821,6 +825,8 @@ class FlowStep(BaseStep):
 
         if self.engine != "sync":
             self._build_async_flow()
+        else:
+            self._sync_plan = _SyncFlowPlan(self)
 
     def check_and_process_graph(self, allow_empty=False):
         """validate correct graph layout and initialize the .next links"""
@@ -1041,8 +1047,15 @@ class FlowStep(BaseStep):
 
         if len(self._start_steps) == 0:
             return event
+        if self._sync_plan is None:
+            self._sync_plan = _SyncFlowPlan(self)
+        if self._sync_plan.has_branches:
+            return self._run_branches(event, *args, **kwargs)
+
+        timings = {}
         next_obj = self._start_steps[0]
         while next_obj:
+            start = time.monotonic()
             try:
                 event = next_obj.run(event, *args, **kwargs)
             except Exception as exc:
@@ -1052,17 +1065,101 @@ class FlowStep(BaseStep):
                     raise exc
                 event.terminated = True
                 return event
+            timings[next_obj.name] = time.monotonic() - start
+            event.step_timings = timings
 
             if hasattr(event, "terminated") and event.terminated:
                 return event
             next = next_obj.next
-            if next and len(next) > 1:
-                raise GraphError(
-                    f"synchronous flow engine doesnt support branches use async, step={next_obj.name}"
-                )
             next_obj = self[next[0]] if next else None
         return event
 
+    def _run_branches(self, event, *args, **kwargs):
+        """run a sync flow with branches, the independent steps run concurrently in a thread pool
+
+        a step with multiple upstream steps is a join, it runs once after all the upstream steps completed, over
+        the merged events (see _SyncFlowPlan.merge_events), branches which terminated the event are not merged
+        """
+        plan = self._sync_plan
+        if self._sync_pool is None:
+            self._sync_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=plan.max_workers
+            )
+        timings = {}
+        outputs = {}
+        inputs = {name: {} for name in plan.order}
+        remaining = {name: len(plan.upstream[name]) for name in plan.order}
+        running = {}
+        terminated_event = None
+
+        def run_step(step, step_event):
+            start = time.monotonic()
+            if plan.is_merge_step(step):
+                # the merge was done in merge_events()
+                return step_event, time.monotonic() - start
+            result = step.run(step_event, *args, **kwargs)
+            return result, time.monotonic() - start
+
+        def complete(name, output):
+            outputs[name] = output
+            downstream = plan.downstream[name]
+            for index, next_name in enumerate(downstream):
+                # every branch gets its own (shallow) copy of the event, same as the async engine
+                next_input = (
+                    copy(output)
+                    if output is not None and index < len(downstream) - 1
+                    else output
+                )
+                inputs[next_name][name] = next_input
+                remaining[next_name] -= 1
+                if remaining[next_name] == 0:
+                    events = [
+                        inputs[next_name][upstream_name]
+                        for upstream_name in plan.upstream[next_name]
+                        if inputs[next_name][upstream_name] is not None
+                    ]
+                    if not events:
+                        # all the upstream branches terminated, skip the step
+                        complete(next_name, None)
+                        continue
+                    step = self[next_name]
+                    step_event = plan.merge_events(step, events)
+                    running[self._sync_pool.submit(run_step, step, step_event)] = (
+                        next_name,
+                        step_event,
+                    )
+
+        start_step = plan.order[0]
+        running[self._sync_pool.submit(run_step, self[start_step], event)] = (
+            start_step,
+            event,
+        )
+        while running:
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                name, step_event = running.pop(future)
+                try:
+                    output, timings[name] = future.result()
+                except Exception as exc:
+                    self[name]._log_error(step_event, exc, failed_step=name)
+                    handled = self._call_error_handler(step_event, exc)
+                    if not handled:
+                        raise exc
+                    step_event.terminated = True
+                    return step_event
+                if getattr(output, "terminated", False):
+                    terminated_event = output
+                    output = None
+                complete(name, output)
+
+        event = plan.get_response(outputs) or terminated_event or event
+        event.step_timings = timings
+        if self.context and self.context.verbose:
+            self.context.logger.info(f"flow {self.name} step timings: {timings}")
+        return event
+
     def wait_for_completion(self):
         """wait for completion of run in async flows"""
         if self._controller:
@@ -1091,6 +1188,100 @@ class FlowStep(BaseStep):
         )
 
 
+class _SyncFlowPlan:
+    """execution plan of a sync flow, the steps (which are reachable from the start step) in topological order"""
+
+    def __init__(self, flow: FlowStep):
+        start_step = flow._start_steps[0].name if flow._start_steps else None
+        self.order = []
+        self.upstream = {}
+        self.downstream = {}
+        if not start_step:
+            self.has_branches = False
+            self.max_workers = 1
+            self.response_step = None
+            return
+
+        reachable = set()
+        stack = [start_step]
+        while stack:
+            name = stack.pop()
+            if name in reachable:
+                continue
+            reachable.add(name)
+            stack.extend(flow[name].next or [])
+
+        # topological sort (Kahn), in the graph insertion order
+        for name in reachable:
+            self.downstream[name] = [
+                next_name
+                for next_name in flow[name].next or []
+                if next_name in reachable
+            ]
+            self.upstream[name] = [
+                after
+                for after in flow[name].after or []
+                if after in reachable and name != start_step
+            ]
+        remaining = {name: len(upstream) for name, upstream in self.upstream.items()}
+        ready = [start_step]
+        while ready:
+            name = ready.pop(0)
+            self.order.append(name)
+            for next_name in self.downstream[name]:
+                remaining[next_name] -= 1
+                if remaining[next_name] == 0:
+                    ready.append(next_name)
+
+        self.has_branches = any(
+            len(names) > 1
+            for names in list(self.upstream.values()) + list(self.downstream.values())
+        )
+        self.max_workers = min(max(len(self.order), 1), 32)
+        self.response_step = None
+        for name in self.order:
+            if getattr(flow[name], "responder", False):
+                self.response_step = name
+        if not self.response_step and flow.final_step in reachable:
+            self.response_step = flow.final_step
+
+    @staticmethod
+    def merge_events(step, events: list):
+        """return the input event of a (join) step from the events of its upstream steps
+
+        steps with a merge_function (e.g. the Merge step) merge the events, the other steps get an event which
+        holds the list of the upstream events bodies
+        """
+        if len(events) == 1 and not _SyncFlowPlan.is_merge_step(step):
+            return events[0]
+        step_object = getattr(step, "_object", None)
+        if _SyncFlowPlan.is_merge_step(step):
+            if getattr(step_object, "_full_event", True):
+                return step_object.merge_function(events[-1], events)
+            bodies = step_object.merge_function(
+                events[-1].body, [event.body for event in events]
+            )
+            event = copy(events[-1])
+            event.body = bodies
+            return event
+        event = copy(events[-1])
+        event.body = [event.body for event in events]
+        return event
+
+    @staticmethod
+    def is_merge_step(step):
+        return hasattr(getattr(step, "_object", None), "merge_function")
+
+    def get_response(self, outputs: dict):
+        """return the response event, the responder/final step output or the output of the last completed leaf"""
+        if self.response_step and outputs.get(self.response_step) is not None:
+            return outputs[self.response_step]
+        for name in reversed(self.order):
+            if not self.downstream[name] and outputs.get(name) is not None:
+                return outputs[name]
+        return None
+
+
 class RootFlowStep(FlowStep):
     """root flow step"""
 
@@ -11,11 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import atexit
+import datetime
+import queue
 import threading
 import time
 import traceback
 from typing import Dict, Union
 
+import numpy as np
+
 import mlrun
 from mlrun.api.schemas import (
     ModelEndpoint,
@@ -98,6 +103,14 @@ class V2ModelServer(StepToDict):
                               event: {"x": 5} , result_path="resp" means the returned response will be written
                               to event["y"] resulting in {"x": 5, "resp": <result>}
         :param kwargs:     extra arguments (can be accessed using self.get_param(key))
+
+        dynamic batching (opt-in) - concurrent infer requests to the model are coalesced into a single predict()
+        call over the concatenated inputs (and the outputs are split back into the per request responses), enabled
+        by setting the max_batch_size param (model or function param) to a value > 1, the max_batch_wait param sets
+        the max time (seconds, default 0.01) to wait for a batch to fill. the batch size adapts to the observed
+        request concurrency, so a request which arrives alone is not delayed::
+
+            fn.add_model("my", class_name="MyClass", model_path="<model-uri>>", max_batch_size=32)
         """
         self.name = name
         self.version = ""
@@ -126,6 +139,7 @@ class V2ModelServer(StepToDict):
             self.model = model
             self.ready = True
         self.model_endpoint_uid = None
+        self._batcher = None
 
     def _load_and_update_state(self):
         try:
@@ -147,6 +161,14 @@ class V2ModelServer(StepToDict):
             else:
                 self._load_and_update_state()
 
+        max_batch_size = int(self.get_param("max_batch_size", 0) or 0)
+        if max_batch_size > 1 and not self._batcher:
+            self._batcher = _PredictBatcher(
+                self,
+                max_batch_size,
+                float(self.get_param("max_batch_wait", 0.01)),
+            )
+
         server = getattr(self.context, "_server", None) or getattr(
             self.context, "server", None
         )
@@ -246,7 +268,10 @@ class V2ModelServer(StepToDict):
             # predict operation
             request = self._pre_event_processing_actions(event, event_body, op)
             try:
-                outputs = self.predict(request)
+                if self._batcher:
+                    outputs = self._batcher.predict(request)
+                else:
+                    outputs = self.predict(request)
             except Exception as exc:
                 request["id"] = event_id
                 if self._model_logger:
@@ -353,7 +378,8 @@ class V2ModelServer(StepToDict):
             if "inputs" not in request:
                 raise Exception('Expected key "inputs" in request body')
 
-            if not isinstance(request["inputs"], list):
+            # binary tensor payloads are decoded into numpy arrays (see mlrun.serving.binary_protocol)
+            if not isinstance(request["inputs"], (list, np.ndarray)):
                 raise Exception('Expected "inputs" to be a list')
 
         return request
@@ -375,6 +401,134 @@ class V2ModelServer(StepToDict):
         raise NotImplementedError()
 
 
+class _PredictBatcher:
+    """coalesce concurrent predict requests into batches which are predicted by a background thread
+
+    the requests which can be batched (holding only inputs and id) are queued, a batch is closed when it reaches
+    max_size, when max_wait has passed since its first request or when it holds as many requests as the (moving
+    average of the) number of requests in flight, so sequential callers are not delayed
+    """
+
+    def __init__(self, model, max_size: int, max_wait: float):
+        self.model = model
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.batched_requests = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._concurrency = 1.0
+        self._thread = None
+
+    def predict(self, request: dict):
+        """predict a request as part of a batch, blocks until the batch was predicted"""
+        if not set(request.keys()) <= _batched_request_keys or not isinstance(
+            request.get("inputs"), list
+        ):
+            return self.model.predict(request)
+
+        item = _BatchItem(request)
+        with self._lock:
+            if not self._thread:
+                self._thread = threading.Thread(target=self._predict_loop, daemon=True)
+                self._thread.start()
+            self._in_flight += 1
+            self._concurrency = 0.9 * self._concurrency + 0.1 * self._in_flight
+        try:
+            self._queue.put(item)
+            item.done.wait()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        if item.error:
+            raise item.error
+        return item.outputs
+
+    def _predict_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_size:
+                try:
+                    # take the requests which are already queued without waiting
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    pass
+                timeout = deadline - time.monotonic()
+                if timeout <= 0 or len(batch) >= round(self._concurrency):
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            self._predict_batch(batch)
+
+    def _predict_batch(self, batch: list):
+        sizes = [len(item.request["inputs"]) for item in batch]
+        inputs = [value for item in batch for value in item.request["inputs"]]
+        try:
+            outputs = self.model.predict({"inputs": inputs})
+            outputs_list = (
+                outputs.get("outputs") if isinstance(outputs, dict) else outputs
+            )
+            if (
+                isinstance(outputs_list, (str, bytes, dict))
+                or not hasattr(outputs_list, "__len__")
+                or len(outputs_list) != len(inputs)
+            ):
+                raise ValueError(
+                    f"batched predict of model {self.model.name} must return a list/array of outputs (or a dict "
+                    f"with an outputs list) with an output per input, got {type(outputs_list).__name__}"
+                )
+        except Exception as exc:
+            if len(batch) == 1:
+                batch[0].error = exc
+                batch[0].done.set()
+                return
+            logger.warning(
+                "Batched predict failed, predicting the requests separately",
+                model=self.model.name,
+                requests=len(batch),
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            self._predict_separately(batch)
+            return
+
+        self.batches += 1
+        self.batched_requests += len(batch)
+        position = 0
+        for item, size in zip(batch, sizes):
+            item_outputs = outputs_list[position : position + size]
+            position += size
+            if isinstance(outputs, dict):
+                item_outputs = {**outputs, "outputs": item_outputs}
+            item.outputs = item_outputs
+            item.done.set()
+
+    def _predict_separately(self, batch: list):
+        # so a bad request (or a model which can not predict batches) only fails its own request
+        for item in batch:
+            try:
+                item.outputs = self.model.predict(item.request)
+            except Exception as exc:
+                item.error = exc
+            item.done.set()
+
+
+# the routing keys (of stream events) are ignored, requests with other keys are predicted separately
+_batched_request_keys = {"inputs", "id", "model", "operation"}
+
+
+class _BatchItem:
+    def __init__(self, request: dict):
+        self.request = request
+        self.outputs = None
+        self.error = None
+        self.done = threading.Event()
+
+
 class _ModelLogPusher:
     def __init__(self, model, context, output_stream=None):
         self.model = model
@@ -384,11 +538,35 @@ class _ModelLogPusher:
         self.stream_path = context.stream.stream_uri
         self.stream_batch = int(context.get_param("log_stream_batch", 1))
         self.stream_sample = int(context.get_param("log_stream_sample", 1))
+        # micro batches are flushed when they are full or when the flush interval (seconds) has passed
+        self.stream_flush_interval = float(
+            context.get_param("log_stream_flush_interval", 1)
+        )
+        # in background mode records are pushed to the stream by a background thread, the request thread only adds
+        # them to a bounded queue which is handled according to the overflow policy when full
+        self.stream_background = bool(context.get_param("log_stream_background", False))
+        self.stream_queue_size = int(context.get_param("log_stream_queue_size", 10000))
+        self.stream_overflow = context.get_param(
+            "log_stream_overflow", _LogStreamOverflowPolicy.drop
+        )
+        if self.stream_overflow not in _LogStreamOverflowPolicy.all():
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Invalid log stream overflow policy {self.stream_overflow}, "
+                f"must be one of {_LogStreamOverflowPolicy.all()}"
+            )
+        # max seconds to wait for the queued records to be pushed when the worker exits
+        self.stream_exit_timeout = float(
+            context.get_param("log_stream_exit_timeout", 10)
+        )
         self.output_stream = output_stream or context.stream.output_stream
         self._worker = context.worker_id
         self._sample_iter = 0
-        self._batch_iter = 0
         self._batch = []
+        self._batch_start = None
+        self._queue = None
+        self._push_thread = None
+        self._push_thread_lock = threading.Lock()
+        self.dropped_records = 0
 
     def base_data(self):
         base_data = {
@@ -413,43 +591,160 @@ class _ModelLogPusher:
             if self.verbose:
                 message = f"{message}\n{traceback.format_exc()}"
             data["error"] = message
-            self.output_stream.push([data])
+            if self.stream_background:
+                self._enqueue(data)
+            else:
+                self.output_stream.push([data])
             return
 
         self._sample_iter = (self._sample_iter + 1) % self.stream_sample
         if self.output_stream and self._sample_iter == 0:
-            microsec = (now_date() - start).microseconds
-
-            if self.stream_batch > 1:
-                if self._batch_iter == 0:
+            # total latency in microseconds (timedelta.microseconds is only the sub second part)
+            microsec = (now_date() - start) // datetime.timedelta(microseconds=1)
+            record = [request, op, resp, str(start), microsec]
+
+            if self.stream_background:
+                self._enqueue(record)
+            elif self.stream_batch > 1:
+                if not self._batch:
+                    self._batch_start = time.monotonic()
+                self._batch.append(record)
+                if (
+                    len(self._batch) >= self.stream_batch
+                    or time.monotonic() - self._batch_start
+                    >= self.stream_flush_interval
+                ):
+                    self._push_records(self._batch)
                     self._batch = []
-                self._batch.append(
-                    [request, op, resp, str(start), microsec, self.model.metrics]
-                )
-                self._batch_iter = (self._batch_iter + 1) % self.stream_batch
-
-                if self._batch_iter == 0:
-                    data = self.base_data()
-                    data["headers"] = [
-                        "request",
-                        "op",
-                        "resp",
-                        "when",
-                        "microsec",
-                        "metrics",
-                    ]
-                    data["values"] = self._batch
-                    self.output_stream.push([data])
             else:
-                data = self.base_data()
-                data["request"] = request
-                data["op"] = op
-                data["resp"] = resp
-                data["when"] = str(start)
-                data["microsec"] = microsec
-                if getattr(self.model, "metrics", None):
-                    data["metrics"] = self.model.metrics
-                self.output_stream.push([data])
+                self._push_records([record])
+
+    def _push_records(self, records: list):
+        data = self.base_data()
+        if len(records) == 1:
+            request, op, resp, when, microsec = records[0]
+            data["request"] = request
+            data["op"] = op
+            data["resp"] = resp
+            data["when"] = when
+            data["microsec"] = microsec
+        else:
+            # compact columnar payload, a list of values per header
+            data["headers"] = _log_stream_batch_headers
+            data["columns"] = [list(column) for column in zip(*records)]
+        if getattr(self.model, "metrics", None):
+            data["metrics"] = self.model.metrics
+        self.output_stream.push([data])
+
+    def _enqueue(self, item):
+        if not self._push_thread:
+            with self._push_thread_lock:
+                if not self._push_thread:
+                    self._queue = queue.Queue(maxsize=self.stream_queue_size)
+                    self._push_thread = threading.Thread(
+                        target=self._push_loop, daemon=True
+                    )
+                    self._push_thread.start()
+                    # the push thread is a daemon, push the queued records before the worker exits
+                    atexit.register(self._flush_on_exit)
+
+        if self.stream_overflow == _LogStreamOverflowPolicy.block:
+            self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped_records += 1
+            if self.dropped_records % self.stream_queue_size == 1:
+                logger.warning(
+                    "Model monitoring log queue is full, dropping records",
+                    model=self.model.name,
+                    dropped_records=self.dropped_records,
+                )
+
+    def _push_loop(self):
+        records = []
+        flush_time = None
+        while True:
+            timeout = (
+                max(flush_time - time.monotonic(), 0)
+                if flush_time is not None
+                else None
+            )
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, dict):
+                self._safe_push(self.output_stream.push, [item])
+                self._queue.task_done()
+            elif item is not None:
+                if not records:
+                    flush_time = time.monotonic() + self.stream_flush_interval
+                records.append(item)
+
+            if records and (
+                len(records) >= self.stream_batch or time.monotonic() >= flush_time
+            ):
+                self._safe_push(self._push_records, records)
+                for _ in records:
+                    self._queue.task_done()
+                records = []
+                flush_time = None
+
+    def _safe_push(self, push, records):
+        try:
+            push(records)
+        except Exception as exc:
+            logger.warning(
+                "Failed to push model monitoring records to the stream",
+                model=self.model.name,
+                records=len(records),
+                exc=mlrun.errors.err_to_str(exc),
+            )
+
+    def wait_for_pushes(self, timeout: float = None) -> bool:
+        """wait until all the queued records were pushed to the stream (background mode)
+
+        :param timeout: max seconds to wait, wait forever when None
+        :return: True if all the queued records were pushed
+        """
+        if not self._queue:
+            return True
+        if timeout is None:
+            self._queue.join()
+            return True
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _flush_on_exit(self):
+        if not self.wait_for_pushes(timeout=self.stream_exit_timeout):
+            logger.warning(
+                "Model monitoring records were not pushed to the stream before exit",
+                model=self.model.name,
+                records=self._queue.unfinished_tasks,
+            )
+
+
+_log_stream_batch_headers = ["request", "op", "resp", "when", "microsec"]
+
+
+class _LogStreamOverflowPolicy:
+    # drop new records when the queue is full
+    drop = "drop"
+    # block the request until there is room in the queue (backpressure)
+    block = "block"
+
+    @staticmethod
+    def all():
+        return [_LogStreamOverflowPolicy.drop, _LogStreamOverflowPolicy.block]
 
 
 def _init_endpoint_record(
@@ -0,0 +1,218 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+import mlrun.errors
+
+_chunk_suffix = ".parquet"
+
+
+def get_run_metrics_path(artifact_path: str, uid: str, iteration: int = 0) -> str:
+    """return the path of the time-series metrics chunks of a run (iteration)"""
+    return f"{artifact_path.rstrip('/')}/metrics/{uid}/{iteration or 0}"
+
+
+class RunMetricsWriter:
+    """buffer time-series metric points of a run and write them as append-only columnar (parquet) chunk files
+
+    every chunk is a new object under the metrics path (the metric points are never rewritten), so millions of
+    points can be logged without growing the run object, and multiple writers of the same run don't conflict
+    """
+
+    def __init__(self, path: str, flush_size: int = None):
+        self.path = path
+        self.flush_size = flush_size or int(mlrun.mlconf.run_metrics.flush_size)
+        self._steps = {}
+        self._lock = threading.Lock()
+        self._reset_buffer()
+
+    def log(self, key: str, value, step: int = None, timestamp: datetime = None):
+        """add a metric point, the step is incremented per key when not specified"""
+        try:
+            value = float(value)
+        except (TypeError, ValueError) as exc:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"metric {key} value must be numeric, got {value!r}"
+            ) from exc
+        with self._lock:
+            if step is None:
+                step = self._steps.get(key, -1) + 1
+            self._steps[key] = max(step, self._steps.get(key, step))
+            self._keys.append(key)
+            self._step_values.append(int(step))
+            self._timestamps.append(timestamp or datetime.now())
+            self._values.append(value)
+            buffer_full = len(self._keys) >= self.flush_size
+        if buffer_full:
+            self.flush()
+
+    def flush(self):
+        """write the buffered metric points as a new chunk"""
+        with self._lock:
+            if not self._keys:
+                return
+            df = pd.DataFrame(
+                {
+                    "key": pd.Categorical(self._keys),
+                    "step": np.array(self._step_values, dtype=np.int64),
+                    "timestamp": pd.to_datetime(self._timestamps),
+                    "value": np.array(self._values, dtype=np.float64),
+                }
+            )
+            self._reset_buffer()
+            buffer = io.BytesIO()
+            df.to_parquet(buffer, index=False)
+            # the chunk names are ordered by creation time, the random part avoids collisions between writers and
+            # the steps range of the chunk points lets readers skip the chunks outside of the queried steps
+            chunk_name = (
+                f"{int(time.time() * 1000):013}-{uuid.uuid4().hex[:8]}"
+                f"-{df['step'].min()}_{df['step'].max()}"
+            )
+            mlrun.store_manager.object(
+                url=f"{self.path}/{chunk_name}{_chunk_suffix}"
+            ).put(buffer.getvalue())
+
+    def _reset_buffer(self):
+        self._keys = []
+        self._step_values = []
+        self._timestamps = []
+        self._values = []
+
+
+def read_run_metrics_df(
+    path: str,
+    keys: List[str] = None,
+    start_step: int = None,
+    end_step: int = None,
+    secrets: dict = None,
+) -> pd.DataFrame:
+    """read the metric points under the metrics path into a dataframe (sorted by key and step), only the chunks
+    which overlap the steps range are read, and the keys and steps are filtered while reading the chunks"""
+    columns = ["key", "step", "timestamp", "value"]
+    try:
+        chunk_names = sorted(
+            name.strip("/")
+            for name in mlrun.store_manager.object(url=path, secrets=secrets).listdir()
+            if name.endswith(_chunk_suffix)
+        )
+    except FileNotFoundError:
+        chunk_names = []
+
+    filters = []
+    if keys:
+        filters.append(("key", "in", list(keys)))
+    if start_step is not None:
+        filters.append(("step", ">=", start_step))
+    if end_step is not None:
+        filters.append(("step", "<=", end_step))
+    chunks = []
+    for chunk_name in chunk_names:
+        steps_range = _get_chunk_steps_range(chunk_name)
+        if steps_range and (
+            (start_step is not None and steps_range[1] < start_step)
+            or (end_step is not None and steps_range[0] > end_step)
+        ):
+            continue
+        body = mlrun.store_manager.object(
+            url=f"{path}/{chunk_name}", secrets=secrets
+        ).get()
+        chunk = pd.read_parquet(
+            io.BytesIO(body), columns=columns, filters=filters or None
+        )
+        chunk["key"] = chunk["key"].astype(str)
+        chunks.append(chunk)
+    if not chunks:
+        return pd.DataFrame(columns=columns)
+    return (
+        pd.concat(chunks, ignore_index=True)
+        .sort_values(["key", "step"], kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def _get_chunk_steps_range(chunk_name: str):
+    """return the (min, max) steps of the chunk points from the chunk name, None for chunks without it"""
+    parts = chunk_name[: -len(_chunk_suffix)].split("-", 2)
+    if len(parts) < 3:
+        return None
+    min_step, max_step = parts[2].split("_")
+    return int(min_step), int(max_step)
+
+
+def read_run_metrics(
+    path: str,
+    keys: List[str] = None,
+    start_step: int = None,
+    end_step: int = None,
+    max_points: int = None,
+    secrets: dict = None,
+) -> dict:
+    """read the time-series metrics of a run, series longer than max_points are downsampled
+
+    the result is a dict of metric key to its series (step, timestamp and value lists), a downsampled series is
+    split into max_points equal step ranges and holds the first step, the last timestamp and the mean, min and max
+    values of every range
+
+    :param path:       metrics path (see get_run_metrics_path)
+    :param keys:       metric keys to read (all the keys by default)
+    :param start_step: read points from this step (inclusive)
+    :param end_step:   read points up to this step (inclusive)
+    :param max_points: max points per key (mlconf.run_metrics.max_points by default, 0 for no downsampling)
+    :param secrets:    secrets (credentials) of the metrics path store
+    """
+    if max_points is None:
+        max_points = int(mlrun.mlconf.run_metrics.max_points)
+    df = read_run_metrics_df(path, keys, start_step, end_step, secrets=secrets)
+
+    results = {}
+    for key, series in df.groupby("key", sort=True):
+        if max_points and len(series) > max_points:
+            results[key] = _downsample(series, max_points)
+        else:
+            results[key] = {
+                "step": series["step"].tolist(),
+                "timestamp": _timestamps_to_list(series["timestamp"]),
+                "value": series["value"].tolist(),
+            }
+    return results
+
+
+def _downsample(series: pd.DataFrame, max_points: int) -> dict:
+    steps = series["step"].to_numpy()
+    first_step, last_step = steps[0], steps[-1]
+    buckets = np.minimum(
+        ((steps - first_step) * max_points // max(last_step - first_step, 1)),
+        max_points - 1,
+    )
+    grouped = series.groupby(buckets, sort=True)
+    return {
+        "step": grouped["step"].min().tolist(),
+        "timestamp": _timestamps_to_list(grouped["timestamp"].max()),
+        "value": grouped["value"].mean().tolist(),
+        "min": grouped["value"].min().tolist(),
+        "max": grouped["value"].max().tolist(),
+    }
+
+
+def _timestamps_to_list(timestamps: pd.Series) -> list:
+    return [timestamp.isoformat() for timestamp in timestamps]
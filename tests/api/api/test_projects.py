@@ -392,6 +392,94 @@ def test_list_and_get_project_summaries(
     )
 
 
+def test_project_summary_artifacts_counters_refreshed_on_artifact_changes(
+    db: Session, client: TestClient, project_member_mode: str
+) -> None:
+    project_name = "project-with-artifacts"
+    project = mlrun.api.schemas.Project(
+        metadata=mlrun.api.schemas.ProjectMetadata(name=project_name),
+    )
+    response = client.post("projects", json=project.dict())
+    assert response.status_code == HTTPStatus.CREATED.value
+
+    files_count = 3
+    _create_artifacts(
+        client, project_name, files_count, mlrun.artifacts.ChartArtifact.kind
+    )
+
+    def _get_project_summary():
+        response = client.get(f"project-summaries/{project_name}")
+        assert response.status_code == HTTPStatus.OK.value
+        return mlrun.api.schemas.ProjectSummary(**response.json())
+
+    project_summary = _get_project_summary()
+    assert project_summary.files_count == files_count
+    assert project_summary.models_count == 0
+
+    # the counters are cached, verify artifact changes are reflected without waiting for the cache to expire
+    models_count = 2
+    _create_artifacts(
+        client, project_name, models_count, mlrun.artifacts.model.ModelArtifact.kind
+    )
+    project_summary = _get_project_summary()
+    assert project_summary.files_count == files_count
+    assert project_summary.models_count == models_count
+
+    response = client.delete(
+        f"projects/{project_name}/artifacts",
+        params={"name": f"{mlrun.artifacts.ChartArtifact.kind}-name-0"},
+    )
+    assert response.status_code == HTTPStatus.OK.value
+    project_summary = _get_project_summary()
+    assert project_summary.files_count == files_count - 1
+    assert project_summary.models_count == models_count
+
+
+def test_project_summary_artifacts_counters_updated_incrementally(
+    db: Session, client: TestClient, project_member_mode: str
+) -> None:
+    project_name = "project-with-artifacts"
+    project = mlrun.api.schemas.Project(
+        metadata=mlrun.api.schemas.ProjectMetadata(name=project_name),
+    )
+    response = client.post("projects", json=project.dict())
+    assert response.status_code == HTTPStatus.CREATED.value
+
+    files_count = 2
+    _create_artifacts(
+        client, project_name, files_count, mlrun.artifacts.ChartArtifact.kind
+    )
+    response = client.get(f"project-summaries/{project_name}")
+    assert response.status_code == HTTPStatus.OK.value
+
+    # storing and deleting a single artifact updates the cached counters without recounting the project artifacts
+    db_instance = mlrun.api.utils.singletons.db.get_db()
+    with unittest.mock.patch.object(
+        db_instance,
+        "get_project_artifacts_counters",
+        side_effect=AssertionError("project artifacts were recounted"),
+    ):
+        models_count = 2
+        _create_artifacts(
+            client,
+            project_name,
+            models_count,
+            mlrun.artifacts.model.ModelArtifact.kind,
+        )
+        response = client.delete(
+            f"projects/{project_name}/artifacts/some-uid",
+            params={"key": f"{mlrun.artifacts.ChartArtifact.kind}-name-0"},
+        )
+        assert response.status_code == HTTPStatus.OK.value
+
+    cached_counters = mlrun.api.crud.Projects()._cache["project_resources_counters"][
+        "result"
+    ]
+    project_to_files_count, _, _, project_to_models_count, _, _, _ = cached_counters
+    assert project_to_files_count[project_name] == files_count - 1
+    assert project_to_models_count[project_name] == models_count
+
+
 def test_list_project_summaries_different_installation_modes(
     db: Session, client: TestClient, project_member_mode: str
 ) -> None:
@@ -26,6 +26,8 @@ import mlrun.api.schemas
 import mlrun.api.utils.auth.verifier
 import mlrun.errors
 import mlrun.runtimes.constants
+import mlrun.utils.run_metrics
+import tests.api.api.utils
 from mlrun.api.db.sqldb.models import Run
 from mlrun.api.utils.singletons.db import get_db
 from mlrun.config import config
@@ -48,6 +50,98 @@ def test_run_with_nan_in_body(db: Session, client: TestClient) -> None:
     assert resp.status_code == HTTPStatus.OK.value
 
 
+def test_get_run_metrics(
+    db: Session, client: TestClient, k8s_secrets_mock, tmp_path
+) -> None:
+    project = "some-project"
+    uid = "some-uid"
+    run = {
+        "metadata": {"name": "run-name", "uid": uid, "project": project},
+        "spec": {"output_path": str(tmp_path)},
+    }
+    mlrun.api.crud.Runs().store_run(db, run, uid, project=project)
+    writer = mlrun.utils.run_metrics.RunMetricsWriter(
+        mlrun.utils.run_metrics.get_run_metrics_path(str(tmp_path), uid), flush_size=50
+    )
+    for step in range(200):
+        writer.log("loss", 200 - step)
+        writer.log("accuracy", step / 200)
+    writer.flush()
+
+    resp = client.get(
+        f"run/{project}/{uid}/metrics",
+        params={"key": "loss", "start-step": 100, "max-points": 10},
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+    metrics = resp.json()["data"]
+    assert list(metrics.keys()) == ["loss"]
+    assert metrics["loss"]["step"] == list(range(100, 200, 10))
+    assert metrics["loss"]["max"][0] == 100
+    assert metrics["loss"]["min"][-1] == 1
+
+    resp = client.get(f"run/{project}/{uid}/metrics")
+    metrics = resp.json()["data"]
+    assert sorted(metrics.keys()) == ["accuracy", "loss"]
+    assert len(metrics["accuracy"]["value"]) == 200
+
+
+def test_get_run_metrics_with_project_secrets(
+    db: Session, client: TestClient, k8s_secrets_mock, tmp_path
+) -> None:
+    project = "some-project"
+    uid = "some-uid"
+    run = {
+        "metadata": {"name": "run-name", "uid": uid, "project": project},
+        "spec": {"output_path": str(tmp_path)},
+    }
+    mlrun.api.crud.Runs().store_run(db, run, uid, project=project)
+    project_secrets = {"secret1": "value1"}
+    k8s_secrets_mock.store_project_secrets(project, project_secrets)
+
+    # the metrics are read with the project secrets and the caller credentials, same as the files endpoints
+    with unittest.mock.patch.object(
+        mlrun.store_manager, "object", wraps=mlrun.store_manager.object
+    ) as object_mock:
+        resp = client.get(f"run/{project}/{uid}/metrics")
+        assert resp.status_code == HTTPStatus.OK.value
+        assert object_mock.call_args.kwargs["secrets"] == {
+            **project_secrets,
+            "V3IO_ACCESS_KEY": None,
+        }
+
+        resp = client.get(f"run/{project}/{uid}/metrics", params={"use-secrets": False})
+        assert resp.status_code == HTTPStatus.OK.value
+        assert object_mock.call_args.kwargs["secrets"] == {"V3IO_ACCESS_KEY": None}
+
+
+def test_store_runs(db: Session, client: TestClient) -> None:
+    project = "some-project"
+    uid = "some-uid"
+    tests.api.api.utils.create_project(client, project)
+    runs = [
+        {
+            "metadata": {
+                "name": "run-name",
+                "uid": uid,
+                "project": project,
+                "iteration": iteration,
+            },
+            "status": {"state": mlrun.runtimes.constants.RunStates.created},
+        }
+        for iteration in range(1, 4)
+    ]
+    resp = client.post(f"projects/{project}/runs", json={"runs": runs})
+    assert resp.status_code == HTTPStatus.OK.value
+
+    resp = client.get("runs", params={"project": project, "uid": uid})
+    assert len(resp.json()["runs"]) == 3
+
+    # runs of other projects are rejected
+    runs[0]["metadata"]["project"] = "other-project"
+    resp = client.post(f"projects/{project}/runs", json={"runs": runs})
+    assert resp.status_code == HTTPStatus.BAD_REQUEST.value
+
+
 def test_abort_run(db: Session, client: TestClient) -> None:
     project = "some-project"
     run_in_progress = {
@@ -383,6 +477,34 @@ def test_list_runs_single_and_multiple_uids(db: Session, client: TestClient):
         expected_uids.remove(run["metadata"]["uid"])
 
 
+def test_list_runs_pagination(db: Session, client: TestClient):
+    project = "my_project"
+    for counter in range(7):
+        uid = f"uid_{counter}"
+        run = {
+            "metadata": {"name": f"run_{counter}", "uid": uid, "project": project},
+            "status": {"start_time": f"2023-01-01T00:00:0{counter}+00:00"},
+        }
+        mlrun.api.crud.Runs().store_run(db, run, uid, project=project)
+
+    uids = []
+    params = {"project": project, "page-size": 3, "field": "status.state"}
+    while True:
+        response = client.get("runs", params=params)
+        assert response.status_code == HTTPStatus.OK.value
+        body = response.json()
+        assert len(body["runs"]) <= 3
+        for run in body["runs"]:
+            # the project and uid are always returned, for the permissions filtering
+            assert set(run["metadata"].keys()) == {"project", "uid"}
+            uids.append(run["metadata"]["uid"])
+        if not body["next_page_token"]:
+            break
+        params["page-token"] = body["next_page_token"]
+
+    assert uids == [f"uid_{counter}" for counter in reversed(range(7))]
+
+
 def test_delete_runs_with_permissions(db: Session, client: TestClient):
     mlrun.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions = (
         unittest.mock.AsyncMock()
@@ -22,6 +22,7 @@ import mlrun.api.initial_data
 import mlrun.errors
 from mlrun.api import schemas
 from mlrun.api.db.base import DBInterface
+from mlrun.api.db.sqldb.models import Artifact
 from mlrun.api.schemas.artifact import ArtifactCategories
 from mlrun.artifacts.dataset import DatasetArtifact
 from mlrun.artifacts.model import ModelArtifact
@@ -690,6 +691,163 @@ def test_list_artifacts_best_iter(db: DBInterface, db_session: Session):
         )
 
 
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+@pytest.mark.parametrize("page_size", [1, 2, 5, 100])
+def test_list_artifacts_pagination(db: DBInterface, db_session: Session, page_size):
+    num_iters = 3
+    best_iter = 1
+    for index in range(3):
+        _generate_artifact_with_iterations(
+            db,
+            db_session,
+            f"artifact-{index}",
+            f"uid-{index}",
+            num_iters,
+            best_iter,
+            ArtifactCategories.model,
+        )
+
+    def _list_pages(**kwargs):
+        artifacts = []
+        page_token = None
+        while True:
+            page, page_token = db.list_artifacts(
+                db_session, page_size=page_size, page_token=page_token, **kwargs
+            )
+            assert len(page) <= page_size
+            artifacts.extend(page)
+            if not page_token:
+                return artifacts
+
+    def _identifiers(artifacts):
+        return sorted(
+            (artifact["metadata"]["name"], artifact["spec"]["iter"])
+            for artifact in artifacts
+        )
+
+    for kwargs in [{}, {"category": ArtifactCategories.model}]:
+        assert _identifiers(_list_pages(**kwargs)) == _identifiers(
+            db.list_artifacts(db_session, **kwargs)
+        )
+
+    artifacts = _list_pages(best_iteration=True)
+    assert _identifiers(artifacts) == [
+        (f"artifact-{index}", best_iter) for index in range(3)
+    ]
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_project_artifacts_counters(db: DBInterface, db_session: Session):
+    project = "project-1"
+    other_project = "project-2"
+    for kind in [ModelArtifact.kind, ChartArtifact.kind]:
+        # hyper param run - a link artifact pointing to the best iteration
+        uid = f"{kind}-hyper-uid"
+        for iter in range(3):
+            artifact = _generate_artifact(
+                f"{kind}-hyper", uid=uid, kind=kind if iter else "link"
+            )
+            if not iter:
+                artifact["spec"]["link_iteration"] = 1
+            db.store_artifact(
+                db_session, f"{kind}-hyper", artifact, uid, iter=iter, project=project
+            )
+
+        # several versions of the same artifact are counted once
+        for index in range(2):
+            uid = f"{kind}-uid-{index}"
+            artifact = _generate_artifact(kind, uid=uid, kind=kind)
+            db.store_artifact(db_session, kind, artifact, uid, project=project)
+
+    for kind in [DatasetArtifact.kind, PlotArtifact.kind]:
+        artifact = _generate_artifact(kind, uid="uid", kind=kind)
+        db.store_artifact(db_session, kind, artifact, "uid", project=other_project)
+
+    # files are the 2 chart iterations, their link and the chart, models are the latest model iterations and model
+    expected_files_count = len(
+        db.list_artifacts(
+            db_session,
+            project=project,
+            tag="latest",
+            category=schemas.ArtifactCategories.other,
+        )
+    )
+    assert expected_files_count == 4
+    assert db._calculate_files_counters(db_session) == {
+        project: expected_files_count,
+        other_project: 1,
+    }
+    assert db._calculate_models_counters(db_session) == {project: 3}
+    assert db.get_project_artifacts_counters(db_session, project) == (4, 3)
+    assert db.get_project_artifacts_counters(db_session, other_project) == (1, 0)
+    assert db.get_project_artifacts_counters(db_session, "no-such-project") == (0, 0)
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_project_artifacts_counters_link_key_collision(
+    db: DBInterface, db_session: Session
+):
+    project = "project-1"
+    uid = "hyper-uid"
+    # a link artifact "model" pointing to a model iteration, and an unrelated chart "my-model" of the same run
+    for iter in range(2):
+        kind = ModelArtifact.kind if iter else "link"
+        artifact = _generate_artifact("model", uid=uid, kind=kind)
+        if not iter:
+            artifact["spec"]["link_iteration"] = 1
+        db.store_artifact(
+            db_session, "model", artifact, uid, iter=iter, project=project
+        )
+    artifact = _generate_artifact("my-model", uid=uid, kind=ChartArtifact.kind)
+    db.store_artifact(db_session, "my-model", artifact, uid, project=project)
+
+    # only the chart is a file, the link points to a model
+    assert db.get_project_artifacts_counters(db_session, project) == (1, 1)
+    assert db.get_artifacts_counters_contribution(
+        db_session, project, ["model", "1-model", "my-model"]
+    ) == (1, 1)
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_data_migration_fill_artifacts_link_iteration(
+    db: DBInterface, db_session: Session
+):
+    project = "project-1"
+    uid = "hyper-uid"
+    for iter in range(2):
+        artifact = _generate_artifact(
+            "chart", uid=uid, kind=ChartArtifact.kind if iter else "link"
+        )
+        if not iter:
+            artifact["spec"]["link_iteration"] = 1
+        db.store_artifact(
+            db_session, "chart", artifact, uid, iter=iter, project=project
+        )
+    assert db.get_project_artifacts_counters(db_session, project) == (2, 0)
+
+    # as stored by older versions, without the promoted column
+    link_artifact = db._query(db_session, Artifact, kind="link").one()
+    assert link_artifact.link_iteration == 1
+    link_artifact.link_iteration = None
+    db._upsert(db_session, [link_artifact])
+    assert db.get_project_artifacts_counters(db_session, project) == (1, 0)
+
+    mlrun.api.initial_data._fill_artifacts_link_iteration(db, db_session, batch_size=1)
+    assert db.get_project_artifacts_counters(db_session, project) == (2, 0)
+
+
 @pytest.mark.parametrize(
     "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
 )
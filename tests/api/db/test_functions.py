@@ -320,3 +320,29 @@ def test_delete_function(db: DBInterface, db_session: Session):
 
     assert number_of_tags == 0
     assert number_of_labels == 0
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_functions_pagination(db: DBInterface, db_session: Session):
+    for index in range(5):
+        db.store_function(
+            db_session, {"metadata": {"name": f"func-{index}"}}, f"func-{index}"
+        )
+
+    names = []
+    page, page_token = db.list_functions(db_session, page_size=2)
+    while True:
+        assert len(page) <= 2
+        names.extend(function["metadata"]["name"] for function in page)
+        if not page_token:
+            break
+        page, page_token = db.list_functions(
+            db_session, page_size=2, page_token=page_token
+        )
+    assert names == [f"func-{index}" for index in reversed(range(5))]
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        db.list_functions(db_session, page_size=2, page_token="invalid")
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timezone
+import pickle
+from datetime import datetime, timedelta, timezone
 
+import orjson
 import pytest
 from sqlalchemy.orm import Session
 
@@ -272,6 +274,36 @@ def test_store_run_success(db: DBInterface, db_session: Session):
     )
 
 
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_store_runs(db: DBInterface, db_session: Session):
+    project, name, uid, _, _ = _create_new_run(db, db_session)
+    runs = [
+        {
+            "metadata": {
+                "name": name,
+                "uid": uid,
+                "project": project,
+                "iteration": iteration,
+                "labels": {"kind": "handler"},
+            },
+            "status": {"state": mlrun.runtimes.constants.RunStates.completed},
+        }
+        for iteration in range(3)
+    ]
+
+    # the existing run (iteration 0) is updated and the new iterations are created
+    db.store_runs(db_session, runs, project)
+    stored_runs = db.list_runs(db_session, project=project, uid=uid, iter=True)
+    assert len(stored_runs) == 3
+    for run in stored_runs:
+        assert run["status"]["state"] == mlrun.runtimes.constants.RunStates.completed
+        assert run["metadata"]["labels"] == {"kind": "handler"}
+    assert sorted(run["metadata"]["iteration"] for run in stored_runs) == [0, 1, 2]
+
+
 # running only on sqldb cause filedb is not really a thing anymore, will be removed soon
 @pytest.mark.parametrize(
     "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
@@ -364,6 +396,120 @@ def test_list_runs_limited_unsorted_failure(db: DBInterface, db_session: Session
         )
 
 
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_runs_fields(db: DBInterface, db_session: Session):
+    project = "project"
+    for index in range(3):
+        run = {
+            "metadata": {
+                "name": f"run-name-{index}",
+                "labels": {"kind": "job"},
+            },
+            "status": {"results": {"accuracy": index / 10}},
+            "spec": {"parameters": {"p1": index}},
+        }
+        db.store_run(db_session, run, f"uid-{index}", project)
+
+    # fields which are all stored as columns
+    runs = db.list_runs(
+        db_session,
+        project=project,
+        fields=["metadata.name", "metadata.labels.kind", "status.results"],
+    )
+    assert sorted(runs, key=lambda run: run["metadata"]["name"]) == [
+        {
+            "metadata": {"name": f"run-name-{index}", "labels": {"kind": "job"}},
+            "status": {"results": {"accuracy": index / 10}},
+        }
+        for index in range(3)
+    ]
+    runs = db.list_runs(db_session, project=project, fields=["status.start_time"])
+    full_runs = db.list_runs(db_session, project=project)
+    assert [run["status"]["start_time"] for run in runs] == [
+        run["status"]["start_time"] for run in full_runs
+    ]
+
+    # fields which are read from the run bodies
+    runs = db.list_runs(
+        db_session,
+        project=project,
+        fields=["metadata.uid", "spec.parameters.p1"],
+    )
+    assert sorted(runs, key=lambda run: run["metadata"]["uid"]) == [
+        {"metadata": {"uid": f"uid-{index}"}, "spec": {"parameters": {"p1": index}}}
+        for index in range(3)
+    ]
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_data_migration_structs_to_json(db: DBInterface, db_session: Session):
+    project, name, uid, iteration, run = _create_new_run(db, db_session)
+    run_record = db._find_runs(db_session, None, project, None).one()
+    run_dict = run_record.struct
+    run_dict["metadata"]["labels"] = {"kind": "job"}
+
+    # change to be as it will be in field (before the migration) - pickled body without the promoted columns
+    run_record.body = pickle.dumps(run_dict)
+    run_record.kind = None
+    db._upsert(db_session, [run_record])
+    assert db.read_run(db_session, uid, project) == run_dict
+
+    mlrun.api.initial_data._migrate_structs_to_json(db, db_session, batch_size=1)
+
+    run_record = db._find_runs(db_session, None, project, None).one()
+    assert orjson.loads(run_record.body) == run_dict
+    assert run_record.kind == "job"
+    assert db.list_runs(db_session, project=project, fields=["metadata.labels.kind"])[
+        0
+    ] == {"metadata": {"labels": {"kind": "job"}}}
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+@pytest.mark.parametrize("page_size", [1, 3, 20])
+def test_list_runs_pagination(db: DBInterface, db_session: Session, page_size):
+    project = "project"
+    start_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    for index in range(10):
+        run = {
+            "metadata": {"name": f"run-name-{index}"},
+            # runs 2i and 2i+1 share the same start time, so the pages are also positioned by the record ids
+            "status": {
+                "start_time": (start_time + timedelta(minutes=index // 2)).isoformat()
+            },
+        }
+        db.store_run(db_session, run, f"uid-{index}", project)
+
+    uids = []
+    page_token = None
+    while True:
+        runs, page_token = db.list_runs(
+            db_session,
+            project=project,
+            fields=["metadata.uid"],
+            page_size=page_size,
+            page_token=page_token,
+        )
+        assert len(runs) <= page_size
+        uids.extend(run["metadata"]["uid"] for run in runs)
+        if not page_token:
+            break
+
+    # newest first
+    assert uids == [f"uid-{index}" for index in reversed(range(10))]
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        db.list_runs(db_session, project=project, page_size=page_size, last=1)
+
+
 def _change_run_record_to_before_align_runs_migration(run, time_before_creation):
     run_dict = run.struct
 
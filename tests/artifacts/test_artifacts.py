@@ -315,6 +315,43 @@ def test_log_artifact(
             assert expected_hash in logged_artifact.target_path
 
 
+def test_log_artifact_deduplicate_uploads(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        mlrun.mlconf.artifacts, "generate_target_path_from_artifact_hash", True
+    )
+    monkeypatch.setattr(mlrun.mlconf.artifacts, "deduplicate_uploads", True)
+    uploads = []
+    original_upload = mlrun.datastore.DataItem.upload
+
+    def _upload(data_item, src_path):
+        uploads.append(data_item.url)
+        original_upload(data_item, src_path)
+
+    monkeypatch.setattr(mlrun.datastore.DataItem, "upload", _upload)
+    src_path = tmp_path / "data.csv"
+    artifact_path = str(tmp_path / "artifacts")
+    context = mlrun.get_or_create_ctx("test")
+
+    src_path.write_text("x,y\n1,2\n")
+    first = context.log_artifact(
+        "first", local_path=str(src_path), artifact_path=artifact_path
+    )
+    # identical content is not uploaded again
+    second = context.log_artifact(
+        "second", local_path=str(src_path), artifact_path=artifact_path
+    )
+    assert uploads == [first.target_path]
+    assert second.target_path == first.target_path
+    assert second.metadata.hash == first.metadata.hash
+
+    src_path.write_text("x,y\n3,4\n")
+    third = context.log_artifact(
+        "third", local_path=str(src_path), artifact_path=artifact_path
+    )
+    assert uploads == [first.target_path, third.target_path]
+    assert third.target_path != first.target_path
+
+
 def test_log_artifact_with_target_path_and_upload_options():
     for target_path in ["s3://some/path", None]:
         # True and None expected to upload
@@ -154,6 +154,7 @@ def patch_file_forbidden(monkeypatch):
 
     monkeypatch.setattr(requests, "get", mock_get)
     monkeypatch.setattr(requests, "head", mock_get)
+    monkeypatch.setattr(requests.Session, "request", mock_get)
     monkeypatch.setattr(v3io.dataplane, "Client", MockV3ioClient)
 
 
@@ -170,6 +171,7 @@ def patch_file_not_found(monkeypatch):
 
     monkeypatch.setattr(requests, "get", mock_get)
     monkeypatch.setattr(requests, "head", mock_get)
+    monkeypatch.setattr(requests.Session, "request", mock_get)
     monkeypatch.setattr(v3io.dataplane, "Client", MockV3ioClient)
 
 
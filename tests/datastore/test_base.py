@@ -102,3 +102,77 @@ def test_kafka_source_without_attributes():
         "user": "myuser",
         "password": "mypassword",
     }
+
+
+def test_http_store_range_requests(httpserver):
+    content = bytes(range(256)) * 4
+    httpserver.expect_request(
+        "/data.bin", headers={"Range": "bytes=10-30"}
+    ).respond_with_data(content[10:31], status=206)
+    httpserver.expect_request("/data.bin").respond_with_data(content)
+
+    data_item = mlrun.datastore.store_manager.object(httpserver.url_for("/data.bin"))
+    assert data_item.get() == content
+    assert data_item.get(offset=10, size=20) == content[10:30]
+    request, _ = httpserver.log[-1]
+    assert request.headers["Range"] == "bytes=10-30"
+
+
+def test_http_store_range_not_supported(httpserver):
+    # servers that ignore the range header return the whole object
+    content = b"0123456789"
+    httpserver.expect_request("/data.txt").respond_with_data(content)
+
+    data_item = mlrun.datastore.store_manager.object(httpserver.url_for("/data.txt"))
+    assert data_item.get(offset=2, size=3) == b"234"
+    assert data_item.get(offset=7) == b"789"
+
+
+def test_http_store_streamed_download(httpserver, tmp_path):
+    content = os.urandom(1024 * 10)
+    httpserver.expect_request("/model.pkl").respond_with_data(content)
+
+    data_item = mlrun.datastore.store_manager.object(httpserver.url_for("/model.pkl"))
+    target_path = tmp_path / "model.pkl"
+    data_item.download(str(target_path))
+    assert target_path.read_bytes() == content
+
+    chunks = list(data_item.iter_content(chunk_size=1024))
+    assert len(chunks) == 10
+    assert b"".join(chunks) == content
+
+
+def test_http_session_is_shared():
+    assert mlrun.datastore.base.get_http_session() is (
+        mlrun.datastore.base.get_http_session()
+    )
+
+
+def test_s3_store_parallel_transfers(monkeypatch, tmp_path):
+    monkeypatch.setattr(mlrun.mlconf.datastore.transfer, "part_size", 16 * 1024 * 1024)
+    monkeypatch.setattr(mlrun.mlconf.datastore.transfer, "max_concurrency", 4)
+    data_item = mlrun.datastore.store_manager.object(
+        "s3://some-bucket/some-dir/model.pkl"
+    )
+    client = data_item.store.s3.meta.client
+    calls = {}
+
+    def _transfer(method):
+        def _mock(*args, **kwargs):
+            calls[method] = (args, kwargs)
+
+        return _mock
+
+    monkeypatch.setattr(client, "upload_file", _transfer("upload"))
+    monkeypatch.setattr(client, "download_file", _transfer("download"))
+
+    src_path = str(tmp_path / "model.pkl")
+    data_item.upload(src_path)
+    data_item.download(str(tmp_path / "downloaded.pkl"))
+
+    for method in ["upload", "download"]:
+        _, kwargs = calls[method]
+        assert kwargs["Bucket"] == "some-bucket"
+        assert kwargs["Key"] == "some-dir/model.pkl"
+        assert kwargs["Config"].multipart_chunksize == 16 * 1024 * 1024
+        assert kwargs["Config"].max_concurrency == 4
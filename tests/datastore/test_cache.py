@@ -0,0 +1,91 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import time
+
+import pandas as pd
+import pytest
+
+import mlrun.datastore
+from mlrun.datastore.cache import LocalFileCache, get_local_cache
+
+
+@pytest.fixture
+def local_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(mlrun.mlconf.datastore.local_cache, "enabled", True)
+    monkeypatch.setattr(
+        mlrun.mlconf.datastore.local_cache, "path", str(tmp_path / "cache")
+    )
+    return get_local_cache()
+
+
+def test_local_cache_disabled():
+    assert not mlrun.mlconf.datastore.local_cache.enabled
+    assert get_local_cache() is None
+
+
+def test_data_item_local_uses_cache(httpserver, local_cache):
+    content = os.urandom(1024)
+    httpserver.expect_request("/model.pkl").respond_with_data(
+        content, headers={"ETag": '"v1"'}
+    )
+    url = httpserver.url_for("/model.pkl")
+
+    first_path = mlrun.datastore.store_manager.object(url).local()
+    second_path = mlrun.datastore.store_manager.object(url).local()
+
+    assert first_path == second_path
+    assert first_path.startswith(local_cache.path) and first_path.endswith(".pkl")
+    with open(first_path, "rb") as fp:
+        assert fp.read() == content
+    assert local_cache.hits == 1 and local_cache.misses == 1
+    downloads = [request for request, _ in httpserver.log if request.method == "GET"]
+    assert len(downloads) == 1
+
+
+def test_data_item_as_df_uses_cache(httpserver, local_cache):
+    df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+    httpserver.expect_request("/data.csv").respond_with_data(
+        df.to_csv(index=False),
+        headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+    url = httpserver.url_for("/data.csv")
+
+    for _ in range(2):
+        result = mlrun.datastore.store_manager.object(url).as_df()
+        pd.testing.assert_frame_equal(result, df)
+    assert local_cache.hits == 1 and local_cache.misses == 1
+
+
+def test_local_cache_lru_eviction(tmp_path):
+    cache = LocalFileCache(str(tmp_path), max_size=250)
+
+    def _download(target_path):
+        with open(target_path, "wb") as fp:
+            fp.write(b"x" * 100)
+
+    first_path = cache.get_local_path("s3://bucket/a", "1", _download)
+    second_path = cache.get_local_path("s3://bucket/b", "1", _download)
+    # make the first object the most recently used one
+    os.utime(second_path, (time.time() - 10, time.time() - 10))
+    assert cache.get_local_path("s3://bucket/a", "1", _download) == first_path
+
+    third_path = cache.get_local_path("s3://bucket/c", "1", _download)
+    assert os.path.exists(first_path) and os.path.exists(third_path)
+    assert not os.path.exists(second_path)
+    assert cache.get_stats() == {"hits": 1, "misses": 3, "evictions": 1, "size": 200}
+
+    # a new version of an object is a new cache entry
+    assert cache.get_local_path("s3://bucket/a", "2", _download) != first_path
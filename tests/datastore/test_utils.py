@@ -0,0 +1,73 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pandas as pd
+import pytest
+
+import mlrun.datastore
+from mlrun.datastore.utils import and_filters, query_to_filters, select_filters
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("a > 1", [[("a", ">", 1)]]),
+        ("1 < a <= 3", [[("a", ">", 1), ("a", "<=", 3)]]),
+        ("5 > a", [[("a", "<", 5)]]),
+        ("(a > 1) & (b == 'x')", [[("a", ">", 1), ("b", "==", "x")]]),
+        (
+            "a > 1 and (b == 'x' or b in ['y', 'z'])",
+            [
+                [("a", ">", 1), ("b", "==", "x")],
+                [("a", ">", 1), ("b", "in", ["y", "z"])],
+            ],
+        ),
+        # parts of a conjunction which cannot be converted are left out
+        ("a > 1 and b.isna()", [[("a", ">", 1)]]),
+        ("a > 1 and b != 2", [[("a", ">", 1)]]),
+        ("a > 1 or b.isna()", None),
+        ("a > @value", None),
+        ("a == b", None),
+        ("`a b` > 1", None),
+    ],
+)
+def test_query_to_filters(query, expected):
+    assert query_to_filters(query) == expected
+
+
+def test_select_filters():
+    filters = [[("a", ">", 1), ("b", "==", "x")], [("a", ">", 1), ("c", "==", 2)]]
+    assert select_filters(filters, {"a": "A", "b": "b"}) == [
+        [("A", ">", 1), ("b", "==", "x")],
+        [("A", ">", 1)],
+    ]
+    assert select_filters(filters, {"b": "b"}) is None
+
+
+def test_and_filters():
+    assert and_filters(None, []) is None
+    assert and_filters([("a", ">", 1)], None) == [[("a", ">", 1)]]
+    assert and_filters([[("a", ">", 1)], [("a", "<", 0)]], [("b", "in", [1, 2])]) == [
+        [("a", ">", 1), ("b", "in", [1, 2])],
+        [("a", "<", 0), ("b", "in", [1, 2])],
+    ]
+
+
+def test_parquet_as_df_with_filters(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    pd.DataFrame({"key": ["a", "b", "c"], "value": [1, 2, 3]}).to_parquet(path)
+    df = mlrun.datastore.store_manager.object(path).as_df(
+        filters=and_filters(query_to_filters("value > 1"), [("key", "in", ["a", "c"])])
+    )
+    assert df.to_dict(orient="list") == {"key": ["c"], "value": [3]}
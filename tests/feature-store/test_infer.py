@@ -14,12 +14,16 @@
 #
 import unittest.mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 import mlrun
 import mlrun.feature_store as fstore
 from mlrun.data_types import InferOptions
+from mlrun.data_types.infer import get_df_stats
+from mlrun.data_types.sketch import DFStatsSketch
+from mlrun.datastore.sources import CSVSource
 from mlrun.datastore.targets import ParquetTarget
 from mlrun.feature_store import Entity
 from mlrun.feature_store.api import _infer_from_static_df
@@ -176,3 +180,113 @@ def test_check_timestamp_key_is_entity():
         fstore.FeatureSet(
             "imp1", entities=[Entity("time_stamp")], timestamp_key="time_stamp"
         )
+
+
+def _assert_stats_equal(stats, expected_stats):
+    assert stats.keys() == expected_stats.keys()
+    for column, column_stats in expected_stats.items():
+        assert stats[column].keys() == column_stats.keys(), column
+        for stat, value in column_stats.items():
+            if isinstance(value, float):
+                assert stats[column][stat] == pytest.approx(value), (column, stat)
+            elif column == "timestamp":
+                # datetime values are sketched as float nanoseconds
+                assert abs(
+                    pd.Timestamp(stats[column][stat]) - pd.Timestamp(value)
+                ) < pd.Timedelta(microseconds=1), (column, stat)
+            else:
+                assert stats[column][stat] == value, (column, stat)
+
+
+def test_stats_sketch_over_chunks():
+    df = pd.read_csv(this_dir + "testdata.csv", parse_dates=["timestamp"])
+
+    sketch = DFStatsSketch(InferOptions.default())
+    for chunk in np.array_split(df, 7):
+        sketch.update(chunk)
+
+    # merging the sketches of partitions is the same as updating a single sketch
+    partitions_sketch = DFStatsSketch(InferOptions.default())
+    for chunks in np.array_split(df, 3):
+        partitions_sketch.merge(DFStatsSketch(InferOptions.default()).update(chunks))
+
+    expected_stats = get_df_stats(df, InferOptions.default())
+    _assert_stats_equal(sketch.get_stats(), expected_stats)
+    _assert_stats_equal(partitions_sketch.get_stats(), expected_stats)
+
+
+def test_stats_sketch_column_type_changes():
+    # the column is all NaN (float) in the first chunk and holds strings in the next ones
+    chunks = [
+        pd.DataFrame({"x": [1.0, 2.0], "category": [np.nan, np.nan]}, index=[0, 1]),
+        pd.DataFrame({"x": [3.0, 4.0], "category": ["a", "b"]}, index=[2, 3]),
+        pd.DataFrame({"x": [5.0, 6.0], "category": ["a", np.nan]}, index=[4, 5]),
+    ]
+    sketch = DFStatsSketch(InferOptions.default())
+    for chunk in chunks:
+        sketch.update(chunk)
+    df = pd.concat(chunks)
+    expected_stats = get_df_stats(df, InferOptions.default())
+    _assert_stats_equal(sketch.get_stats(), expected_stats)
+
+    partitions_sketch = DFStatsSketch(InferOptions.default())
+    for chunk in chunks:
+        partitions_sketch.merge(DFStatsSketch(InferOptions.default()).update(chunk))
+    _assert_stats_equal(partitions_sketch.get_stats(), expected_stats)
+
+    # numbers followed by strings, the column is counted as categorical
+    chunks = [
+        pd.DataFrame({"mixed": [1, 1, 2]}, index=[0, 1, 2]),
+        pd.DataFrame({"mixed": ["a"]}, index=[3]),
+    ]
+    for sketch in [DFStatsSketch(InferOptions.default()) for _ in range(2)]:
+        sketch.update(chunks[0])
+        sketch.update(chunks[1])
+    partitions_sketch = DFStatsSketch(InferOptions.default())
+    for chunk in chunks:
+        partitions_sketch.merge(DFStatsSketch(InferOptions.default()).update(chunk))
+    for stats in [sketch.get_stats(), partitions_sketch.get_stats()]:
+        assert stats["mixed"]["count"] == 4
+        assert stats["mixed"]["unique"] == 3
+        assert stats["mixed"]["freq"] == 2
+
+
+def test_stats_sketch_bounded_memory():
+    rows = 200000
+    df = pd.DataFrame(
+        {
+            "x": np.random.normal(size=rows),
+            "category": np.random.randint(0, 20000, size=rows).astype(str),
+        }
+    )
+
+    sketch = DFStatsSketch(InferOptions.default(), max_centroids=200, max_values=1000)
+    for chunk in np.array_split(df, 20):
+        sketch.update(chunk)
+    stats = sketch.get_stats()
+
+    assert len(sketch.columns["x"].quantiles.values) <= 200
+    assert len(sketch.columns["category"].value_counts) <= 1000
+    for quantile in ["25%", "50%", "75%"]:
+        assert stats["x"][quantile] == pytest.approx(
+            df["x"].quantile(float(quantile[:-1]) / 100), abs=0.02
+        )
+    assert sum(stats["x"]["hist"][0]) == rows
+    assert stats["x"]["std"] == pytest.approx(df["x"].std())
+    assert stats["category"]["count"] == rows
+    assert stats["category"]["unique"] == pytest.approx(
+        df["category"].nunique(), rel=0.05
+    )
+
+
+def test_infer_stats_from_chunked_source():
+    source = CSVSource(
+        "mycsv", path=this_dir + "testdata.csv", attributes={"chunksize": 50}
+    )
+    featureset = fstore.FeatureSet("testdata")
+
+    df = _infer_from_static_df(source, featureset, options=InferOptions.default())
+
+    # the schema and preview are inferred from the first chunk, the stats from all the chunks
+    assert len(df) == 50
+    assert featureset.status.stats["bad"]["count"] == 190
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import glob
+import os
 import unittest.mock
 
 import pandas as pd
@@ -19,7 +21,8 @@ import pytest
 
 import mlrun
 import mlrun.feature_store as fstore
-from mlrun.datastore.targets import DFTarget
+from mlrun.datastore.sources import CSVSource
+from mlrun.datastore.targets import DFTarget, ParquetTarget
 
 
 def test_columns_with_illegal_characters(rundb_mock):
@@ -121,3 +124,39 @@ def test_return_df(rundb_mock):
     result_df = fstore.ingest(fset, df, targets=[DFTarget()])
 
     assert isinstance(result_df, pd.DataFrame)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_ingest_chunks_pipelined(rundb_mock, monkeypatch, tmp_path, max_workers):
+    monkeypatch.setattr(
+        mlrun.mlconf.feature_store.ingestion, "max_workers", max_workers
+    )
+    monkeypatch.setattr(mlrun.mlconf.feature_store.ingestion, "max_pending_chunks", 2)
+    df = pd.DataFrame({"id": range(100), "value": [i * 2 for i in range(100)]})
+    csv_path = str(tmp_path / "source.csv")
+    df.to_csv(csv_path, index=False)
+
+    fset = fstore.FeatureSet("myset", entities=[fstore.Entity("id")], engine="pandas")
+    fset._run_db = rundb_mock
+    fset.reload = unittest.mock.Mock()
+    fset.save = unittest.mock.Mock()
+    fset.purge_targets = unittest.mock.Mock()
+
+    target_path = str(tmp_path / "target")
+    source = CSVSource("mycsv", path=csv_path, attributes={"chunksize": 10})
+    result_df = fstore.ingest(
+        fset, source, targets=[ParquetTarget(path=target_path, partitioned=False)]
+    )
+
+    # the first chunk is returned and the chunk ids follow the order of the chunks in the source
+    assert list(result_df.index) == list(range(10))
+    # each chunk is written to a directory named by its chunk id
+    chunk_files = sorted(
+        glob.glob(os.path.join(target_path, "**", "*.parquet"), recursive=True)
+    )
+    assert [os.path.basename(os.path.dirname(path)) for path in chunk_files] == [
+        f"{chunk_id:0>4}" for chunk_id in range(1, 11)
+    ]
+    for chunk_id, chunk_file in enumerate(chunk_files):
+        chunk_df = pd.read_parquet(chunk_file)
+        assert list(chunk_df.index) == list(range(chunk_id * 10, (chunk_id + 1) * 10))
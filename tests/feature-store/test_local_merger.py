@@ -0,0 +1,131 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest.mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlrun.feature_store as fstore
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.feature_store.retrieval import LocalFeatureMerger
+from mlrun.model import DataTarget
+
+
+def _generate_featureset_df(name, ids, times):
+    return pd.DataFrame(
+        {
+            "id": ids,
+            "time": times,
+            f"{name}_value": np.arange(len(ids)),
+        }
+    )
+
+
+def _merge(entity_df, featuresets, featureset_dfs, **engine_args):
+    merger = LocalFeatureMerger(fstore.FeatureVector("vec", []), **engine_args)
+    merger.merge(
+        entity_df=entity_df.copy(),
+        entity_timestamp_column="time",
+        featuresets=featuresets,
+        featureset_dfs=[df.copy() for df in featureset_dfs],
+        keys=[[["id"], ["id"]] for _ in featuresets],
+        all_columns=[[] for _ in featuresets],
+    )
+    return merger.get_df()
+
+
+@pytest.mark.parametrize("entity_chunk_size", [1, 3, 7, 100])
+def test_asof_merge_in_chunks(entity_chunk_size):
+    rng = np.random.default_rng(42)
+    base_time = pd.Timestamp("2022-01-01")
+    featuresets = []
+    featureset_dfs = []
+    for name in ["fs1", "fs2", "fs3"]:
+        featuresets.append(
+            fstore.FeatureSet(
+                name, entities=[fstore.Entity("id")], timestamp_key="time"
+            )
+        )
+        times = base_time + pd.to_timedelta(rng.integers(0, 100, 30), unit="m")
+        featureset_dfs.append(
+            _generate_featureset_df(name, rng.integers(0, 4, 30), times)
+        )
+
+    entity_df = pd.DataFrame(
+        {
+            "id": rng.integers(0, 4, 20),
+            # unsorted string timestamps, the merger is expected to convert and sort them
+            "time": [
+                str(base_time + pd.Timedelta(minutes=int(minutes)))
+                for minutes in rng.integers(0, 120, 20)
+            ],
+        }
+    )
+
+    expected = _merge(entity_df, featuresets, featureset_dfs)
+    result = _merge(
+        entity_df, featuresets, featureset_dfs, entity_chunk_size=entity_chunk_size
+    )
+
+    assert len(result) == len(entity_df)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_pushdown_filters(tmp_path):
+    featureset = fstore.FeatureSet(
+        "fs1", entities=[fstore.Entity("id")], timestamp_key="time"
+    )
+    path = str(tmp_path / "fs1.parquet")
+    target = ParquetTarget(path=path)
+    target.set_resource(featureset)
+    target.write_dataframe(
+        pd.DataFrame(
+            {
+                "id": [1, 2, 3, 1, 2, 3],
+                "time": pd.to_datetime(["2022-01-01"] * 3 + ["2022-01-02"] * 3),
+                "x": [1, 2, 3, 4, 5, 6],
+            }
+        )
+    )
+    featureset.status.update_target(DataTarget("parquet", "parquet", path))
+    entity_df = pd.DataFrame(
+        {"id": [1, 2], "time": pd.to_datetime(["2022-01-03", "2022-01-01 10:00"])}
+    )
+
+    results = []
+    for pushdown in [True, False]:
+        merger = LocalFeatureMerger(
+            fstore.FeatureVector("vec", ["fs1.*"]), pushdown=pushdown
+        )
+        with unittest.mock.patch.object(
+            fstore.FeatureSet, "to_dataframe", wraps=featureset.to_dataframe
+        ) as to_dataframe:
+            response = merger._generate_vector(
+                entity_df.copy(),
+                "time",
+                {"fs1": featureset},
+                {"fs1": [("x", None)]},
+                query="x > 1 and id < 3",
+            )
+        # the query on x is applied only after the as-of join, so only the entity key is pushed down
+        expected_filters = (
+            [[("id", "in", [1, 2]), ("id", "<", 3)]] if pushdown else None
+        )
+        assert to_dataframe.call_args.kwargs.get("filters") == expected_filters
+        results.append(response.to_dataframe())
+
+    pd.testing.assert_frame_equal(results[0], results[1])
+    assert results[0]["x"].tolist() == [2, 4]
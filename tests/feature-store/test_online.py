@@ -0,0 +1,175 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+from types import SimpleNamespace
+
+import pytest
+import storey
+
+import mlrun
+from mlrun.feature_store import FixedWindowType, OnlineFeatureCache
+from mlrun.feature_store.retrieval.online import (
+    BatchedQueryByKey,
+    _build_feature_vector_graph,
+    batched_queries_supported,
+)
+
+
+class _TablesContext:
+    def __init__(self):
+        self.tables = {
+            "customers": storey.Table("customers", storey.NoopDriver()),
+            "segments": storey.Table("segments", storey.NoopDriver()),
+        }
+        for i in range(5):
+            self.tables["customers"][str(i)] = {"age": 20 + i, "segment": f"s{i % 2}"}
+        self.tables["segments"]["s0"] = {"score": 0.5}
+        self.tables["segments"]["s1"] = {"score": 0.7}
+
+    def get_table(self, name):
+        return self.tables[name]
+
+
+# the segments key comes from the customers features, so it is queried after it
+queries = [
+    dict(
+        name="query-customers",
+        features=["age", "segment"],
+        table="customers",
+        key_field=["id"],
+    ),
+    dict(
+        name="query-segments",
+        features=["score"],
+        table="segments",
+        key_field=["segment"],
+        aliases={"score": "segment_score"},
+    ),
+]
+
+
+def _run_flow(steps, entity_ids):
+    controller = storey.build_flow(
+        [storey.SyncEmitSource()] + steps + [storey.Complete()]
+    ).run()
+    try:
+        results = [
+            controller.emit({"id": entity_id}, return_awaitable_result=True)
+            for entity_id in entity_ids
+        ]
+        return [result.await_result() for result in results]
+    finally:
+        controller.terminate()
+        controller.await_termination()
+
+
+@pytest.mark.parametrize("max_batch_size", [1, 3, 100])
+def test_batched_query_by_key(max_batch_size):
+    entity_ids = ["0", "1", "2", "0", "3", "missing"]
+    context = _TablesContext()
+    expected = _run_flow(
+        [storey.QueryByKey(context=context, **query) for query in queries],
+        entity_ids,
+    )
+
+    context = _TablesContext()
+    results = _run_flow(
+        [
+            BatchedQueryByKey(
+                queries=queries,
+                max_batch_size=max_batch_size,
+                flush_after_seconds=0.01,
+                context=context,
+            )
+        ],
+        entity_ids,
+    )
+
+    assert results == expected
+    assert results[0] == {"id": "0", "age": 20, "segment": "s0", "segment_score": 0.5}
+    assert results[-1] is None
+
+
+def test_batched_query_by_key_with_cache():
+    entity_ids = ["0", "1", "0", "missing"]
+    cache = OnlineFeatureCache(max_entries=100, ttl=60)
+    context = _TablesContext()
+    steps = [
+        BatchedQueryByKey(
+            queries=queries,
+            feature_sets=["customers", "segments"],
+            cache=cache,
+            context=context,
+        )
+    ]
+    expected = _run_flow(steps, entity_ids)
+    assert expected[0] == {"id": "0", "age": 20, "segment": "s0", "segment_score": 0.5}
+    assert expected[-1] is None
+    assert cache.stats()["size"] == 5
+
+    # cached keys are served without reading the tables
+    context.tables["customers"]["0"] = {"age": 99, "segment": "s1"}
+    assert _run_flow(steps, entity_ids) == expected
+    assert cache.stats()["hits"] > 0
+
+    cache.invalidate("customers", key="0")
+    results = _run_flow(steps, ["0"])
+    assert results == [{"id": "0", "age": 99, "segment": "s1", "segment_score": 0.7}]
+
+
+def test_batched_query_by_key_unsupported_storey(monkeypatch):
+    # without the storey internals the batched queries fall back to a storey.QueryByKey step per feature set
+    monkeypatch.delattr(storey.Table, "_lazy_load_key_with_aggregates")
+    assert not batched_queries_supported()
+    with pytest.raises(mlrun.errors.MLRunRuntimeError):
+        BatchedQueryByKey(queries=queries, context=_TablesContext())
+
+    vector = SimpleNamespace(
+        spec=SimpleNamespace(graph=mlrun.serving.states.RootFlowStep())
+    )
+    feature_sets = {
+        name: SimpleNamespace(uri=name, spec=SimpleNamespace(entities={"id": None}))
+        for name in ["customers", "segments"]
+    }
+    graph = _build_feature_vector_graph(
+        vector,
+        {"customers": [("age", None)], "segments": [("score", None)]},
+        feature_sets,
+        FixedWindowType.LastClosedWindow,
+        max_batch_size=10,
+    )
+    assert [step.class_name for step in graph.steps.values()] == [
+        "storey.QueryByKey",
+        "storey.QueryByKey",
+    ]
+
+
+def test_online_feature_cache():
+    cache = OnlineFeatureCache(max_entries=2, ttl=60, feature_set_ttls={"fast": 0.05})
+    cache.set("fs", ["a"], 1)
+    cache.set("fs", "b", 2)
+    assert cache.get("fs", "a") == 1
+    assert cache.get("fs", ["b"]) == 2
+    cache.set("fs", "c", 3)
+    assert cache.get("fs", "a") is None
+    assert cache.stats() == {"size": 2, "hits": 2, "misses": 1, "evictions": 1}
+
+    cache.set("fast", ["x", 1], 4)
+    assert cache.get("fast", ["x", "1"]) == 4
+    time.sleep(0.1)
+    assert cache.get("fast", ["x", 1]) is None
+
+    cache.invalidate("fs")
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,174 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlrun.data_types.infer
+from mlrun.model_monitoring.model_monitoring_batch import (
+    HellingerDistance,
+    KullbackLeiblerDivergence,
+    TotalVarianceDistance,
+    VirtualDrift,
+    calculate_inputs_incremental_statistics,
+    calculate_inputs_statistics,
+    merge_inputs_incremental_statistics,
+)
+from mlrun.utils import logger
+
+
+def _generate_histograms_statistics(n_features: int, n_bins: int = 20) -> dict:
+    statistics = {}
+    for index in range(n_features):
+        counts = np.random.randint(0, 100, size=n_bins)
+        # zero bins are expected in real histograms and are handled specially by the KL divergence
+        counts[np.random.randint(0, n_bins)] = 0
+        statistics[f"feature_{index}"] = {
+            "count": int(counts.sum()),
+            "hist": [counts.tolist(), np.linspace(0, 1, n_bins + 1).tolist()],
+        }
+    return statistics
+
+
+def test_compute_metrics_over_df_matches_per_feature_metrics():
+    n_features = 50
+    virtual_drift = VirtualDrift(inf_capping=10)
+    base_histogram = virtual_drift.dict_to_histogram(
+        _generate_histograms_statistics(n_features)
+    )
+    latest_histogram = virtual_drift.dict_to_histogram(
+        _generate_histograms_statistics(n_features)
+    )
+
+    drift_measures = virtual_drift.compute_metrics_over_df(
+        base_histogram, latest_histogram
+    )
+
+    assert set(drift_measures.keys()) == {
+        TotalVarianceDistance.NAME,
+        HellingerDistance.NAME,
+        KullbackLeiblerDivergence.NAME,
+    }
+    for metric_name, metric in virtual_drift.metrics.items():
+        assert len(drift_measures[metric_name]) == n_features
+        for feature in base_histogram:
+            expected = metric(
+                base_histogram.loc[:, feature].to_numpy(),
+                latest_histogram.loc[:, feature].to_numpy(),
+            ).compute()
+            assert np.isclose(drift_measures[metric_name][feature], expected)
+
+
+def test_calculate_inputs_statistics():
+    sample_set_statistics = {
+        "feature_0": {"hist": [[1, 1], [0.0, 5.0, 10.0]]},
+    }
+    inputs = pd.DataFrame({"feature_0": [1.0, 2.0, 7.0], "feature_1": [1.0, 2.0, 3.0]})
+
+    inputs_statistics = calculate_inputs_statistics(sample_set_statistics, inputs)
+
+    # sample-set features use the sample-set bins, other features get their own bins
+    assert inputs_statistics["feature_0"]["hist"] == [[2, 1], [0.0, 5.0, 10.0]]
+    assert inputs_statistics["feature_0"]["mean"] == pytest.approx(10 / 3)
+    assert (
+        len(inputs_statistics["feature_1"]["hist"][0])
+        == mlrun.data_types.infer.default_num_bins
+    )
+
+
+def test_merge_inputs_incremental_statistics():
+    sample_set_statistics = {
+        "feature_0": {"hist": [[1, 1], [0.0, 5.0, 10.0]]},
+    }
+    inputs = pd.DataFrame(
+        {
+            "feature_0": np.random.uniform(0, 10, size=100),
+            "feature_1": np.random.normal(size=100),
+        }
+    )
+
+    # statistics of consecutive batches are merged into the statistics of all the inputs
+    batches_statistics = []
+    bins = {}
+    for batch in np.array_split(inputs, 3):
+        batch_statistics = calculate_inputs_incremental_statistics(
+            sample_set_statistics, batch, bins=bins
+        )
+        bins = {
+            feature: statistics["hist"][1]
+            for feature, statistics in batch_statistics.items()
+        }
+        batches_statistics.append(batch_statistics)
+    merged_statistics = merge_inputs_incremental_statistics(batches_statistics)
+
+    expected_statistics = calculate_inputs_statistics(sample_set_statistics, inputs)
+    assert (
+        merged_statistics["feature_0"]["hist"]
+        == expected_statistics["feature_0"]["hist"]
+    )
+    for feature in inputs.columns:
+        for statistic in ["count", "mean", "std", "min", "max"]:
+            assert merged_statistics[feature][statistic] == pytest.approx(
+                expected_statistics[feature][statistic]
+            )
+
+    # the bins of features which are not in the sample set are kept from the first batch
+    first_batch_bins = batches_statistics[0]["feature_1"]["hist"][1]
+    assert merged_statistics["feature_1"]["hist"][1] == first_batch_bins
+    assert sum(merged_statistics["feature_1"]["hist"][0]) == np.sum(
+        (inputs["feature_1"] >= first_batch_bins[0])
+        & (inputs["feature_1"] <= first_batch_bins[-1])
+    )
+
+
+def test_compute_drift_from_histograms_wide_models():
+    # benchmark for wide models - 1,000 features over 100 endpoints, the hourly monitoring job has to finish all the
+    # endpoints well within its interval
+    n_features = 1000
+    n_endpoints = 100
+    virtual_drift = VirtualDrift(inf_capping=10)
+    feature_stats = _generate_histograms_statistics(n_features)
+    endpoints_current_stats = [
+        _generate_histograms_statistics(n_features) for _ in range(n_endpoints)
+    ]
+
+    start = time.monotonic()
+    for current_stats in endpoints_current_stats:
+        drift_result = virtual_drift.compute_drift_from_histograms(
+            feature_stats=feature_stats, current_stats=current_stats
+        )
+    duration = time.monotonic() - start
+    logger.info(
+        "Computed drift",
+        n_features=n_features,
+        n_endpoints=n_endpoints,
+        duration=duration,
+    )
+
+    assert (
+        len([value for value in drift_result.values() if isinstance(value, dict)])
+        == n_features
+    )
+    assert drift_result[f"{TotalVarianceDistance.NAME}_mean"] == pytest.approx(
+        np.mean(
+            [
+                drift_result[f"feature_{index}"][TotalVarianceDistance.NAME]
+                for index in range(n_features)
+            ]
+        )
+    )
+    assert duration < 60
@@ -14,6 +14,8 @@
 #
 
 import pathlib
+import random
+import unittest.mock
 
 import pandas as pd
 
@@ -139,6 +141,54 @@ def test_hyper_parallel_with_stop():
     assert run.output("best_iteration") == 3, "wrong best iteration"
 
 
+def test_parallel_runs_results_collector(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf, "store_runs_batch_size", 4)
+    db = unittest.mock.MagicMock()
+    collector = mlrun.runtimes.local._RunResultsCollector(db, "some-project")
+    for iteration in range(1, 11):
+        run = mlrun.new_task(name="collected").to_dict()
+        run["metadata"]["iteration"] = iteration
+        collector.add(run, logs=f"output {iteration}")
+    collector.close()
+
+    # the run states are written in batches, the logs are stored per run
+    stored_runs = [
+        run["metadata"]["iteration"]
+        for call in db.store_runs.call_args_list
+        for run in call.args[0]
+    ]
+    assert stored_runs == list(range(1, 11))
+    assert all(len(call.args[0]) <= 4 for call in db.store_runs.call_args_list)
+    assert db.store_log.call_count == 10
+
+
+def test_parallel_runs_results_collector_failed_batch(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf, "store_runs_batch_size", 4)
+    db = unittest.mock.MagicMock()
+    db.store_runs.side_effect = RuntimeError("db is down")
+
+    def store_run(struct, uid, project="", iter=0):
+        if iter == 3:
+            raise RuntimeError("conflict")
+
+    db.store_run.side_effect = store_run
+    collector = mlrun.runtimes.local._RunResultsCollector(db, "some-project")
+    for iteration in range(1, 5):
+        run = mlrun.new_task(name="collected").to_dict()
+        run["metadata"]["iteration"] = iteration
+        collector.add(run)
+    collector.close()
+
+    # the runs of the failed batch are written one by one, only the ones which failed again are reported
+    assert [call.kwargs["iter"] for call in db.store_run.call_args_list] == [
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert collector.failed_runs == {3: "conflict"}
+
+
 def test_hyper_random():
     grid_params = {"p2": [2, 1, 3], "p3": [10, 20, 30]}
     run_spec = tag_test(base_spec, "test_hyper_random")
@@ -198,3 +248,120 @@ def test_hyper_get_artifact():
     )
     assert run.artifact("df1").meta, "df1 (with db_key) not returned"
     assert run.artifact("df2").meta, "df2 (without db_key) not returned"
+
+
+def budget_func(context, p2, epochs):
+    context.log_result("r1", p2 * epochs)
+
+
+def _iterations_column(run, column):
+    header = run.status.iterations[0]
+    return [line[header.index(column)] for line in run.status.iterations[1:]]
+
+
+def test_hyper_successive_halving():
+    run_spec = tag_test(base_spec, "test_hyper_successive_halving")
+    run_spec.with_hyper_params(
+        {"p2": list(range(1, 10))},
+        selector="max.r1",
+        strategy="successive_halving",
+        max_iterations=9,
+        resource="epochs",
+        max_resource=9,
+    )
+    run = new_function().run(run_spec, handler=budget_func)
+
+    verify_state(run)
+    # 9 combinations with 1 epoch, the best 3 with 3 epochs and the best one with 9 epochs
+    epochs = _iterations_column(run, "param.epochs")
+    assert epochs == [1] * 9 + [3] * 3 + [9]
+    first_rung = _iterations_column(run, "param.p2")[:9]
+    assert _iterations_column(run, "param.p2")[-1] == max(first_rung)
+    assert run.output("best_iteration") == 13
+
+
+def test_hyperband_generator():
+    options = mlrun.model.HyperParamOptions(
+        strategy="hyperband",
+        selector="min.loss",
+        resource="epochs",
+        max_resource=9,
+    )
+    generator = mlrun.runtimes.generators.HyperbandGenerator(
+        {"lr": [0.1, 0.01, 0.001]}, options
+    )
+    pending = []
+    tasks = []
+    for task in generator.generate(base_spec):
+        if task is None:
+            # the generator waits for the results of the rung
+            for pending_task in pending:
+                result = pending_task.to_dict()
+                result["status"] = {
+                    "results": {"loss": pending_task.spec.parameters["lr"]}
+                }
+                generator.report_result(result)
+            pending = []
+            continue
+        pending.append(task)
+        tasks.append(task)
+
+    # brackets of 9 x 1, 3 x 3, 1 x 9 epochs, 5 x 3, 1 x 9 epochs and 3 x 9 epochs
+    epochs = [task.spec.parameters["epochs"] for task in tasks]
+    assert epochs == [1] * 9 + [3] * 3 + [9] + [3] * 5 + [9] + [9] * 3
+    assert [task.metadata.iteration for task in tasks] == list(range(1, 23))
+    # the promoted combinations are the ones with the lowest loss
+    assert tasks[12].spec.parameters["lr"] == min(
+        task.spec.parameters["lr"] for task in tasks[:9]
+    )
+
+
+def test_bayesian_generator():
+    random.seed(7)
+    options = mlrun.model.HyperParamOptions(
+        strategy="bayesian", selector="max.r1", max_iterations=30
+    )
+    generator = mlrun.runtimes.generators.BayesianGenerator(
+        {"p2": [1, 2, 3, 4], "p3": [0, 10]}, options
+    )
+    tasks = []
+    for task in generator.generate(base_spec):
+        assert (
+            task is not None
+        ), "sequential runs results are reported before the next task"
+        params = task.spec.parameters
+        result = task.to_dict()
+        result["status"] = {"results": {"r1": params["p2"] + params["p3"]}}
+        generator.report_result(result)
+        tasks.append(task)
+
+    assert len(tasks) == 30
+    # after the initial random combinations the proposals concentrate on the best values
+    proposals = [task.spec.parameters for task in tasks[5:]]
+    assert sum(params["p3"] == 10 for params in proposals) >= 20
+    assert sum(params["p2"] == 4 for params in proposals) >= 15
+
+
+def pruned_func(context, lr):
+    for epoch in range(1, 10):
+        context.log_result("accuracy", lr * epoch)
+        context.log_result("epochs", epoch)
+        if context.should_prune(epoch):
+            break
+
+
+def test_hyper_early_termination():
+    run_spec = tag_test(base_spec, "test_hyper_early_termination")
+    run_spec.with_hyper_params(
+        {"lr": [0.2, 0.1, 0.3, 0.05]},
+        selector="max.accuracy",
+        strategy="list",
+        early_termination=True,
+    )
+    run = new_function().run(run_spec, handler=pruned_func)
+
+    verify_state(run)
+    # the first runs have nothing to compare with, 0.3 is the best at every step and 0.05 is stopped after the
+    # first epoch
+    assert _iterations_column(run, "output.epochs") == [9, 9, 9, 1]
+    assert run.output("best_iteration") == 3
@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import pathlib
+import time
+import unittest.mock
 from unittest.mock import MagicMock, Mock
 
 import pytest
 
 import mlrun
 import mlrun.errors
+import mlrun.utils.run_metrics
 from mlrun import get_run_db, new_function, new_task
 from tests.conftest import (
     examples_path,
@@ -237,6 +240,156 @@ def test_local_context():
     assert db_artifact["spec"]["format"] == "z", "artifact attribute not updated in db"
 
 
+def test_context_background_commits(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.run_state_commits, "background", True)
+    # only explicit flushes (the run completion) write the state in this test
+    monkeypatch.setattr(mlrun.mlconf.run_state_commits, "flush_interval", 3600)
+    db = MagicMock()
+    context = mlrun.MLClientCtx.from_dict(
+        {"metadata": {"name": "xx", "uid": "123", "project": "xtst"}},
+        rundb=db,
+        store_run=False,
+    )
+    context.set_state("running", commit=False)
+
+    for epoch in range(10):
+        context.log_result("accuracy", epoch, commit=True)
+    for param in range(3):
+        with context.get_child_context(param=param) as child:
+            child.log_result("loss", param)
+    assert db.update_run.call_count == 0
+
+    # the coalesced state of the run and each of its children is written once on completion
+    context.commit(completed=True)
+    assert db.update_run.call_count == 4
+    updates, uid, project = db.update_run.call_args_list[0].args
+    assert uid == "123" and project == "xtst"
+    assert updates["status.results"]["accuracy"] == 9
+    assert len(updates["status.iterations"]) == 4
+    assert sorted(call.kwargs["iter"] for call in db.update_run.call_args_list) == [
+        0,
+        1,
+        2,
+        3,
+    ]
+
+    # commits after the completion are written immediately, with the changed fields only
+    context.log_result("best_loss", 0, commit=True)
+    assert db.update_run.call_count == 5
+    updates, _, _ = db.update_run.call_args.args
+    assert list(updates.keys()) == ["status.results"]
+
+
+def test_context_background_commits_ordering(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.run_state_commits, "background", True)
+    monkeypatch.setattr(mlrun.mlconf.run_state_commits, "flush_interval", 0.05)
+    db = MagicMock()
+    context = mlrun.MLClientCtx.from_dict(
+        {"metadata": {"name": "xx", "uid": "123", "project": "xtst"}},
+        rundb=db,
+        store_run=False,
+    )
+    context.set_state("running", commit=False)
+    context.log_result("accuracy", 1, commit=True)
+    state_writer = context._state_writer
+
+    # the pending (older) commit is written before the state, so it does not overwrite it
+    context.set_state(error="some error")
+    assert db.update_run.call_count == 2
+    assert db.update_run.call_args_list[0].args[0]["status.state"] == "running"
+    assert db.update_run.call_args.args[0]["status.state"] == "error"
+
+    # the writer thread stops once there is nothing to write, and is started again by the next commit
+    time.sleep(0.2)
+    assert state_writer._thread is None
+    context.log_result("accuracy", 2, commit=True)
+    assert state_writer._thread is not None
+    time.sleep(0.2)
+    assert state_writer._thread is None
+    assert db.update_run.call_args.args[0]["status.results"]["accuracy"] == 2
+
+    # the background writes of a context which is not completed (e.g. on error) are stopped on exit
+    with pytest.raises(ValueError):
+        with context:
+            context.log_result("accuracy", 3, commit=True)
+            raise ValueError("some error")
+    assert state_writer._closed.is_set()
+    assert db.update_run.call_args.args[0]["status.results"]["accuracy"] == 3
+
+
+def test_context_log_metrics(monkeypatch, tmp_path):
+    monkeypatch.setattr(mlrun.mlconf.run_metrics, "flush_size", 1000)
+    db = MagicMock()
+    context = mlrun.MLClientCtx.from_dict(
+        {
+            "metadata": {"name": "xx", "uid": "123", "project": "xtst"},
+            "spec": {"output_path": str(tmp_path)},
+        },
+        rundb=db,
+        store_run=False,
+    )
+
+    for step in range(2500):
+        context.log_metrics({"loss": 1 / (step + 1), "accuracy": step / 2500})
+    context.log_metric("lr", 0.1, step=10)
+    context.commit()
+
+    # the points are written in batches as chunk files, not in the run object
+    metrics_path = tmp_path / "metrics" / "123" / "0"
+    assert len(list(metrics_path.iterdir())) == 6
+    assert "lr" not in str(db.update_run.call_args)
+
+    db.read_run.return_value = context.to_dict()
+    metrics = mlrun.db.base.RunDBInterface.read_run_metrics(
+        db, "123", "xtst", max_points=0
+    )
+    assert sorted(metrics.keys()) == ["accuracy", "loss", "lr"]
+    assert metrics["loss"]["step"] == list(range(2500))
+    assert metrics["loss"]["value"][-1] == 1 / 2500
+    assert metrics["lr"] == {
+        "step": [10],
+        "timestamp": metrics["lr"]["timestamp"],
+        "value": [0.1],
+    }
+
+    # range queries of long series are downsampled to max_points (mean, min and max of each steps range)
+    metrics = mlrun.db.base.RunDBInterface.read_run_metrics(
+        db, "123", "xtst", keys=["accuracy"], start_step=1000, max_points=100
+    )
+    assert list(metrics.keys()) == ["accuracy"]
+    accuracy = metrics["accuracy"]
+    assert len(accuracy["step"]) == 100
+    assert accuracy["step"][0] == 1000
+    assert accuracy["min"][0] == 1000 / 2500
+    assert accuracy["max"][-1] == 2499 / 2500
+    assert accuracy["value"][0] == pytest.approx(sum(range(1000, 1015)) / 15 / 2500)
+
+
+def test_read_run_metrics_skips_chunks(tmp_path):
+    path = mlrun.utils.run_metrics.get_run_metrics_path(str(tmp_path), "123")
+    writer = mlrun.utils.run_metrics.RunMetricsWriter(path, flush_size=100)
+    for step in range(1000):
+        writer.log("loss", 1 / (step + 1))
+        writer.log("accuracy", step / 1000)
+    writer.flush()
+
+    # only the chunks which overlap the steps range are downloaded (the chunks are of 50 steps, 900-949 and 950-999)
+    with unittest.mock.patch.object(
+        mlrun.store_manager, "object", wraps=mlrun.store_manager.object
+    ) as object_mock:
+        metrics = mlrun.utils.run_metrics.read_run_metrics(
+            path, keys=["loss"], start_step=920, end_step=960, max_points=0
+        )
+    read_chunks = [
+        call
+        for call in object_mock.call_args_list
+        if call.kwargs["url"].endswith(".parquet")
+    ]
+    assert len(read_chunks) == 2
+    assert list(metrics.keys()) == ["loss"]
+    assert metrics["loss"]["step"] == list(range(920, 961))
+
+
 def test_run_class_code():
     cases = [
         ({"y": 3}, {"rx": 0, "ry": 3, "ra1": 1}),
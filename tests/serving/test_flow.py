@@ -13,6 +13,8 @@
 # limitations under the License.
 #
 import pathlib
+import time
+import unittest.mock
 
 import pytest
 
@@ -114,6 +116,92 @@ def test_handler(engine):
     assert resp == "6", f"got unexpected result {resp}"
 
 
+def passthrough(x):
+    return x
+
+
+def slow_double(x):
+    time.sleep(0.5)
+    return {"double": x["x"] * 2}
+
+
+def slow_triple(x):
+    time.sleep(0.5)
+    return {"triple": x["x"] * 3}
+
+
+def merge_bodies(bodies):
+    merged = {}
+    for body in bodies:
+        merged.update(body)
+    return merged
+
+
+@pytest.mark.parametrize("merge_step", [True, False])
+def test_sync_flow_branches(merge_step):
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="passthrough")
+    graph.add_step(name="double", handler="slow_double", after="start")
+    graph.add_step(name="triple", handler="slow_triple", after="start")
+    if merge_step:
+        graph.add_step(
+            name="join",
+            class_name="mlrun.serving.merger.Merge",
+            after=["double", "triple"],
+        )
+        graph.add_step(name="merge", handler="merge_bodies", after="join")
+    else:
+        # a step with multiple upstream steps gets the list of their results
+        graph.add_step(name="merge", handler="merge_bodies", after=["double", "triple"])
+
+    server = fn.to_mock_server()
+    start = time.monotonic()
+    resp = server.test(body={"x": 4})
+    # the branches run concurrently
+    assert time.monotonic() - start < 0.9
+    assert resp == {"double": 8, "triple": 12}
+
+
+def test_sync_flow_branches_step_timings():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="passthrough")
+    graph.add_step(name="double", handler="slow_double", after="start")
+    graph.add_step(name="triple", handler="slow_triple", after="start").respond()
+
+    server = fn.to_mock_server()
+    event = mlrun.serving.server.MockEvent(body={"x": 2})
+    resp = server.graph.run(event)
+    assert resp.body == {"triple": 6}
+    assert set(resp.step_timings.keys()) == {"start", "double", "triple"}
+    assert resp.step_timings["double"] >= 0.5
+
+
+def raise_error(x):
+    raise ValueError("some error")
+
+
+def test_sync_flow_branches_error():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="start", handler="passthrough")
+    graph.add_step(name="double", handler="slow_double", after="start")
+    graph.add_step(name="fail", handler="raise_error", after="start")
+
+    server = fn.to_mock_server()
+    server.context.push_error = unittest.mock.Mock()
+    with pytest.raises(RuntimeError, match="some error"):
+        server.test(body={"x": 2})
+    # the error is attributed to the failing step (not to the flow)
+    sources = {
+        call.kwargs["source"]
+        for call in server.context.push_error.call_args_list
+        if "failed_step" in call.kwargs
+    }
+    assert sources == {"fail"}
+
+
 def test_handler_with_context():
     fn = mlrun.new_function("tests", kind="serving")
     graph = fn.set_topology("flow", engine="sync")
@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import concurrent.futures
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
 import pytest
 
 import mlrun
@@ -54,3 +59,73 @@ def test_parallel(executor):
 
     resp = server.test("", {"x": 9})
     assert resp == {"x": 9, "a": 1, "b": 2, "c": 7, "mul": 18}
+
+
+def array_stats(event):
+    """example handler over an array input, returns an array output"""
+    return {
+        "sum": float(event["inputs"].sum()),
+        "writeable": event["inputs"].flags.writeable,
+        "doubled": event["inputs"] * 2,
+    }
+
+
+@pytest.mark.parametrize("shared_memory_threshold", [None, -1])
+def test_parallel_process_shared_memory(shared_memory_threshold):
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.ParallelRun(
+            executor_type="process", shared_memory_threshold=shared_memory_threshold
+        ),
+    )
+    graph.add_route("c1", handler="array_stats")
+    server = fn.to_mock_server()
+
+    inputs = np.arange(100000, dtype=np.float64).reshape(1000, 100)
+    segments_before = _list_shared_memory_segments()
+    resp = server.test(body={"inputs": inputs})
+
+    assert resp["sum"] == inputs.sum()
+    # arrays passed through shared memory are read-only in the routes
+    assert resp["writeable"] == (shared_memory_threshold == -1)
+    assert isinstance(resp["doubled"], np.ndarray)
+    np.testing.assert_array_equal(resp["doubled"], inputs * 2)
+    # the shared memory segments are released at the end of the request
+    assert _list_shared_memory_segments() == segments_before
+
+
+def test_parallel_process_without_shared_memory(monkeypatch):
+    # python < 3.8 has no shared memory, the arrays are pickled to the workers
+    monkeypatch.setattr(mlrun.serving.routers, "shared_memory", None)
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router", mlrun.serving.routers.ParallelRun(executor_type="process")
+    )
+    graph.add_route("c1", handler="array_stats")
+    server = fn.to_mock_server()
+
+    inputs = np.arange(100000, dtype=np.float64).reshape(1000, 100)
+    resp = server.test(body={"inputs": inputs})
+    assert resp["sum"] == inputs.sum()
+    assert resp["writeable"]
+    np.testing.assert_array_equal(resp["doubled"], inputs * 2)
+
+
+def test_release_shared_segments_when_done():
+    # the request segments are released only after the running stragglers are done with them
+    segment = shared_memory.SharedMemory(create=True, size=16)
+    futures = [concurrent.futures.Future(), concurrent.futures.Future()]
+    mlrun.serving.routers._release_shared_segments_when_done([segment], futures)
+
+    futures[0].set_result(None)
+    attached = shared_memory.SharedMemory(name=segment.name)
+    attached.close()
+
+    futures[1].set_exception(RuntimeError("route failed"))
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=segment.name)
+
+
+def _list_shared_memory_segments():
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
@@ -17,6 +17,7 @@ import os
 import pathlib
 import time
 
+import numpy as np
 import pandas as pd
 import pytest
 from nuclio_sdk import Context as NuclioContext
@@ -25,7 +26,7 @@ from sklearn.datasets import load_iris
 import mlrun
 from mlrun.runtimes import nuclio_init_hook
 from mlrun.runtimes.serving import serving_subkind
-from mlrun.serving import V2ModelServer
+from mlrun.serving import V2ModelServer, binary_protocol
 from mlrun.serving.server import (
     GraphContext,
     MockEvent,
@@ -417,6 +418,239 @@ def test_ensemble_infer_with_weights(ensemble_spec_parm, executor):
     run_model("", res)
 
 
+class SlowEnsembleModelTestingClass(EnsembleModelTestingClass):
+    def predict(self, request):
+        time.sleep(self.get_param("delay"))
+        return super().predict(request)
+
+
+@pytest.mark.parametrize("executor", mlrun.serving.routers.ParallelRunnerModes.all())
+def test_ensemble_quorum_and_deadline(executor):
+    def create_server(**ensemble_args):
+        fn = mlrun.new_function("tests", kind="serving")
+        fn.set_topology(
+            "router",
+            mlrun.serving.routers.VotingEnsemble(
+                vote_type="regression",
+                prediction_col_name="predictions",
+                format_response_with_col_name_flag=True,
+                executor_type=executor,
+                **ensemble_args,
+            ),
+        )
+        fn.add_model(
+            "fast1",
+            ".",
+            class_name="SlowEnsembleModelTestingClass",
+            multiplier=100,
+            delay=0,
+        )
+        fn.add_model(
+            "fast2",
+            ".",
+            class_name="SlowEnsembleModelTestingClass",
+            multiplier=300,
+            delay=0.1,
+        )
+        fn.add_model(
+            "slow",
+            ".",
+            class_name="SlowEnsembleModelTestingClass",
+            multiplier=1000,
+            delay=3,
+        )
+        return fn.to_mock_server(namespace=globals())
+
+    # the slow model misses the deadline, the vote is over the other models (with re-normalized weights),
+    # in array mode the routes run one after the other and the routes which did not start by the deadline are skipped
+    server = create_server(
+        deadline=0.05
+        if executor == mlrun.serving.routers.ParallelRunnerModes.array
+        else 1
+    )
+    start = time.monotonic()
+    resp = server.test("/v2/models/infer", testdata)
+    assert time.monotonic() - start < 2.5
+    assert resp["skipped_models"] == ["slow"]
+    assert resp["outputs"] == {"predictions": [1000.0]}
+
+    if executor == mlrun.serving.routers.ParallelRunnerModes.array:
+        # routes run one after the other, the first two routes are the quorum
+        server = create_server(quorum=2)
+        resp = server.test("/v2/models/infer", testdata)
+        assert resp["skipped_models"] == ["slow"]
+    else:
+        # the fastest model is the quorum
+        server = create_server(quorum=1)
+        resp = server.test("/v2/models/infer", testdata)
+        assert resp["skipped_models"] == ["fast2", "slow"]
+        assert resp["outputs"] == {"predictions": [500.0]}
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        mlrun.serving.routers.ParallelRunnerModes.thread,
+        mlrun.serving.routers.ParallelRunnerModes.process,
+    ],
+)
+def test_ensemble_deadline_repeated_requests(executor):
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.set_topology(
+        "router",
+        mlrun.serving.routers.VotingEnsemble(
+            vote_type="regression",
+            prediction_col_name="predictions",
+            format_response_with_col_name_flag=True,
+            executor_type=executor,
+            quorum=2,
+            deadline=1,
+        ),
+    )
+    fn.add_model(
+        "fast1",
+        ".",
+        class_name="SlowEnsembleModelTestingClass",
+        multiplier=100,
+        delay=0,
+    )
+    fn.add_model(
+        "fast2",
+        ".",
+        class_name="SlowEnsembleModelTestingClass",
+        multiplier=300,
+        delay=0.1,
+    )
+    fn.add_model(
+        "slow",
+        ".",
+        class_name="SlowEnsembleModelTestingClass",
+        multiplier=1000,
+        delay=3,
+    )
+    server = fn.to_mock_server(namespace=globals())
+
+    # the slow model keeps running after its requests missed the quorum, it is skipped (instead of queueing
+    # behind itself and taking over the workers of the fast models) until it is done
+    for _ in range(5):
+        resp = server.test("/v2/models/infer", testdata)
+        assert resp["skipped_models"] == ["slow"]
+        assert resp["outputs"] == {"predictions": [1000.0]}
+
+
+class TensorModelTestingClass(V2ModelServer):
+    def load(self):
+        pass
+
+    def predict(self, request):
+        inputs = request["inputs"]
+        assert isinstance(inputs, np.ndarray)
+        return (inputs * 2).astype(inputs.dtype)
+
+
+def _tensor_server():
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=TensorModelTestingClass())
+    return fn.to_mock_server()
+
+
+def test_v2_binary_tensor_protocol():
+    server = _tensor_server()
+    inputs = np.arange(2 * 512, dtype=np.float32).reshape(2, 512)
+    header = json.dumps(
+        {
+            "id": "tensor-req",
+            "inputs": [
+                {
+                    "name": "input0",
+                    "shape": list(inputs.shape),
+                    "datatype": "FP32",
+                    "parameters": {"binary_data_size": inputs.nbytes},
+                }
+            ],
+        }
+    ).encode()
+    resp = server.test(
+        "/v2/models/my/infer",
+        header + inputs.tobytes(),
+        headers={binary_protocol.v2_header_length_key: str(len(header))},
+        content_type=binary_protocol.octet_stream_content_type,
+        get_body=False,
+    )
+
+    assert resp.content_type == binary_protocol.octet_stream_content_type
+    header_length = int(resp.headers[binary_protocol.v2_header_length_key])
+    resp_header = json.loads(resp.body[:header_length])
+    assert resp_header["id"] == "tensor-req"
+    assert resp_header["outputs"][0]["shape"] == [2, 512]
+    assert resp_header["outputs"][0]["datatype"] == "FP32"
+    outputs = np.frombuffer(resp.body[header_length:], dtype=np.float32)
+    np.testing.assert_array_equal(outputs.reshape(2, 512), inputs * 2)
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    [binary_protocol.npy_content_type, binary_protocol.arrow_content_type],
+)
+def test_binary_tensor_content_types(content_type):
+    server = _tensor_server()
+    inputs = np.random.rand(3, 512)
+    if content_type == binary_protocol.npy_content_type:
+        body = binary_protocol._encode_npy(inputs)
+    else:
+        body = binary_protocol._encode_arrow(inputs)
+
+    resp = server.test(
+        "/v2/models/my/infer", body, content_type=content_type, get_body=False
+    )
+    assert resp.content_type == content_type
+    if content_type == binary_protocol.npy_content_type:
+        outputs = binary_protocol.decode_body(
+            resp.body, binary_protocol.BinaryFormats.npy
+        )["inputs"]
+    else:
+        outputs = binary_protocol.decode_body(
+            resp.body, binary_protocol.BinaryFormats.arrow
+        )["inputs"]
+    np.testing.assert_array_equal(outputs, inputs * 2)
+
+    # the response format is negotiated with the Accept header
+    resp = server.test(
+        "/v2/models/my/infer",
+        body,
+        content_type=content_type,
+        headers={"Accept": "application/json"},
+        get_body=False,
+    )
+    assert resp.content_type == "application/json"
+    np.testing.assert_allclose(json.loads(resp.body)["outputs"], inputs * 2)
+
+
+class RaggedModelTestingClass(V2ModelServer):
+    def load(self):
+        pass
+
+    def predict(self, request):
+        return [[1, 2], [3]]
+
+
+def test_binary_tensor_ragged_outputs():
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=RaggedModelTestingClass())
+    server = fn.to_mock_server()
+
+    # ragged outputs cannot be encoded as a tensor, the response falls back to json
+    body = binary_protocol._encode_npy(np.random.rand(2, 4))
+    resp = server.test(
+        "/v2/models/my/infer",
+        body,
+        content_type=binary_protocol.npy_content_type,
+        get_body=False,
+    )
+    assert resp.content_type == "application/json"
+    assert json.loads(resp.body)["outputs"] == [[1, 2], [3]]
+
+
 def test_v2_infer():
     def run_model(url, expected):
         event = MockEvent(testdata, path=f"/v2/models/{url}/infer")
@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import atexit
+import datetime
 import json
+import threading
+import time
 from pprint import pprint
 
 import numpy as np
@@ -98,3 +102,208 @@ def rec_to_data(rec):
     inputs = data["request"]["inputs"]
     outputs = data["resp"]["outputs"]
     return data["model"], data["class"], inputs, outputs
+
+
+def test_batched_background_tracking():
+    # test the records are pushed in micro batches by the background pusher (full batches and partial batches which
+    # are flushed after the flush interval)
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=2))
+    fn.set_tracking(
+        "v3io://fake",
+        batch=3,
+        background=True,
+        flush_interval=0.1,
+        stream_args={"mock": True, "access_key": "x"},
+    )
+
+    server = fn.to_mock_server()
+    for _ in range(4):
+        server.test("/v2/models/my/infer", testdata)
+    server.graph.routes["my"]._object._model_logger.wait_for_pushes()
+
+    fake_stream = server.context.stream.output_stream._mock_queue
+    assert len(fake_stream) == 2
+
+    batch = json.loads(fake_stream[0]["data"])
+    assert batch["model"] == "my"
+    columns = dict(zip(batch["headers"], batch["columns"]))
+    assert [request["inputs"] for request in columns["request"]] == [[[5, 6]]] * 3
+    assert [response["outputs"] for response in columns["resp"]] == [[10]] * 3
+    assert all(isinstance(latency, int) for latency in columns["microsec"])
+
+    assert rec_to_data(fake_stream[1]) == ("my", "ModelTestingClass", [[5, 6]], [10])
+
+
+def test_tracking_latency_precision():
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=2))
+    fn.set_tracking("v3io://fake", stream_args={"mock": True, "access_key": "x"})
+
+    server = fn.to_mock_server()
+    model_logger = server.graph.routes["my"]._object._model_logger
+    start = mlrun.utils.now_date() - datetime.timedelta(seconds=2, microseconds=5)
+    model_logger.push(start, {"id": "1", "inputs": [[5, 6]]}, {"outputs": [10]})
+
+    fake_stream = server.context.stream.output_stream._mock_queue
+    # the latency must not wrap at one second
+    assert json.loads(fake_stream[0]["data"])["microsec"] >= 2_000_005
+
+
+def test_background_tracking_drop_overflow():
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=2))
+    fn.set_tracking(
+        "v3io://fake",
+        background=True,
+        queue_size=1,
+        overflow="drop",
+        stream_args={"mock": True, "access_key": "x"},
+    )
+
+    server = fn.to_mock_server()
+    model_logger = server.graph.routes["my"]._object._model_logger
+    output_stream = server.context.stream.output_stream
+
+    # block the stream so records accumulate in the queue
+    stream_blocked = threading.Event()
+    stream_released = threading.Event()
+    original_push = output_stream.push
+
+    def blocking_push(data):
+        stream_blocked.set()
+        stream_released.wait()
+        original_push(data)
+
+    output_stream.push = blocking_push
+    server.test("/v2/models/my/infer", testdata)
+    assert stream_blocked.wait(timeout=5)
+
+    # the first record is being pushed, the second waits in the queue and the third is dropped
+    server.test("/v2/models/my/infer", testdata)
+    server.test("/v2/models/my/infer", testdata)
+    assert model_logger.dropped_records == 1
+
+    stream_released.set()
+    model_logger.wait_for_pushes()
+    assert len(output_stream._mock_queue) == 2
+
+
+def test_background_tracking_flush_on_exit(monkeypatch):
+    exit_handlers = []
+    monkeypatch.setattr(atexit, "register", exit_handlers.append)
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=2))
+    fn.set_tracking(
+        "v3io://fake",
+        batch=3,
+        background=True,
+        flush_interval=0.2,
+        exit_timeout=5,
+        stream_args={"mock": True, "access_key": "x"},
+    )
+
+    server = fn.to_mock_server()
+    model_logger = server.graph.routes["my"]._object._model_logger
+    output_stream = server.context.stream.output_stream
+
+    # block the stream, the records left in the queue are not pushed within the exit timeout
+    stream_released = threading.Event()
+    original_push = output_stream.push
+
+    def blocking_push(data):
+        stream_released.wait()
+        original_push(data)
+
+    output_stream.push = blocking_push
+    for _ in range(4):
+        server.test("/v2/models/my/infer", testdata)
+    assert not model_logger.wait_for_pushes(timeout=0.1)
+
+    # the queued records (a full and a partial micro batch) are pushed when the worker exits
+    assert exit_handlers == [model_logger._flush_on_exit]
+    stream_released.set()
+    exit_handlers[0]()
+    assert model_logger.wait_for_pushes(timeout=0)
+    assert len(output_stream._mock_queue) == 2
+
+
+class SlowModelTestingClass(ModelTestingClass):
+    def predict(self, request):
+        self.predicted_requests = getattr(self, "predicted_requests", 0) + 1
+        time.sleep(0.05)
+        return super().predict(request)
+
+
+def test_dynamic_batching():
+    # concurrent requests are predicted in batches, every request gets its own outputs and is tracked separately
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model(
+        "my",
+        ".",
+        class_name=SlowModelTestingClass(
+            multiplier=2, max_batch_size=8, max_batch_wait=0.5
+        ),
+    )
+    fn.set_tracking("v3io://fake", stream_args={"mock": True, "access_key": "x"})
+    server = fn.to_mock_server()
+
+    # a single request is not delayed by the batch wait
+    start = time.monotonic()
+    resp = server.test("/v2/models/my/infer", {"id": "single", "inputs": [[1, 2]]})
+    assert resp["id"] == "single" and resp["outputs"] == [2]
+    assert time.monotonic() - start < 0.5
+
+    responses = {}
+
+    def infer(index):
+        body = {"id": f"req-{index}", "inputs": [[index, 0], [index + 100, 0]]}
+        responses[index] = server.test("/v2/models/my/infer", body)
+
+    threads = [threading.Thread(target=infer, args=(index,)) for index in range(24)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for index, resp in responses.items():
+        assert resp["id"] == f"req-{index}"
+        assert list(resp["outputs"]) == [index * 2, (index + 100) * 2]
+    model = server.graph.routes["my"]._object
+    assert model.predicted_requests < 25
+    assert model._batcher.batched_requests == 25
+
+    fake_stream = server.context.stream.output_stream._mock_queue
+    assert len(fake_stream) == 25
+    tracked_ids = {json.loads(rec["data"])["request"]["id"] for rec in fake_stream}
+    assert tracked_ids == {"single"} | {f"req-{index}" for index in range(24)}
+
+
+class ValidatingModelTestingClass(ModelTestingClass):
+    def predict(self, request):
+        if any(value[0] < 0 for value in request["inputs"]):
+            raise ValueError("negative input")
+        return super().predict(request)
+
+
+def test_dynamic_batching_failed_batch():
+    # when a batch fails the requests are predicted separately, only the bad request gets the error
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model(
+        "my",
+        ".",
+        class_name=ValidatingModelTestingClass(multiplier=2, max_batch_size=8),
+    )
+    server = fn.to_mock_server()
+    batcher = server.graph.routes["my"]._object._batcher
+
+    items = [
+        mlrun.serving.v2_serving._BatchItem({"id": str(value), "inputs": [[value]]})
+        for value in [1, -1, 3]
+    ]
+    batcher._predict_batch(items)
+
+    assert all(item.done.is_set() for item in items)
+    assert list(items[0].outputs) == [2] and items[0].error is None
+    assert items[1].outputs is None and str(items[1].error) == "negative input"
+    assert list(items[2].outputs) == [6] and items[2].error is None